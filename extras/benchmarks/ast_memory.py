@@ -0,0 +1,115 @@
+#
+# ast_memory.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measures the memory required to hold the ASTs of the models bundled with PyNestML (``models``) in memory, as in a
+batch run. All models are parsed one after the other and kept; for each model, the number of AST nodes, the memory
+taken by the nodes themselves ("shallow", i.e., the node objects, their attribute dicts if any and their comment
+containers, each container counted once) and the memory retained by the model as a whole ("retained", i.e., including
+the attribute values, the symbol table and the messages, as traced by tracemalloc) are reported.
+
+    python extras/benchmarks/ast_memory.py [--filter NAME]
+"""
+
+import argparse
+import gc
+import glob
+import os
+import sys
+import tracemalloc
+
+REPOSITORY_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+
+
+def get_shallow_size(nodes):
+    """
+    Returns the memory taken by the handed over nodes themselves.
+    :param nodes: a list of AST nodes.
+    :type nodes: list(ASTNode)
+    :return: the size in bytes.
+    :rtype: int
+    """
+    size = 0
+    containers = set()
+    for node in nodes:
+        size += sys.getsizeof(node)
+        if hasattr(node, '__dict__'):
+            size += sys.getsizeof(node.__dict__)
+        for container in (node.comment, node.pre_comments, node.post_comments):
+            if container is not None and id(container) not in containers:
+                containers.add(id(container))
+                size += sys.getsizeof(container)
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the memory required to hold the ASTs of models.')
+    parser.add_argument('--filter', type=str, help='Only parse models whose path contains the given string.')
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPOSITORY_PATH)
+    from pynestml.frontend.frontend_configuration import FrontendConfiguration
+    from pynestml.frontend.pynestml_frontend import init_predefined
+    from pynestml.utils.logger import Logger, LoggingLevel
+    from pynestml.utils.model_parser import ModelParser
+    from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+    FrontendConfiguration.parse_config(['--input_path', os.path.join(REPOSITORY_PATH, 'models'), '--logging_level',
+                                        'NO', '--no_cache'])
+    init_predefined()
+    Logger.init_logger(LoggingLevel.NO)
+    model_paths = sorted(glob.glob(os.path.join(REPOSITORY_PATH, 'models', '*.nestml')))
+    model_paths = [path for path in model_paths if args.filter is None or args.filter in path]
+    # parse each model once before measuring, such that the units and types derived by the models, the caches of the
+    # parser and the imported modules are not attributed to the first model using them
+    for model_path in model_paths:
+        ModelParser.parse_model(model_path)
+    Logger.init_logger(LoggingLevel.NO)
+    ModelParser.parsed_strings.clear()
+
+    print('%-32s %8s %14s %12s %14s' % ('Model', 'Nodes', 'Shallow [KiB]', 'Bytes/node', 'Retained [KiB]'))
+    units = list()
+    total_nodes, total_shallow, total_retained = 0, 0, 0
+    tracemalloc.start()
+    for model_path in model_paths:
+        gc.collect()
+        before = tracemalloc.get_traced_memory()[0]
+        units.append(ModelParser.parse_model(model_path))
+        ModelParser.parsed_strings.clear()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+        nodes = list()
+        for neuron in units[-1].get_neuron_list():
+            neuron.accept(ASTHigherOrderVisitor(visit_funcs=nodes.append))
+        shallow = get_shallow_size(nodes)
+        total_nodes += len(nodes)
+        total_shallow += shallow
+        total_retained += retained
+        print('%-32s %8d %14.1f %12.1f %14.1f' % (os.path.basename(model_path), len(nodes), shallow / 1024.,
+                                                  shallow / len(nodes), retained / 1024.))
+        sys.stdout.flush()
+    tracemalloc.stop()
+    print('%-32s %8d %14.1f %12.1f %14.1f' % ('(all %d models)' % len(units), total_nodes, total_shallow / 1024.,
+                                              total_shallow / max(total_nodes, 1), total_retained / 1024.))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#
+# comment_scaling.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measures how the time needed to tokenize, parse and build the AST of a model scales with the length of the model. The
+models are generated synthetically: a neuron with commented declarations in its state and parameters blocks and
+commented statements in its update block. Building the AST includes attaching the comments to the nodes; its time per
+line should stay constant for growing models.
+
+    python extras/benchmarks/comment_scaling.py [--lines 1000 5000 10000 20000 50000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+REPOSITORY_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+
+
+def generate_model(n_lines):
+    """
+    Generates a syntactically correct model with approximately the handed over number of lines.
+    :param n_lines: the number of lines.
+    :type n_lines: int
+    :return: the model.
+    :rtype: str
+    """
+    # each variable takes 7 lines: a commented state variable, a commented parameter and a commented update statement.
+    # Newlines are not visible to the parser, thus whether a number is followed by a unit, e.g., "0 mV", can require
+    # a lookahead up to the end of the block, which makes parsing huge blocks quadratic; enclosing such values in
+    # parentheses limits the lookahead, such that the time of parsing does not dominate the time of building the AST.
+    n_variables = max(n_lines // 7, 1)
+    lines = ['neuron synthetic:', '  state:']
+    for i in range(n_variables):
+        lines.append('    # pre comment of V_%d' % i)
+        lines.append('    V_%d mV = (0 mV) # in comment of V_%d' % (i, i))
+    lines.extend(['  end', '', '  parameters:'])
+    for i in range(n_variables):
+        lines.append('    tau_%d ms = (%d ms) # in comment of tau_%d' % (i, i + 1, i))
+        lines.append('    # post comment of tau_%d' % i)
+        lines.append('')
+    lines.extend(['  end', '', '  update:'])
+    for i in range(n_variables):
+        lines.append('    V_%d = V_%d * exp(-resolution() / tau_%d) # in comment' % (i, i, i))
+        lines.append('')
+    lines.extend(['  end', '', '  input:', '    spikes mV <- spike', '  end', '', '  output: spike', 'end', ''])
+    return '\n'.join(lines)
+
+
+def measure(model_path):
+    """
+    Tokenizes and parses the handed over model, and builds its AST.
+    :param model_path: the path to the model.
+    :type model_path: str
+    :return: the times spent on tokenizing, parsing and building the AST, in seconds.
+    :rtype: (float,float,float)
+    """
+    from antlr4 import CommonTokenStream, FileStream
+    from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+    from pynestml.generated.PyNestMLParser import PyNestMLParser
+    from pynestml.utils.model_parser import parse_with_fallback
+    from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
+
+    start = time.perf_counter()
+    stream = CommonTokenStream(PyNestMLLexer(FileStream(model_path)))
+    stream.fill()
+    lexer_time = time.perf_counter() - start
+    start = time.perf_counter()
+    parser = PyNestMLParser(stream)
+    compilation_unit = parse_with_fallback(parser, parser.nestMLCompilationUnit)
+    parser_time = time.perf_counter() - start
+    start = time.perf_counter()
+    ASTBuilderVisitor(stream.tokens).visit(compilation_unit)
+    builder_time = time.perf_counter() - start
+    return lexer_time, parser_time, builder_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures how building the AST scales with the length of a model.')
+    parser.add_argument('--lines', type=int, nargs='+', default=[1000, 5000, 10000, 20000, 50000],
+                        help='The lengths of the generated models in lines. Default are 1000 5000 10000 20000 50000.')
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPOSITORY_PATH)
+    from pynestml.symbols.predefined_types import PredefinedTypes
+    from pynestml.symbols.predefined_units import PredefinedUnits
+    from pynestml.utils.logger import Logger, LoggingLevel
+    # the data types of declarations are resolved while the AST is built
+    PredefinedUnits.register_units()
+    PredefinedTypes.register_types()
+    Logger.init_logger(LoggingLevel.NO)
+
+    print('%8s %10s %10s %10s %18s' % ('Lines', 'Lexer [s]', 'Parser [s]', 'AST [s]', 'AST per 1k lines'))
+    for n_lines in args.lines:
+        model = generate_model(n_lines)
+        actual_lines = model.count('\n')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = os.path.join(tmp_dir, 'synthetic.nestml')
+            with open(model_path, 'w') as f:
+                f.write(model)
+            lexer_time, parser_time, builder_time = measure(model_path)
+        print('%8d %10.3f %10.3f %10.3f %18.4f' % (actual_lines, lexer_time, parser_time, builder_time,
+                                                   builder_time / actual_lines * 1000.))
+        sys.stdout.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,321 @@
+#
+# frontend_throughput.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measures the throughput of the PyNestML frontend on the models bundled with PyNestML (``models``) and on the models
+used by the tests (``tests/resources``). For each target (NEST and autodoc), each model is processed separately, and
+each set of models as a whole. For each run, the time spent on parsing (lexer, parser and AST builder), checking
+(symbol table and context conditions) and generating code (analysis, transformation and rendering) as well as the
+overall time and the peak resident set size are reported; for each set of models, the number of models processed per
+second is reported as well. Models which are known to fail, e.g., the intentionally invalid models used by the tests,
+are listed in EXPECTED_FAILURES; they are benchmarked separately, but not as part of their set, such that the runs of
+the sets are free of errors. Any other run which fails is reported as a regression.
+
+Each run takes place in a fresh interpreter with the cache disabled, such that runs do not influence each other. The
+overall time does not include starting the interpreter, but does include importing the modules required to process
+models. NEST is not required.
+
+The results are compared against a stored baseline, and regressions, i.e., runs which became slower or use more memory
+than tolerated, are reported by a non-zero exit code. As the results depend on the machine, no baseline is part of the
+repository, and comparing against a baseline measured on a different machine fails unless --ignore_machine is given.
+Before a change, or after an intended change of the performance, the baseline is stored by means of --save_baseline:
+
+    python extras/benchmarks/frontend_throughput.py --save_baseline
+
+Run ``python extras/benchmarks/frontend_throughput.py --help`` for all available options.
+"""
+
+import argparse
+import fnmatch
+import glob
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+REPOSITORY_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frontend_throughput_baseline.json')
+MODEL_SETS = [('models', os.path.join(REPOSITORY_PATH, 'models')),
+              ('tests/resources', os.path.join(REPOSITORY_PATH, 'tests', 'resources'))]
+TARGETS = ['NEST', 'autodoc']
+# the runs which are known to fail, as patterns of keys of the form "<target>:<set>:<model>"
+EXPECTED_FAILURES = [
+    # the units of the ODE of the membrane potential are inconsistent
+    '*:models:hill_tononi.nestml',
+    # models used by the tests of the frontend only, which are incomplete or intentionally invalid
+    '*:tests/resources:BlockTest.nestml',
+    '*:tests/resources:ExpressionCollection.nestml',
+    '*:tests/resources:ExpressionTypeTest.nestml',
+    '*:tests/resources:FunctionParameterTemplatingTest.nestml',
+    '*:tests/resources:NestMLPrinterTest.nestml',
+    '*:tests/resources:ResolutionTest.nestml',
+    # models without an initial values block, for which the documentation cannot be rendered
+    'autodoc:tests/resources:CompoundAssignmentWithDifferentButCompatibleUnits.nestml',
+    'autodoc:tests/resources:DeclarationWithDifferentButCompatibleUnit*.nestml',
+    'autodoc:tests/resources:DeclarationWithSameVariableNameAsUnit.nestml',
+    'autodoc:tests/resources:DirectAssignmentWithDifferentButCompatible*Units.nestml',
+    'autodoc:tests/resources:FunctionBodyReturnStatementWithDifferentButCompatibleUnits.nestml',
+    'autodoc:tests/resources:FunctionCallWithDifferentButCompatibleUnits.nestml',
+    'autodoc:tests/resources:MagnitudeCompatibilityTest.nestml',
+    'autodoc:tests/resources:RhsFunctionCallWithDifferentButCompatibleUnits.nestml',
+]
+# the phases recorded by the profiler which make up each step; nested phases, e.g., the context conditions, are
+# contained in the enclosing phase
+STEPS = [('parse', ['lexer', 'parser', 'ast_builder']),
+         ('check', ['symbol_table']),
+         ('generate', ['analyse_neuron', 'render_neuron', 'render_module'])]
+
+
+def run_worker(target, input_path, target_path, result_path):
+    """
+    Processes the handed over model(s) and stores the measured times and the peak resident set size. This function is
+    executed in a fresh interpreter by run().
+    :param target: the target to generate code for.
+    :type target: str
+    :param input_path: the path to a model or to a directory of models.
+    :type input_path: str
+    :param target_path: the directory to which code is generated.
+    :type target_path: str
+    :param result_path: the file to which the results are written in JSON notation.
+    :type result_path: str
+    """
+    sys.path.insert(0, REPOSITORY_PATH)
+    start = time.perf_counter()
+    from pynestml.frontend.frontend_configuration import FrontendConfiguration
+    from pynestml.frontend.pynestml_frontend import process
+    from pynestml.utils.profiler import Profiler
+
+    # tracing the memory would distort the times, the peak memory is taken from the operating system instead
+    Profiler.enable(trace_memory=False)
+    FrontendConfiguration.parse_config(['--input_path', input_path, '--target_path', target_path, '--target', target,
+                                        '--module_name', 'benchmarkmodule', '--logging_level', 'NO', '--no_cache'])
+    result = dict()
+    try:
+        result['errors'] = bool(process())
+    except Exception as e:
+        # some of the models used by the tests are not meant to be processed by every target
+        result['errors'] = True
+        result['exception'] = repr(e)
+    result['time'] = time.perf_counter() - start
+    phases = Profiler.get_report()['phases']
+    for (step, step_phases) in STEPS:
+        result[step] = sum(phase['time'] for phase in phases if phase['phase'] in step_phases)
+    # the maximum resident set size is given in kilobytes on linux, but in bytes on macOS
+    result['peak_rss'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+    with open(result_path, 'w') as f:
+        json.dump(result, f)
+
+
+def run(target, input_path, repeat):
+    """
+    Processes the handed over model(s) in a fresh interpreter.
+    :param target: the target to generate code for.
+    :type target: str
+    :param input_path: the path to a model or to a directory of models.
+    :type input_path: str
+    :param repeat: the number of runs; the fastest one is reported.
+    :type repeat: int
+    :return: a dict with the keys 'time', 'parse', 'check', 'generate' (in seconds), 'peak_rss' (in bytes), 'errors'
+             and, if processing failed, 'exception'.
+    :rtype: dict
+    """
+    results = list()
+    for i in range(max(repeat, 1)):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            result_path = os.path.join(tmp_dir, 'result.json')
+            subprocess.check_call([sys.executable, os.path.abspath(__file__), '--worker', target, input_path,
+                                   os.path.join(tmp_dir, 'target'), result_path],
+                                  cwd=tmp_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            with open(result_path) as f:
+                results.append(json.load(f))
+    return min(results, key=lambda result: result['time'])
+
+
+def run_all(targets, model_sets, name_filter, repeat):
+    """
+    Runs all benchmarks and prints the results.
+    :param targets: the targets to generate code for.
+    :type targets: list(str)
+    :param model_sets: the sets of models to process, as (name, path) tuples.
+    :type model_sets: list((str,str))
+    :param name_filter: if not None, only models whose path contains this string are processed.
+    :type name_filter: str
+    :param repeat: the number of runs per model; the fastest one is reported.
+    :type repeat: int
+    :return: a dict from keys of the form "<target>:<set>:<model>" to the results as returned by run(), extended by
+             'expected_failure'. The results of a set as a whole, without the models which are expected to fail, are
+             stored under the model "*".
+    :rtype: dict
+    """
+    results = dict()
+    print('%-8s %-16s %-56s %8s %8s %8s %8s %10s %10s' % ('Target', 'Set', 'Model', 'Parse', 'Check', 'Generate',
+                                                        'Total', 'Models/s', 'RSS [MiB]'))
+    for target in targets:
+        for (set_name, set_path) in model_sets:
+            model_paths = sorted(glob.glob(os.path.join(set_path, '*.nestml')))
+            model_paths = [path for path in model_paths if name_filter is None or name_filter in path]
+            if len(model_paths) == 0:
+                continue
+            runs = [(os.path.basename(path), [path]) for path in model_paths]
+            runs.append(('*', [path for path in model_paths
+                               if not is_expected_failure(target, set_name, os.path.basename(path))]))
+            for (model_name, paths) in runs:
+                if len(paths) == 0:
+                    continue
+                with tempfile.TemporaryDirectory() as input_path:
+                    for path in paths:
+                        shutil.copy(path, input_path)
+                    result = run(target, input_path if len(paths) > 1 else paths[0], repeat)
+                n_models = len(paths)
+                result['models_per_second'] = n_models / result['time']
+                result['expected_failure'] = is_expected_failure(target, set_name, model_name)
+                results[':'.join([target, set_name, model_name])] = result
+                print('%-8s %-16s %-56s %8.3f %8.3f %8.3f %8.3f %10.2f %10.1f' % (
+                    target, set_name, model_name if model_name != '*' else '(all %d models)' % n_models,
+                    result['parse'], result['check'], result['generate'], result['time'],
+                    result['models_per_second'], result['peak_rss'] / 2. ** 20))
+                if result['errors']:
+                    print('         (failed%s%s)' % (' as expected' if result['expected_failure'] else '',
+                                                    ': ' + result['exception'] if 'exception' in result else ''))
+                sys.stdout.flush()
+    return results
+
+
+def is_expected_failure(target, set_name, model_name):
+    """
+    Returns whether the handed over run is known to fail, cf. EXPECTED_FAILURES.
+    :param target: the target code is generated for.
+    :type target: str
+    :param set_name: the name of the set of models.
+    :type set_name: str
+    :param model_name: the name of the model file, or "*" for the set as a whole.
+    :type model_name: str
+    :rtype: bool
+    """
+    key = ':'.join([target, set_name, model_name])
+    return any(fnmatch.fnmatchcase(key, pattern) for pattern in EXPECTED_FAILURES)
+
+
+def compare(results, baseline, tolerance, min_difference):
+    """
+    Compares the results against the baseline. Runs which fail unexpectedly are reported as regressions as well.
+    :param results: the results as returned by run_all().
+    :type results: dict
+    :param baseline: a baseline as stored by --save_baseline.
+    :type baseline: dict
+    :param tolerance: the tolerated relative increase of the time and the peak resident set size.
+    :type tolerance: float
+    :param min_difference: the minimal increase of the time in seconds which is reported, such that noise in the
+                           measurement of very short runs is not reported.
+    :type min_difference: float
+    :return: a list of regressions.
+    :rtype: list(str)
+    """
+    regressions = list()
+    for (key, result) in sorted(results.items()):
+        if result['errors'] and not result['expected_failure']:
+            regressions.append('%s: failed%s' % (key, ': ' + result['exception'] if 'exception' in result else ''))
+        expected = baseline['results'].get(key)
+        if expected is None:
+            continue
+        if result['time'] > expected['time'] * (1. + tolerance) and result['time'] - expected['time'] > min_difference:
+            regressions.append('%s: time increased from %.3f s to %.3f s' % (key, expected['time'], result['time']))
+        if result['peak_rss'] > expected['peak_rss'] * (1. + tolerance):
+            regressions.append('%s: peak RSS increased from %.1f MiB to %.1f MiB'
+                               % (key, expected['peak_rss'] / 2. ** 20, result['peak_rss'] / 2. ** 20))
+    return regressions
+
+
+def get_machine():
+    return {'platform': platform.platform(), 'machine': platform.machine(), 'processor': platform.processor(),
+            'python': platform.python_version()}
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        run_worker(*sys.argv[2:6])
+        return 0
+
+    parser = argparse.ArgumentParser(description='Measures the throughput of the PyNestML frontend.')
+    parser.add_argument('--target', choices=TARGETS, action='append',
+                        help='The target to generate code for; can be given several times. Default are all targets.')
+    parser.add_argument('--set', choices=[name for (name, path) in MODEL_SETS], action='append',
+                        help='The set of models to process; can be given several times. Default are all sets.')
+    parser.add_argument('--filter', type=str, help='Only process models whose path contains the given string.')
+    parser.add_argument('--repeat', type=int, default=1, help='The number of runs per model; the fastest is kept.')
+    parser.add_argument('--output', type=str, help='Store the results in JSON notation in the given file.')
+    parser.add_argument('--baseline', type=str, default=DEFAULT_BASELINE,
+                        help='The baseline to compare against. Default is ' + os.path.relpath(DEFAULT_BASELINE))
+    parser.add_argument('--save_baseline', action='store_true',
+                        help='Store the results as new baseline instead of comparing against it.')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='The tolerated relative increase of time and peak RSS. Default is 0.25.')
+    parser.add_argument('--min_difference', type=float, default=0.1,
+                        help='The minimal increase of time in seconds which is reported. Default is 0.1.')
+    parser.add_argument('--ignore_machine', action='store_true',
+                        help='Compare against the baseline even if it has been measured on a different machine.')
+    args = parser.parse_args()
+
+    model_sets = [(name, path) for (name, path) in MODEL_SETS if args.set is None or name in args.set]
+    results = run_all(args.target or TARGETS, model_sets, args.filter, args.repeat)
+    report = {'machine': get_machine(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.save_baseline:
+        baseline = {'machine': get_machine(), 'results': dict()}
+        if os.path.isfile(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        # only the measured runs are replaced, such that a subset of the benchmarks can be updated
+        baseline['machine'] = get_machine()
+        baseline['results'].update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print('Baseline stored in ' + args.baseline)
+        return 0
+
+    if not os.path.isfile(args.baseline):
+        print('No baseline found at ' + args.baseline + '; use --save_baseline to store one.')
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('machine') != get_machine():
+        print('The baseline has been measured on a different machine (' + json.dumps(baseline.get('machine'))
+              + '), thus the comparison is not meaningful; use --save_baseline to store a baseline for this machine'
+              + (', or --ignore_machine to compare anyway.' if not args.ignore_machine else '.'))
+        if not args.ignore_machine:
+            return 1
+    regressions = compare(results, baseline, args.tolerance, args.min_difference)
+    for regression in regressions:
+        print('Regression: ' + regression)
+    if len(regressions) == 0:
+        print('No regressions with respect to the baseline.')
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
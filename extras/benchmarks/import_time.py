@@ -0,0 +1,109 @@
+#
+# import_time.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measures the time spent importing modules when running PyNestML, based on the output of ``python -X importtime``.
+Three scenarios are measured: printing the help message, checking a model without generating code, and generating
+NEST code for a model. For each scenario, the overall wall time, the overall import time, and the top-level packages
+with the highest import time (i.e., the time spent importing all of their modules) are reported.
+
+Run ``python extras/benchmarks/import_time.py --help`` for the available options.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+REPOSITORY_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+DEFAULT_MODEL = os.path.join(REPOSITORY_PATH, 'models', 'iaf_psc_exp.nestml')
+HEAVY_PACKAGES = ['antlr4', 'astropy', 'jinja2', 'numpy', 'odetoolbox', 'sympy']
+IMPORT_TIME_PATTERN = re.compile(r'^import time:\s*(\d+)\s*\|\s*\d+\s*\|\s*(\S+)\s*$')
+
+
+def get_scenarios(model, target_path):
+    """
+    Returns the command line arguments of PyNestML for each scenario.
+    :param model: the model to process.
+    :type model: str
+    :param target_path: the directory to which code is generated.
+    :type target_path: str
+    :return: a list of (name, arguments) tuples.
+    :rtype: list((str,list(str)))
+    """
+    common = ['--input_path', model, '--target_path', target_path, '--no_cache']
+    return [('help', ['--help']),
+            ('check', common + ['--target', 'none']),
+            ('nest', common + ['--target', 'NEST'])]
+
+
+def run_scenario(args, cwd):
+    """
+    Runs PyNestML in a fresh interpreter with import time measurement enabled.
+    :param args: the command line arguments of PyNestML.
+    :type args: list(str)
+    :param cwd: the working directory of the interpreter.
+    :type cwd: str
+    :return: the wall time in seconds and a dict from top-level packages to their import time in seconds.
+    :rtype: (float, dict(str,float))
+    """
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([REPOSITORY_PATH] + [p for p in [env.get('PYTHONPATH')] if p])
+    command = [sys.executable, '-X', 'importtime', '-c',
+               'from pynestml.frontend.pynestml_frontend import main; main()'] + args
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                            universal_newlines=True)
+    wall_time = time.perf_counter() - start
+    packages = dict()
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match is None:
+            continue
+        # the self time of each module is attributed to its top-level package, such that, e.g., the time spent in
+        # astropy is not attributed to the pynestml module which happens to import it first
+        package = match.group(2).split('.')[0]
+        packages[package] = packages.get(package, 0.) + int(match.group(1)) / 1e6
+    return wall_time, packages
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the import time of PyNestML for several scenarios.')
+    parser.add_argument('--model', type=str, default=DEFAULT_MODEL, help='The model to check and generate code for.')
+    parser.add_argument('--repeat', type=int, default=3, help='The number of runs per scenario; the fastest is kept.')
+    parser.add_argument('--top', type=int, default=10, help='The number of packages to list per scenario.')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for (name, scenario_args) in get_scenarios(os.path.abspath(args.model), os.path.join(tmp_dir, 'target')):
+            runs = [run_scenario(scenario_args, tmp_dir) for _ in range(max(args.repeat, 1))]
+            wall_time, packages = min(runs, key=lambda run: run[0])
+            print('%s: wall time %.3f s, import time %.3f s' % (name, wall_time, sum(packages.values())))
+            loaded = [package for package in HEAVY_PACKAGES if package in packages]
+            print('  heavy packages loaded: %s' % (', '.join(loaded) if loaded else '(none)'))
+            for package, import_time in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+                print('  %8.3f s  %s' % (import_time, package))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+#
+# parsing.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Compares the time needed to parse the models bundled with PyNestML (``models``) by a single parse in the full LL
+prediction mode with the time needed by the two-stage parse of ModelParser, which parses in the SLL prediction mode
+first and falls back to the full LL prediction mode only if this fails.
+
+The ANTLR runtime caches the results of the prediction across parsers, thus the first parse of each model in a fresh
+interpreter ("cold") is usually much slower than subsequent parses of the same model ("warm"); both are reported. Each
+mode is measured in a fresh interpreter. Only parsing is measured; the input is tokenized beforehand.
+
+    python extras/benchmarks/parsing.py [--repeat N] [--filter NAME]
+"""
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+REPOSITORY_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+MODES = ['ll', 'two_stage']
+
+
+def run_worker(mode, repeat, model_paths):
+    """
+    Parses the handed over models in the handed over mode and prints the times in JSON notation. This function is
+    executed in a fresh interpreter by run().
+    :param mode: 'll' for a single parse in the full LL prediction mode, 'two_stage' for the parse of ModelParser.
+    :type mode: str
+    :param repeat: the number of warm parses per model; the fastest one is reported.
+    :type repeat: int
+    :param model_paths: the paths to the models.
+    :type model_paths: list(str)
+    """
+    sys.path.insert(0, REPOSITORY_PATH)
+    from antlr4 import CommonTokenStream, FileStream, PredictionMode
+    from pynestml.generated.PyNestMLLexer import PyNestMLLexer
+    from pynestml.generated.PyNestMLParser import PyNestMLParser
+    from pynestml.utils.model_parser import parse_with_fallback
+
+    def parse(stream):
+        stream.seek(0)
+        parser = PyNestMLParser(stream)
+        parser.removeErrorListeners()
+        start = time.perf_counter()
+        if mode == 'll':
+            parser.nestMLCompilationUnit()
+        else:
+            parse_with_fallback(parser, parser.nestMLCompilationUnit)
+        # the fallback leaves the parser in the full LL prediction mode
+        return time.perf_counter() - start, parser._interp.predictionMode == PredictionMode.LL and mode != 'll'
+
+    streams = dict()
+    for model_path in model_paths:
+        lexer = PyNestMLLexer(FileStream(model_path))
+        lexer.removeErrorListeners()
+        streams[model_path] = CommonTokenStream(lexer)
+        streams[model_path].fill()
+    results = dict()
+    for model_path in model_paths:
+        cold, fallback = parse(streams[model_path])
+        results[os.path.basename(model_path)] = {'cold': cold, 'fallback': fallback}
+    for model_path in model_paths:
+        result = results[os.path.basename(model_path)]
+        result['warm'] = min(parse(streams[model_path])[0] for i in range(max(repeat, 1)))
+    print(json.dumps(results))
+
+
+def run(mode, repeat, model_paths):
+    """
+    Parses the handed over models in the handed over mode in a fresh interpreter.
+    :return: a dict from model names to dicts with the keys 'cold', 'warm' (in seconds) and 'fallback'.
+    :rtype: dict
+    """
+    output = subprocess.check_output([sys.executable, os.path.abspath(__file__), '--worker', mode, str(repeat)]
+                                     + model_paths, universal_newlines=True)
+    return json.loads(output)
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '--worker':
+        run_worker(sys.argv[2], int(sys.argv[3]), sys.argv[4:])
+        return 0
+
+    parser = argparse.ArgumentParser(description='Compares full LL parsing with two-stage SLL/LL parsing.')
+    parser.add_argument('--filter', type=str, help='Only parse models whose path contains the given string.')
+    parser.add_argument('--repeat', type=int, default=3, help='The number of warm parses per model; the fastest is '
+                                                              'kept. Default is 3.')
+    args = parser.parse_args()
+
+    model_paths = sorted(glob.glob(os.path.join(REPOSITORY_PATH, 'models', '*.nestml')))
+    model_paths = [path for path in model_paths if args.filter is None or args.filter in path]
+    results = {mode: run(mode, args.repeat, model_paths) for mode in MODES}
+
+    print('%-40s %10s %10s %8s %10s %10s %8s %9s' % ('Model', 'LL cold', 'SLL cold', 'Speedup', 'LL warm',
+                                                     'SLL warm', 'Speedup', 'Fallback'))
+    totals = {(mode, kind): 0. for mode in MODES for kind in ['cold', 'warm']}
+    for model_name in sorted(results['ll'].keys()):
+        ll, two_stage = results['ll'][model_name], results['two_stage'][model_name]
+        for mode in MODES:
+            for kind in ['cold', 'warm']:
+                totals[(mode, kind)] += results[mode][model_name][kind]
+        print('%-40s %10.4f %10.4f %7.2fx %10.4f %10.4f %7.2fx %9s' % (
+            model_name, ll['cold'], two_stage['cold'], ll['cold'] / two_stage['cold'], ll['warm'], two_stage['warm'],
+            ll['warm'] / two_stage['warm'], 'yes' if two_stage['fallback'] else 'no'))
+    print('%-40s %10.4f %10.4f %7.2fx %10.4f %10.4f %7.2fx' % (
+        '(all %d models)' % len(results['ll']), totals[('ll', 'cold')], totals[('two_stage', 'cold')],
+        totals[('ll', 'cold')] / totals[('two_stage', 'cold')], totals[('ll', 'warm')],
+        totals[('two_stage', 'warm')], totals[('ll', 'warm')] / totals[('two_stage', 'warm')]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#
+# visitor_dispatch.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Measures the time needed to traverse the ASTs of the models bundled with PyNestML (``models``) by visitors which do
+nothing but dispatch, i.e., the overhead which the dispatch of ASTVisitor adds to each traversal. The models are
+parsed once; then each model is traversed by an ASTVisitor and by an ASTHigherOrderVisitor, both with the dispatch
+table of ASTVisitor ("table") and with a chain of isinstance checks in the order of the meta_model classes ("chain"),
+as ASTVisitor dispatched before.
+
+    python extras/benchmarks/visitor_dispatch.py [--repeat N] [--filter NAME]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+REPOSITORY_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+
+
+def with_chain_dispatch(visitor_class):
+    """
+    Returns a subclass of the handed over visitor class which dispatches by a chain of isinstance checks.
+    :param visitor_class: a subclass of ASTVisitor.
+    :type visitor_class: type
+    :return: a subclass of the visitor class.
+    :rtype: type
+    """
+    from pynestml.visitors.ast_visitor import NODE_METHOD_SUFFIXES
+    chain = list(NODE_METHOD_SUFFIXES.items())
+
+    def dispatch(prefix):
+        def dispatch_node(self, node):
+            for (node_class, suffix) in chain:
+                if isinstance(node, node_class):
+                    getattr(self, prefix + suffix)(node)
+                    return
+        return dispatch_node
+
+    attributes = {'traverse': dispatch('traverse_')}
+    # the higher order visitor overrides visit and endvisit
+    if 'visit' not in visitor_class.__dict__:
+        attributes['visit'] = dispatch('visit_')
+    if 'endvisit' not in visitor_class.__dict__:
+        attributes['endvisit'] = dispatch('endvisit_')
+    return type('Chain' + visitor_class.__name__, (visitor_class,), attributes)
+
+
+def time_traversals(neurons, create_visitor, repeat):
+    """
+    Returns the time needed by the fastest of the handed over number of traversals of the neurons.
+    :return: the time in seconds.
+    :rtype: float
+    """
+    times = list()
+    for i in range(max(repeat, 1)):
+        start = time.perf_counter()
+        for neuron in neurons:
+            neuron.accept(create_visitor())
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measures the dispatch overhead of AST traversals.')
+    parser.add_argument('--filter', type=str, help='Only traverse models whose path contains the given string.')
+    parser.add_argument('--repeat', type=int, default=5, help='The number of traversals per model and visitor; the '
+                                                              'fastest is kept. Default is 5.')
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPOSITORY_PATH)
+    from pynestml.frontend.frontend_configuration import FrontendConfiguration
+    from pynestml.frontend.pynestml_frontend import init_predefined
+    from pynestml.utils.logger import Logger, LoggingLevel
+    from pynestml.utils.model_parser import ModelParser
+    from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+    from pynestml.visitors.ast_visitor import ASTVisitor
+
+    FrontendConfiguration.parse_config(['--input_path', os.path.join(REPOSITORY_PATH, 'models'), '--logging_level',
+                                        'NO', '--no_cache'])
+    init_predefined()
+    Logger.init_logger(LoggingLevel.NO)
+    model_paths = sorted(glob.glob(os.path.join(REPOSITORY_PATH, 'models', '*.nestml')))
+    model_paths = [path for path in model_paths if args.filter is None or args.filter in path]
+
+    chain_visitor_class = with_chain_dispatch(ASTVisitor)
+    chain_higher_order_visitor_class = with_chain_dispatch(ASTHigherOrderVisitor)
+    visitors = [('table', lambda: ASTVisitor()),
+                ('chain', lambda: chain_visitor_class()),
+                ('table (HO)', lambda: ASTHigherOrderVisitor(visit_funcs=lambda node: None)),
+                ('chain (HO)', lambda: chain_higher_order_visitor_class(visit_funcs=lambda node: None))]
+
+    print(('%-32s %8s' + ' %12s' * len(visitors)) % (('Model', 'Nodes') + tuple(name + ' [ms]'
+                                                                               for (name, visitor) in visitors)))
+    total_nodes, totals = 0, [0.] * len(visitors)
+    for model_path in model_paths:
+        neurons = ModelParser.parse_model(model_path).get_neuron_list()
+        nodes = list()
+        for neuron in neurons:
+            neuron.accept(ASTHigherOrderVisitor(visit_funcs=nodes.append))
+        times = [time_traversals(neurons, create_visitor, args.repeat) for (name, create_visitor) in visitors]
+        total_nodes += len(nodes)
+        totals = [total + t for (total, t) in zip(totals, times)]
+        print(('%-32s %8d' + ' %12.2f' * len(times)) % ((os.path.basename(model_path), len(nodes))
+                                                        + tuple(t * 1000. for t in times)))
+        sys.stdout.flush()
+    print(('%-32s %8d' + ' %12.2f' * len(totals)) % (('(all %d models)' % len(model_paths), total_nodes)
+                                                     + tuple(t * 1000. for t in totals)))
+    for i in range(0, len(visitors), 2):
+        print('Speedup of %s over %s: %.2fx' % (visitors[i][0], visitors[i + 1][0], totals[i + 1] / totals[i]))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -19,6 +19,8 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_input_port import ASTInputPort
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -47,7 +49,9 @@ class CoCoBufferDataType(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(BufferDatatypeVisitor())
+        visitor = BufferDatatypeVisitor()
+        for input_port in ASTUtils.get_all(node, ASTInputPort):
+            visitor.visit_input_port(input_port)
 
 
 class BufferDatatypeVisitor(ASTVisitor):
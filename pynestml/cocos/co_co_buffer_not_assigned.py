@@ -18,8 +18,10 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_assignment import ASTAssignment
 from pynestml.symbols.symbol import SymbolKind
 from pynestml.symbols.variable_symbol import BlockType
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -42,7 +44,9 @@ class CoCoBufferNotAssigned(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(NoBufferAssignedVisitor())
+        visitor = NoBufferAssignedVisitor()
+        for assignment in ASTUtils.get_all(node, ASTAssignment):
+            visitor.visit_assignment(assignment)
 
 
 class NoBufferAssignedVisitor(ASTVisitor):
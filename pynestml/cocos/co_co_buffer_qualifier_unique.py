@@ -19,6 +19,8 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_input_port import ASTInputPort
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -41,7 +43,9 @@ class CoCoBufferQualifierUnique(CoCo):
         :type node: ast_neuron
         """
         cls.neuronName = node.get_name()
-        node.accept(BufferQualifierUniqueVisitor())
+        visitor = BufferQualifierUniqueVisitor()
+        for input_port in ASTUtils.get_all(node, ASTInputPort):
+            visitor.visit_input_port(input_port)
 
 
 class BufferQualifierUniqueVisitor(ASTVisitor):
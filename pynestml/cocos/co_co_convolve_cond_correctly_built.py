@@ -18,7 +18,9 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -42,7 +44,9 @@ class CoCoConvolveCondCorrectlyBuilt(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(ConvolveCheckerVisitor())
+        visitor = ConvolveCheckerVisitor()
+        for function_call in ASTUtils.get_all(node, ASTFunctionCall):
+            visitor.visit_function_call(function_call)
 
 
 class ConvolveCheckerVisitor(ASTVisitor):
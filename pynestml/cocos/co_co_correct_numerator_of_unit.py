@@ -18,6 +18,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_unit_type import ASTUnitType
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -40,7 +42,9 @@ class CoCoCorrectNumeratorOfUnit(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(NumericNumeratorVisitor())
+        visitor = NumericNumeratorVisitor()
+        for unit_type in ASTUtils.get_all(node, ASTUnitType):
+            visitor.visit_unit_type(unit_type)
 
 
 class NumericNumeratorVisitor(ASTVisitor):
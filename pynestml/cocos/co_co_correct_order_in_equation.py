@@ -18,6 +18,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -44,7 +46,9 @@ class CoCoCorrectOrderInEquation(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(OrderOfEquationVisitor())
+        visitor = OrderOfEquationVisitor()
+        for ode_equation in ASTUtils.get_all(node, ASTOdeEquation):
+            visitor.visit_ode_equation(ode_equation)
 
 
 class OrderOfEquationVisitor(ASTVisitor):
@@ -18,7 +18,9 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_ode_equation import ASTOdeEquation
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -51,7 +53,9 @@ class CoCoEquationsOnlyForInitValues(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(EquationsOnlyForInitValues())
+        visitor = EquationsOnlyForInitValues()
+        for ode_equation in ASTUtils.get_all(node, ASTOdeEquation):
+            visitor.visit_ode_equation(ode_equation)
 
 
 class EquationsOnlyForInitValues(ASTVisitor):
@@ -18,9 +18,11 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
 from pynestml.symbols.template_type_symbol import TemplateTypeSymbol
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.type_caster import TypeCaster
@@ -39,7 +41,9 @@ class CoCoFunctionCallsConsistent(CoCo):
         :param node: a single neuron instance.
         :type node: ASTNeuron
         """
-        node.accept(FunctionCallConsistencyVisitor())
+        visitor = FunctionCallConsistencyVisitor()
+        for function_call in ASTUtils.get_all(node, ASTFunctionCall):
+            visitor.visit_function_call(function_call)
 
 
 class FunctionCallConsistencyVisitor(ASTVisitor):
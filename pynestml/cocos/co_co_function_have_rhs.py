@@ -18,6 +18,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_declaration import ASTDeclaration
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -35,7 +37,9 @@ class CoCoFunctionHaveRhs(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(FunctionRhsVisitor())
+        visitor = FunctionRhsVisitor()
+        for declaration in ASTUtils.get_all(node, ASTDeclaration):
+            visitor.visit_declaration(declaration)
 
 
 class FunctionRhsVisitor(ASTVisitor):
@@ -18,9 +18,11 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+from pynestml.meta_model.ast_declaration import ASTDeclaration
 from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.cocos.co_co import CoCo
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -57,7 +59,9 @@ class CoCoInitVarsWithOdesProvided(CoCo):
         """
         assert (node is not None and isinstance(node, ASTNeuron)), \
             '(PyNestML.CoCo.VariablesDefined) No or wrong type of neuron provided (%s)!' % type(node)
-        node.accept(InitVarsVisitor())
+        visitor = InitVarsVisitor()
+        for declaration in ASTUtils.get_all(node, ASTDeclaration):
+            visitor.visit_declaration(declaration)
         return
 
 
@@ -22,6 +22,7 @@ from pynestml.meta_model.ast_declaration import ASTDeclaration
 from pynestml.cocos.co_co import CoCo
 from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
 from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
@@ -42,7 +43,8 @@ class CoCoInvariantIsBoolean(CoCo):
         :type neuron: ast_neuron
         """
         visitor = InvariantTypeVisitor()
-        neuron.accept(visitor)
+        for declaration in ASTUtils.get_all(neuron, ASTDeclaration):
+            visitor.visit_declaration(declaration)
 
 
 class InvariantTypeVisitor(ASTVisitor):
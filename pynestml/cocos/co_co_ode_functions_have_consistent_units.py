@@ -18,6 +18,8 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_ode_function import ASTOdeFunction
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -36,7 +38,9 @@ class CoCoOdeFunctionsHaveConsistentUnits(CoCo):
         :param node: a single neuron instance.
         :type node: ast_neuron
         """
-        node.accept(OdeFunctionConsistentUnitsVisitor())
+        visitor = OdeFunctionConsistentUnitsVisitor()
+        for ode_function in ASTUtils.get_all(node, ASTOdeFunction):
+            visitor.visit_ode_function(ode_function)
 
 
 class OdeFunctionConsistentUnitsVisitor(ASTVisitor):
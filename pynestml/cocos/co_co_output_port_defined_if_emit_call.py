@@ -18,10 +18,12 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 from pynestml.cocos.co_co import CoCo
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.symbols.error_type_symbol import ErrorTypeSymbol
 from pynestml.symbols.template_type_symbol import TemplateTypeSymbol
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.type_caster import TypeCaster
@@ -42,7 +44,8 @@ class CoCoOutputPortDefinedIfEmitCall(CoCo):
         """
         visitor = OutputPortDefinedIfEmitCalledVisitor()
         visitor.neuron = neuron
-        neuron.accept(visitor)
+        for function_call in ASTUtils.get_all(neuron, ASTFunctionCall):
+            visitor.visit_function_call(function_call)
 
 
 class OutputPortDefinedIfEmitCalledVisitor(ASTVisitor):
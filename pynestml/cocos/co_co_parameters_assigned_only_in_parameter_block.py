@@ -17,11 +17,13 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+from pynestml.meta_model.ast_assignment import ASTAssignment
 from pynestml.meta_model.ast_neuron import ASTNeuron
 from pynestml.cocos.co_co import CoCo
 from pynestml.symbol_table.scope import ScopeType
 from pynestml.symbols.symbol import SymbolKind
 from pynestml.symbols.variable_symbol import BlockType
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -53,7 +55,9 @@ class CoCoParametersAssignedOnlyInParameterBlock(CoCo):
         """
         assert (node is not None and isinstance(node, ASTNeuron)), \
             '(PyNestML.CoCo.BufferNotAssigned) No or wrong type of neuron provided (%s)!' % type(node)
-        node.accept(ParametersAssignmentVisitor())
+        visitor = ParametersAssignmentVisitor()
+        for assignment in ASTUtils.get_all(node, ASTAssignment):
+            visitor.visit_assignment(assignment)
         return
 
 
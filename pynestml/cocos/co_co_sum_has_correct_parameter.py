@@ -17,9 +17,11 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
 from pynestml.cocos.co_co import CoCo
 from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.utils.messages import Messages
 from pynestml.visitors.ast_visitor import ASTVisitor
@@ -41,7 +43,8 @@ class CoCoSumHasCorrectParameter(CoCo):
         """
         cls.neuronName = neuron.get_name()
         visitor = SumIsCorrectVisitor()
-        neuron.accept(visitor)
+        for function_call in ASTUtils.get_all(neuron, ASTFunctionCall):
+            visitor.visit_function_call(function_call)
         return
 
 
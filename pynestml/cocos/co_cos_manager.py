@@ -49,6 +49,7 @@ from pynestml.cocos.co_co_variable_once_per_scope import CoCoVariableOncePerScop
 from pynestml.cocos.co_co_vector_variable_in_non_vector_declaration import CoCoVectorVariableInNonVectorDeclaration
 from pynestml.cocos.co_co_function_argument_template_types_consistent import CoCoFunctionArgumentTemplateTypesConsistent
 from pynestml.meta_model.ast_neuron import ASTNeuron
+from pynestml.utils.profiler import Profiler
 
 class CoCosManager(object):
     """
@@ -323,33 +324,36 @@ class CoCosManager(object):
         :param neuron: a single neuron object.
         :type neuron: ASTNeuron
         """
-        cls.check_function_defined(neuron)
-        cls.check_function_declared_and_correctly_typed(neuron)
-        cls.check_variables_unique_in_scope(neuron)
-        cls.check_variables_defined_before_usage(neuron)
-        cls.check_functions_have_rhs(neuron)
-        cls.check_function_has_max_one_lhs(neuron)
-        cls.check_no_values_assigned_to_buffers(neuron)
-        cls.check_order_of_equations_correct(neuron)
-        cls.check_numerator_of_unit_is_one_if_numeric(neuron)
-        cls.check_no_nest_namespace_collisions(neuron)
-        cls.check_buffer_qualifier_unique(neuron)
-        cls.check_parameters_not_assigned_outside_parameters_block(neuron)
-        cls.check_current_buffers_no_keywords(neuron)
-        cls.check_buffer_types_are_correct(neuron)
-        cls.check_user_defined_function_correctly_built(neuron)
-        cls.check_initial_ode_initial_values(neuron)
-        cls.check_convolve_cond_curr_is_correct(neuron)
-        cls.check_output_port_defined_if_emit_call(neuron)
+        checks = [cls.check_function_defined,
+                  cls.check_function_declared_and_correctly_typed,
+                  cls.check_variables_unique_in_scope,
+                  cls.check_variables_defined_before_usage,
+                  cls.check_functions_have_rhs,
+                  cls.check_function_has_max_one_lhs,
+                  cls.check_no_values_assigned_to_buffers,
+                  cls.check_order_of_equations_correct,
+                  cls.check_numerator_of_unit_is_one_if_numeric,
+                  cls.check_no_nest_namespace_collisions,
+                  cls.check_buffer_qualifier_unique,
+                  cls.check_parameters_not_assigned_outside_parameters_block,
+                  cls.check_current_buffers_no_keywords,
+                  cls.check_buffer_types_are_correct,
+                  cls.check_user_defined_function_correctly_built,
+                  cls.check_initial_ode_initial_values,
+                  cls.check_convolve_cond_curr_is_correct,
+                  cls.check_output_port_defined_if_emit_call]
         if not after_ast_rewrite:
-            cls.check_odes_have_consistent_units(neuron)        # units might be incorrect due to e.g. refactoring convolve call (Real type assigned)
-            cls.check_ode_functions_have_consistent_units(neuron)        # ODE functions have been removed at this point
-            cls.check_correct_usage_of_shapes(neuron)
-        cls.check_invariant_type_correct(neuron)
-        cls.check_vector_in_non_vector_declaration_detected(neuron)
-        cls.check_sum_has_correct_parameter(neuron)
-        cls.check_expression_correct(neuron)
-        cls.check_function_argument_template_types_consistent(neuron)
+            checks.append(cls.check_odes_have_consistent_units)        # units might be incorrect due to e.g. refactoring convolve call (Real type assigned)
+            checks.append(cls.check_ode_functions_have_consistent_units)        # ODE functions have been removed at this point
+            checks.append(cls.check_correct_usage_of_shapes)
+        checks.extend([cls.check_invariant_type_correct,
+                       cls.check_vector_in_non_vector_declaration_detected,
+                       cls.check_sum_has_correct_parameter,
+                       cls.check_expression_correct,
+                       cls.check_function_argument_template_types_consistent])
+        for check in checks:
+            with Profiler.phase('cocos.' + check.__name__, neuron.get_name()):
+                check(neuron)
         return
 
     @classmethod
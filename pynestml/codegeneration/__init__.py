@@ -22,4 +22,4 @@ __all__ = ['nest_assignments_helper.py', 'nest_codegeneration.py', 'nest_declara
            'nest_names_converter.py', 'nest_printer.py', 'gsl_names_converter.py', 'gsl_reference_converter.py',
            'i_reference_converter.py', 'idempotent_reference_converter.py', 'nest_reference_converter.py',
            'legacy_expression_printer.py',
-           'unit_converter.py', 'codegeneration.py']
+           'unit_converter.py', 'codegeneration.py', 'build_manifest.py', 'template_bytecode_cache.py']
@@ -17,14 +17,10 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
-import datetime
 import os
 import re
 from typing import List
 
-from jinja2 import Environment, FileSystemLoader
-from odetoolbox import analysis
-
 from pynestml.codegeneration.codegenerator import CodeGenerator
 from pynestml.codegeneration.latex_expression_printer import LatexExpressionPrinter
 from pynestml.codegeneration.nest_assignments_helper import NestAssignmentsHelper
@@ -35,8 +31,6 @@ from pynestml.codegeneration.latex_reference_converter import LatexReferenceConv
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.meta_model.ast_equations_block import ASTEquationsBlock
 from pynestml.meta_model.ast_neuron import ASTNeuron
-from pynestml.solver.solution_transformers import integrate_exact_solution, functional_shapes_to_odes, \
-    integrate_delta_solution
 from pynestml.solver.transformer_base import add_assignment_to_update_block
 from pynestml.symbols.symbol import SymbolKind
 from pynestml.utils.ast_utils import ASTUtils
@@ -45,13 +39,14 @@ from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.model_parser import ModelParser
 from pynestml.utils.ode_transformer import OdeTransformer
+from pynestml.utils.profiler import Profiler
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 
 class AutoDocCodeGenerator(CodeGenerator):
 
     def __init__(self):
         # setup the template environment
-        env = Environment(loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), 'resources_autodoc')))
+        env = self.get_template_environment(os.path.join(os.path.dirname(__file__), 'resources_autodoc'))
         self._template_nestml_models_index = env.get_template('nestml_models_index.jinja2')
         # setup the module class template
         self._template_nestml_model = env.get_template('nestml_model.jinja2')
@@ -65,13 +60,20 @@ class AutoDocCodeGenerator(CodeGenerator):
         self.generate_index(neurons)
         self.generate_neurons(neurons)
 
+    def generate_module_code(self, neurons: List[ASTNeuron]):
+        """
+        Generate the index page, which is the only part of the documentation that depends on all neurons.
+        """
+        self.generate_index(neurons)
+
     def generate_index(self, neurons: List[ASTNeuron]):
         """
         Generate index (list) of all neuron models with links to their generated documentation.
         """
-        nestml_models_index = self._template_nestml_models_index.render(self.setup_index_generation_helpers(neurons))
-        with open(str(os.path.join(FrontendConfiguration.get_target_path(), 'index.rst')), 'w+') as f:
-            f.write(str(nestml_models_index))
+        with Profiler.phase('render_module', 'index'):
+            nestml_models_index = self._template_nestml_models_index.render(self.setup_index_generation_helpers(neurons))
+            with open(str(os.path.join(FrontendConfiguration.get_target_path(), 'index.rst')), 'w+') as f:
+                f.write(str(nestml_models_index))
 
     def generate_neuron_code(self, neuron: ASTNeuron):
         """
@@ -99,7 +101,7 @@ class AutoDocCodeGenerator(CodeGenerator):
 
         namespace = dict()
 
-        namespace['now'] = datetime.datetime.utcnow()
+        namespace['now'] = self.get_generation_time()
         namespace['neuron'] = neuron
         namespace['neuronName'] = str(neuron.get_name())
         namespace['printer'] = NestPrinter(latex_expression_printer)
@@ -131,7 +133,7 @@ class AutoDocCodeGenerator(CodeGenerator):
 
         namespace = dict()
 
-        namespace['now'] = datetime.datetime.utcnow()
+        namespace['now'] = self.get_generation_time()
         namespace['neurons'] = neurons
         namespace['neuronNames'] = [str(neuron.get_name()) for neuron in neurons]
         namespace['printer'] = NestPrinter(latex_expression_printer)
@@ -0,0 +1,151 @@
+#
+# build_manifest.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import hashlib
+import json
+import os
+import tempfile
+
+
+class BuildManifest(object):
+    """
+    This class represents the manifest of a target directory. For each artifact, i.e., a group of files generated
+    together (e.g., the header and implementation file of a neuron), it records a hash of all inputs of the
+    generation as well as a hash of each generated file. An artifact whose inputs are unchanged and whose files
+    have not been modified does not have to be generated again.
+    Attributes:
+        target_path  The directory containing the generated files and the manifest. Type: str
+        entries      A dict from artifact names to dicts with the keys 'inputs' (hash of all inputs) and 'files'
+                     (dict from file names relative to the target path to their hashes). Type: dict
+        touched_files  If not None, a set to which the absolute paths of all files written or recorded by any manifest
+                       are added, e.g., to report the files generated or found up to date by a single run. Type: set(str)
+    """
+    FILE_NAME = 'nestml_manifest.json'
+    touched_files = None
+
+    def __init__(self, target_path):
+        """
+        Standard constructor. Loads the manifest stored in the target directory, if any.
+        :param target_path: the directory containing the generated files.
+        :type target_path: str
+        """
+        self.target_path = target_path
+        self.entries = dict()
+        try:
+            with open(os.path.join(self.target_path, self.FILE_NAME)) as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self.entries = entries
+        except (OSError, ValueError):
+            # a missing or broken manifest merely results in all artifacts being generated again
+            pass
+
+    @classmethod
+    def compute_hash(cls, content):
+        """
+        Computes the hash of the handed over content.
+        :param content: the content, e.g., of a file.
+        :type content: str or bytes
+        :return: a hex digest.
+        :rtype: str
+        """
+        if not isinstance(content, bytes):
+            content = content.encode('utf-8')
+        return hashlib.sha256(content).hexdigest()
+
+    def get_file_hash(self, file_name):
+        """
+        Returns the hash of the current content of a file in the target directory.
+        :param file_name: the name of the file, relative to the target path.
+        :type file_name: str
+        :return: a hex digest, or None if the file does not exist.
+        :rtype: str
+        """
+        try:
+            with open(os.path.join(self.target_path, file_name), 'rb') as f:
+                return self.compute_hash(f.read())
+        except OSError:
+            return None
+
+    def is_up_to_date(self, name, inputs):
+        """
+        Indicates whether the files of the handed over artifact have been generated from the same inputs and have not
+        been modified or deleted since.
+        :param name: the name of the artifact.
+        :type name: str
+        :param inputs: the hash of all inputs of the artifact.
+        :type inputs: str
+        :return: True if up to date, otherwise False.
+        :rtype: bool
+        """
+        entry = self.entries.get(name)
+        if not isinstance(entry, dict) or entry.get('inputs') != inputs or not entry.get('files'):
+            return False
+        return all(self.get_file_hash(file_name) == file_hash for (file_name, file_hash) in entry['files'].items())
+
+    def update(self, name, inputs, file_names):
+        """
+        Records that the files of the handed over artifact have been generated from the handed over inputs.
+        :param name: the name of the artifact.
+        :type name: str
+        :param inputs: the hash of all inputs of the artifact.
+        :type inputs: str
+        :param file_names: the names of the generated files, relative to the target path.
+        :type file_names: list(str)
+        """
+        self.entries[name] = {'inputs': inputs,
+                              'files': {file_name: self.get_file_hash(file_name) for file_name in file_names}}
+        self.touch(file_names)
+
+    def store(self):
+        """
+        Stores the manifest in the target directory, unless it has not changed.
+        """
+        content = json.dumps(self.entries, indent=2, sort_keys=True)
+        if self.get_file_hash(self.FILE_NAME) == self.compute_hash(content):
+            return
+        handle, tmp_path = tempfile.mkstemp(dir=self.target_path, suffix='.tmp')
+        with os.fdopen(handle, 'w') as f:
+            f.write(content)
+        os.replace(tmp_path, os.path.join(self.target_path, self.FILE_NAME))
+
+    def write_file(self, file_name, content):
+        """
+        Writes the handed over content to a file in the target directory. If the file already has exactly this
+        content, it is not touched, such that its modification time is retained and build systems do not recompile it.
+        :param file_name: the name of the file, relative to the target path.
+        :type file_name: str
+        :param content: the new content of the file.
+        :type content: str
+        """
+        self.touch([file_name])
+        if self.get_file_hash(file_name) == self.compute_hash(content):
+            return
+        with open(os.path.join(self.target_path, file_name), 'w+') as f:
+            f.write(content)
+
+    def touch(self, file_names):
+        """
+        Adds the handed over files to the touched files, if these are collected.
+        :param file_names: the names of files, relative to the target path.
+        :type file_names: list(str)
+        """
+        if BuildManifest.touched_files is not None:
+            BuildManifest.touched_files.update(os.path.join(os.path.abspath(self.target_path), file_name)
+                                               for file_name in file_names)
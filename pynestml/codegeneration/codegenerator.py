@@ -18,16 +18,36 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+import datetime
+import json
+import os
 from typing import List
 
+from jinja2 import Environment, FileSystemLoader
+
 from pynestml.exceptions.invalid_target_exception import InvalidTargetException
 from pynestml.meta_model.ast_node import ASTNode
+from pynestml.utils.disk_cache import DiskCache
 from pynestml.utils.logger import Logger
 from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
+from pynestml.utils.profiler import Profiler
 
 
 class CodeGenerator():
+    """
+    Attributes:
+        ode_toolbox_cache        The cache of the results of ode-toolbox, or None if results shall not be cached.
+                                 Type: DiskCache
+        template_bytecode_cache  The cache of the compiled templates, or None if templates shall not be cached.
+                                 Type: TemplateBytecodeCache
+        template_environments    The template environments shared by all code generators, keyed by the directory of
+                                 the templates and of the template bytecode cache, cf. get_template_environment().
+                                 Type: dict((str,str),jinja2.Environment)
+    """
+    ode_toolbox_cache = None
+    template_bytecode_cache = None
+    template_environments = dict()
 
     def __init__(self, target):
         if not target.upper() in self.get_known_targets():
@@ -44,6 +64,16 @@ class CodeGenerator():
         targets = [s.upper() for s in targets]
         return targets
 
+    def analyse_transform_neurons(self, neurons: List[ASTNode]):
+        """
+        Analyse and transform the given neurons before code is generated for them. By default, the neurons are used
+        as they are.
+
+        :param neurons: a list of neurons.
+        :type neurons: List[ASTNode]
+        """
+        pass
+
     def generate_neurons(self, neurons: List[ASTNode]):
         """
         Generate code for the given neurons.
@@ -54,29 +84,129 @@ class CodeGenerator():
         from pynestml.frontend.frontend_configuration import FrontendConfiguration
 
         for neuron in neurons:
-            self.generate_neuron_code(neuron)
+            with Profiler.phase('render_neuron', neuron.get_name()):
+                self.generate_neuron_code(neuron)
             if not Logger.has_errors(neuron):
                 code, message = Messages.get_code_generated(neuron.get_name(), FrontendConfiguration.get_target_path())
                 Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
 
-    def generate_code(self, neurons):
+    def generate_module_code(self, neurons: List[ASTNode]):
         """
-        Generate code for the given neurons and (depending on the target) generate an index page, module entrypoint or
-        similar that incorporates an enumeration of all neurons.
+        Generate code that incorporates an enumeration of all neurons, e.g., an index page or module entrypoint. By
+        default, no such code is generated.
 
         :param neurons: a list of neurons.
         :type neurons: List[ASTNode]
         """
+        pass
+
+    def get_generation_time(self):
+        """
+        Returns the time of generation which is rendered into the generated files. If reproducible output has been
+        requested, the time is taken from the SOURCE_DATE_EPOCH environment variable, or omitted if it is not set, such
+        that identical models always result in identical files.
+
+        :return: the time of generation, or None if it shall be omitted.
+        :rtype: datetime.datetime
+        """
+        from pynestml.frontend.frontend_configuration import FrontendConfiguration
+
+        if not FrontendConfiguration.is_reproducible:
+            return datetime.datetime.utcnow()
+        if os.environ.get('SOURCE_DATE_EPOCH'):
+            return datetime.datetime.utcfromtimestamp(int(os.environ['SOURCE_DATE_EPOCH']))
+        return None
+
+    def analyse_with_ode_toolbox(self, indict):
+        """
+        Analyses the handed over ODEs and shapes by means of ode-toolbox. Symbolic analysis takes long, thus the results
+        are cached under a canonical representation of the input and the versions of ode-toolbox and sympy. Generating
+        code again for an unchanged equations block, or for another neuron with identical dynamics, therefore does not
+        analyse the equations again.
+
+        :param indict: the input of ode-toolbox, i.e., a dict which can be represented in JSON notation.
+        :type indict: dict
+        :return: the solvers as computed by ode-toolbox.
+        :rtype: list(dict)
+        """
+        from odetoolbox import analysis
+
+        with Profiler.phase('odetoolbox'):
+            if self.ode_toolbox_cache is None:
+                return analysis(indict, enable_stiffness_check=False)
+            key = DiskCache.compute_key(json.dumps(indict, sort_keys=True), *self.get_ode_toolbox_versions())
+            solvers = self.ode_toolbox_cache.load(key)
+            if solvers is None:
+                solvers = analysis(indict, enable_stiffness_check=False)
+                self.ode_toolbox_cache.store(key, solvers)
+            return solvers
+
+    @staticmethod
+    def get_ode_toolbox_versions():
+        """
+        Returns the versions of ode-toolbox and of sympy, on which the results of ode-toolbox depend.
+
+        :return: a list of versions.
+        :rtype: list(str)
+        """
+        import sympy
+        try:
+            from importlib.metadata import version
+            ode_toolbox_version = version('odetoolbox')
+        except Exception:
+            # the version cannot be determined, e.g., if ode-toolbox has not been installed as a package
+            import odetoolbox
+            ode_toolbox_version = os.path.dirname(os.path.abspath(odetoolbox.__file__))
+        return [ode_toolbox_version, sympy.__version__]
+
+    @classmethod
+    def get_template_environment(cls, templates_path):
+        """
+        Returns the template environment for the handed over directory of templates. The environment is created once
+        and shared by all code generators, such that each template is loaded and compiled only once per process; the
+        compiled templates are stored in the template bytecode cache if one has been set up.
+
+        :param templates_path: the directory of the templates.
+        :type templates_path: str
+        :return: the template environment.
+        :rtype: jinja2.Environment
+        """
+        bytecode_cache = cls.template_bytecode_cache
+        key = (templates_path, bytecode_cache.directory if bytecode_cache is not None else None)
+        env = cls.template_environments.get(key)
+        if env is None:
+            env = Environment(loader=FileSystemLoader(templates_path), bytecode_cache=bytecode_cache)
+            cls.template_environments[key] = env
+        return env
+
+    def get_target_code_generator(self):
+        """
+        Returns a new code generator for the selected target.
+
+        :return: a code generator, or None if no code shall be generated.
+        :rtype: CodeGenerator
+        """
         if self._target.upper() == "NEST":
             from pynestml.codegeneration.nest_codegenerator import NESTCodeGenerator
-            _codeGenerator = NESTCodeGenerator()
-            _codeGenerator.generate_code(neurons)
+            return NESTCodeGenerator()
         elif self._target.upper() == "AUTODOC":
             from pynestml.codegeneration.autodoc_codegenerator import AutoDocCodeGenerator
-            _codeGenerator = AutoDocCodeGenerator()
+            return AutoDocCodeGenerator()
+        # dummy/null target: user requested to not generate any code
+        assert self._target == ""
+        return None
+
+    def generate_code(self, neurons):
+        """
+        Generate code for the given neurons and (depending on the target) generate an index page, module entrypoint or
+        similar that incorporates an enumeration of all neurons.
+
+        :param neurons: a list of neurons.
+        :type neurons: List[ASTNode]
+        """
+        _codeGenerator = self.get_target_code_generator()
+        if _codeGenerator is not None:
             _codeGenerator.generate_code(neurons)
         else:
-            # dummy/null target: user requested to not generate any code
-            assert self._target == ""
             code, message = Messages.get_no_code_generated()
             Logger.log_message(None, code, message, None, LoggingLevel.INFO)
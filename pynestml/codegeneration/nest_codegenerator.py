@@ -17,14 +17,14 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
-import datetime
+import json
 import os
 import re
 
-from jinja2 import Environment, FileSystemLoader, TemplateRuntimeError
-from odetoolbox import analysis
+from jinja2 import TemplateRuntimeError
 
 import pynestml
+from pynestml.codegeneration.build_manifest import BuildManifest
 from pynestml.codegeneration.codegenerator import CodeGenerator
 from pynestml.codegeneration.expressions_pretty_printer import ExpressionsPrettyPrinter
 from pynestml.codegeneration.gsl_names_converter import GSLNamesConverter
@@ -37,8 +37,6 @@ from pynestml.codegeneration.nest_printer import NestPrinter
 from pynestml.codegeneration.nest_reference_converter import NESTReferenceConverter
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.meta_model.ast_equations_block import ASTEquationsBlock
-from pynestml.solver.solution_transformers import integrate_exact_solution, functional_shapes_to_odes, \
-    integrate_delta_solution
 from pynestml.solver.transformer_base import add_assignment_to_update_block
 from pynestml.symbols.symbol import SymbolKind
 from pynestml.utils.ast_utils import ASTUtils
@@ -47,21 +45,29 @@ from pynestml.utils.logger import LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.model_parser import ModelParser
 from pynestml.utils.ode_transformer import OdeTransformer
+from pynestml.utils.profiler import Profiler
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
 from pynestml.visitors.ast_random_number_generator_visitor import ASTRandomNumberGeneratorVisitor
 
+
+def raise_helper(msg):
+    """
+    Raises a template runtime error with the handed over message; available in the templates as raise().
+    """
+    raise TemplateRuntimeError(msg)
+
+
 class NESTCodeGenerator(CodeGenerator):
 
     _variable_matching_template = r'(\b)({})(\b)'
+    _sources_hash = None
 
     def __init__(self):
         # setup the template environment
-        def raise_helper(msg):
-            raise TemplateRuntimeError(msg)
-        env = Environment(loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), 'resources_nest')))
+        env = self.get_template_environment(os.path.join(os.path.dirname(__file__), 'resources_nest'))
         env.globals['raise'] = raise_helper
-        setup_env = Environment(loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), 'resources_nest', 'setup')))
+        setup_env = self.get_template_environment(os.path.join(os.path.dirname(__file__), 'resources_nest', 'setup'))
         setup_env.globals['raise'] = raise_helper
         # setup the cmake template
         self._template_cmakelists = setup_env.get_template('CMakeLists.jinja2')
@@ -77,6 +83,7 @@ class NESTCodeGenerator(CodeGenerator):
         self._template_neuron_cpp_file = env.get_template('NeuronClass.jinja2')
 
         self._printer = ExpressionsPrettyPrinter()
+        self._manifest = None
 
     def generate_code(self, neurons):
         self.analyse_transform_neurons(neurons)
@@ -90,30 +97,37 @@ class NESTCodeGenerator(CodeGenerator):
         :param neurons: a list of neurons
         :type neurons: list(ASTNeuron)
         """
-        namespace = {'neurons': neurons,
-                     'moduleName': FrontendConfiguration.get_module_name(),
-                     'now': datetime.datetime.utcnow()}
         if not os.path.exists(FrontendConfiguration.get_target_path()):
             os.makedirs(FrontendConfiguration.get_target_path())
-
-        with open(str(os.path.join(FrontendConfiguration.get_target_path(),
-                                   FrontendConfiguration.get_module_name())) + '.h', 'w+') as f:
-            f.write(str(self._template_module_header.render(namespace)))
-
-        with open(str(os.path.join(FrontendConfiguration.get_target_path(),
-                                   FrontendConfiguration.get_module_name())) + '.cpp', 'w+') as f:
-            f.write(str(self._template_module_class.render(namespace)))
-
-        with open(str(os.path.join(FrontendConfiguration.get_target_path(),
-                                   'CMakeLists')) + '.txt', 'w+') as f:
-            f.write(str(self._template_cmakelists.render(namespace)))
-
         if not os.path.isdir(os.path.realpath(os.path.join(FrontendConfiguration.get_target_path(), 'sli'))):
             os.makedirs(os.path.realpath(os.path.join(FrontendConfiguration.get_target_path(), 'sli')))
 
-        with open(str(os.path.join(FrontendConfiguration.get_target_path(), 'sli',
-                                   FrontendConfiguration.get_module_name() + "-init")) + '.sli', 'w+') as f:
-            f.write(str(self._template_sli_init.render(namespace)))
+        manifest = self.get_manifest()
+        module_name = FrontendConfiguration.get_module_name()
+        module_files = [module_name + '.h', module_name + '.cpp', 'CMakeLists.txt',
+                        os.path.join('sli', module_name + '-init.sli')]
+        # the module files only depend on the names of the neurons
+        module_inputs = self.get_inputs_hash([neuron.get_name() for neuron in neurons])
+        if manifest.is_up_to_date(module_name, module_inputs):
+            code, message = Messages.get_code_up_to_date(module_name, FrontendConfiguration.get_target_path())
+            Logger.log_message(None, code, message, None, LoggingLevel.INFO)
+        else:
+            namespace = {'neurons': neurons,
+                         'moduleName': module_name,
+                         'now': self.get_generation_time()}
+            with Profiler.phase('render_module', module_name):
+                manifest.write_file(module_files[0], str(self._template_module_header.render(namespace)))
+                manifest.write_file(module_files[1], str(self._template_module_class.render(namespace)))
+                manifest.write_file(module_files[2], str(self._template_cmakelists.render(namespace)))
+                manifest.write_file(module_files[3], str(self._template_sli_init.render(namespace)))
+
+        # record what the target directory has been generated from, such that the next run can skip unchanged parts
+        manifest.entries = dict()
+        for neuron in neurons:
+            manifest.update(neuron.get_name(), self.get_neuron_inputs_hash(neuron),
+                            [neuron.get_name() + '.h', neuron.get_name() + '.cpp'])
+        manifest.update(module_name, module_inputs, module_files)
+        manifest.store()
 
         code, message = Messages.get_module_generated(FrontendConfiguration.get_target_path())
         Logger.log_message(None, code, message, None, LoggingLevel.INFO)
@@ -128,9 +142,10 @@ class NESTCodeGenerator(CodeGenerator):
         for neuron in neurons:
             code, message = Messages.get_analysing_transforming_neuron(neuron.get_name())
             Logger.log_message(None, code, message, None, LoggingLevel.INFO)
-            self.analyse_neuron(neuron)
-            # now store the transformed model
-            self.store_transformed_model(neuron)
+            with Profiler.phase('analyse_neuron', neuron.get_name()):
+                self.analyse_neuron(neuron)
+                # now store the transformed model
+                self.store_transformed_model(neuron)
 
 
     def analyse_neuron(self, neuron):
@@ -172,31 +187,83 @@ class NESTCodeGenerator(CodeGenerator):
         """
         if not os.path.isdir(FrontendConfiguration.get_target_path()):
             os.makedirs(FrontendConfiguration.get_target_path())
-        self.generate_model_h_file(neuron)
-        self.generate_neuron_cpp_file(neuron)
+        if self.get_manifest().is_up_to_date(neuron.get_name(), self.get_neuron_inputs_hash(neuron)):
+            code, message = Messages.get_code_up_to_date(neuron.get_name(), FrontendConfiguration.get_target_path())
+            Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
+            return
+        # the namespace is shared by the header and the implementation, such that the neuron is analysed only once
+        namespace = self.setup_generation_helpers(neuron)
+        self.generate_model_h_file(neuron, namespace)
+        self.generate_neuron_cpp_file(neuron, namespace)
 
 
-    def generate_model_h_file(self, neuron):
-        # type: (ASTNeuron) -> None
+    def generate_model_h_file(self, neuron, namespace=None):
+        # type: (ASTNeuron, dict) -> None
         """
         For a handed over neuron, this method generates the corresponding header file.
         :param neuron: a single neuron object.
+        :param namespace: the namespace of the neuron as returned by setup_generation_helpers(), created if not given.
         """
-        # print("!!!", neuron)
-        neuron_h_file = self._template_neuron_h_file.render(self.setup_generation_helpers(neuron))
-        with open(str(os.path.join(FrontendConfiguration.get_target_path(), neuron.get_name())) + '.h', 'w+') as f:
-            f.write(str(neuron_h_file))
+        if namespace is None:
+            namespace = self.setup_generation_helpers(neuron)
+        neuron_h_file = self._template_neuron_h_file.render(namespace)
+        self.get_manifest().write_file(neuron.get_name() + '.h', str(neuron_h_file))
 
 
-    def generate_neuron_cpp_file(self, neuron):
-        # type: (ASTNeuron) -> None
+    def generate_neuron_cpp_file(self, neuron, namespace=None):
+        # type: (ASTNeuron, dict) -> None
         """
         For a handed over neuron, this method generates the corresponding implementation file.
         :param neuron: a single neuron object.
+        :param namespace: the namespace of the neuron as returned by setup_generation_helpers(), created if not given.
         """
-        neuron_cpp_file = self._template_neuron_cpp_file.render(self.setup_generation_helpers(neuron))
-        with open(str(os.path.join(FrontendConfiguration.get_target_path(), neuron.get_name())) + '.cpp', 'w+') as f:
-            f.write(str(neuron_cpp_file))
+        if namespace is None:
+            namespace = self.setup_generation_helpers(neuron)
+        neuron_cpp_file = self._template_neuron_cpp_file.render(namespace)
+        self.get_manifest().write_file(neuron.get_name() + '.cpp', str(neuron_cpp_file))
+
+
+    def get_manifest(self):
+        # type: () -> BuildManifest
+        """
+        Returns the manifest of the target directory.
+        :return: the manifest.
+        """
+        if self._manifest is None or self._manifest.target_path != FrontendConfiguration.get_target_path():
+            self._manifest = BuildManifest(FrontendConfiguration.get_target_path())
+        return self._manifest
+
+
+    def get_neuron_inputs_hash(self, neuron):
+        # type: (ASTNeuron) -> str
+        """
+        Returns a hash of everything the code of a handed over (transformed) neuron is generated from.
+        :param neuron: a single neuron object.
+        """
+        return self.get_inputs_hash([neuron.get_name(), str(neuron)])
+
+
+    def get_inputs_hash(self, inputs):
+        # type: (list) -> str
+        """
+        Returns a hash of the handed over inputs, the options and the sources of the toolchain, including the templates.
+        :param inputs: a json-serializable list of inputs.
+        """
+        if NESTCodeGenerator._sources_hash is None:
+            sources = list()
+            sources_path = os.path.dirname(pynestml.__file__)
+            for dirpath, dirnames, filenames in os.walk(sources_path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if filename.endswith('.py') or filename.endswith('.jinja2'):
+                        with open(os.path.join(dirpath, filename), 'rb') as f:
+                            sources.append(os.path.relpath(os.path.join(dirpath, filename), sources_path) + ':' +
+                                           BuildManifest.compute_hash(f.read()))
+            NESTCodeGenerator._sources_hash = BuildManifest.compute_hash('\n'.join(sources))
+        return BuildManifest.compute_hash(json.dumps([NESTCodeGenerator._sources_hash, pynestml.__version__,
+                                                      FrontendConfiguration.get_module_name(),
+                                                      FrontendConfiguration.is_dev,
+                                                      FrontendConfiguration.is_reproducible, inputs]))
 
 
     def setup_generation_helpers(self, neuron):
@@ -229,7 +296,7 @@ class NESTCodeGenerator(CodeGenerator):
         namespace['is_current_input'] = ASTUtils.is_current_input(neuron.get_body())
         namespace['odeTransformer'] = OdeTransformer()
         namespace['printerGSL'] = gsl_printer
-        namespace['now'] = datetime.datetime.utcnow()
+        namespace['now'] = self.get_generation_time()
         namespace['tracing'] = FrontendConfiguration.is_dev
 
         namespace['PredefinedUnits'] = pynestml.symbols.predefined_units.PredefinedUnits
@@ -290,6 +357,9 @@ class NESTCodeGenerator(CodeGenerator):
         :return: A transformed version of the neuron that can be passed to the GSL.
         """
 
+        from pynestml.solver.solution_transformers import integrate_exact_solution, functional_shapes_to_odes, \
+            integrate_delta_solution
+
         assert isinstance(neuron.get_equations_blocks(), ASTEquationsBlock), "Precondition violated: only one equation block should be present"
 
         equations_block = neuron.get_equations_block()
@@ -309,10 +379,10 @@ class NESTCodeGenerator(CodeGenerator):
             Logger.log_message(neuron, code, message, neuron.get_source_position(), LoggingLevel.INFO)
             solver_result = self.solve_ode_with_shapes(equations_block)
 
-            if solver_result["solver"] is "analytical":
+            if solver_result["solver"] == "analytical":
                 neuron = integrate_exact_solution(neuron, solver_result)
                 neuron.remove_equations_block()
-            elif (solver_result["solver"] is "numeric"
+            elif (solver_result["solver"] == "numeric"
                   and self.is_functional_shape_present(equations_block.get_ode_shapes())):
                 functional_shapes_to_odes(neuron, solver_result)
 
@@ -359,7 +429,7 @@ class NESTCodeGenerator(CodeGenerator):
         # type: (ASTEquationsBlock) -> dict[str, list]
         odes_shapes_json = self.transform_ode_and_shapes_to_json(equations_block)
 
-        return analysis(odes_shapes_json, enable_stiffness_check=False)
+        return self.analyse_with_ode_toolbox(odes_shapes_json)
 
 
     def transform_ode_and_shapes_to_json(self, equations_block):
@@ -375,7 +445,8 @@ class NESTCodeGenerator(CodeGenerator):
             result["odes"].append({"symbol": equation.get_lhs().get_name(),
                                    "definition": self._printer.print_expression(equation.get_rhs())})
 
-        ode_shape_names = set()
+        # keep the order of the shapes, such that the generated code does not depend on the iteration order of sets
+        ode_shape_names = list()
         for shape in equations_block.get_ode_shapes():
             if shape.get_variable().get_differential_order() == 0:
                 result["shapes"].append({"type": "function",
@@ -387,7 +458,7 @@ class NESTCodeGenerator(CodeGenerator):
                 if '__' in shape.get_variable().get_name():
                     extracted_shape_name = shape.get_variable().get_name()[0:shape.get_variable().get_name().find("__")]
                 if extracted_shape_name not in ode_shape_names:  # add shape name only once
-                    ode_shape_names.add(extracted_shape_name)
+                    ode_shape_names.append(extracted_shape_name)
 
         # try to resolve all available initial values
         shape_name_to_initial_values = {}
@@ -425,7 +496,7 @@ class NESTCodeGenerator(CodeGenerator):
         # type: (ASTEquationsBlock) -> dict[str, list]
         shapes_json = self.transform_functional_shapes_to_json(equations_block)
 
-        return analysis(shapes_json, enable_stiffness_check=False)
+        return self.analyse_with_ode_toolbox(shapes_json)
 
 
     def transform_functional_shapes_to_json(self, equations_block):
@@ -461,7 +532,7 @@ class NESTCodeGenerator(CodeGenerator):
                 matcher = re.compile(self._variable_matching_template.format(source.get_variable_name()))
                 target_definition = str(target.get_expression())
                 target_definition = re.sub(matcher, "(" + str(source.get_expression()) + ")", target_definition)
-                target.expression = ModelParser.parse_expression(target_definition)
+                target.set_expression(ModelParser.parse_expression(target_definition))
 
                 def log_set_source_position(node):
                     if node.get_source_position().is_added_source_position():
@@ -488,7 +559,7 @@ class NESTCodeGenerator(CodeGenerator):
                 matcher = re.compile(self._variable_matching_template.format(fun.get_variable_name()))
                 target_definition = str(target.get_rhs())
                 target_definition = re.sub(matcher, "(" + str(fun.get_expression()) + ")", target_definition)
-                target.rhs = ModelParser.parse_expression(target_definition)
+                target.set_rhs(ModelParser.parse_expression(target_definition))
                 target.update_scope(fun.get_scope())
                 target.accept(ASTSymbolTableVisitor())
 
@@ -0,0 +1,48 @@
+#
+# template_bytecode_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+
+from jinja2 import FileSystemBytecodeCache
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    This class stores the compiled templates of the code generators across runs. Jinja2 stores the checksum of the
+    source of each template along with its bytecode and discards the bytecode once the template has been modified,
+    thus only templates which are new or modified are compiled again. In contrast to FileSystemBytecodeCache, the
+    directory is created on demand and failures to read or write the cache are not reported.
+    Attributes:
+        directory   The directory in which the compiled templates are stored. Type: str
+    """
+
+    def load_bytecode(self, bucket):
+        try:
+            super(TemplateBytecodeCache, self).load_bytecode(bucket)
+        except (OSError, EOFError, ValueError, TypeError):
+            # the cached bytecode is not readable, thus the template is compiled again
+            bucket.reset()
+
+    def dump_bytecode(self, bucket):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super(TemplateBytecodeCache, self).dump_bytecode(bucket)
+        except OSError:
+            # caching is an optimization only, thus failures are not reported
+            return
@@ -0,0 +1,97 @@
+#
+# compile_client.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import argparse
+import json
+import os
+import socket
+import sys
+
+# N.B. the client only hands over its arguments to a running server, cf. CompileServer, thus it does not import any
+# other part of the toolchain and starts fast.
+
+help_socket = 'Path to the Unix domain socket of a server started by "nestml --serve SOCKET". Standard is the value of the environment variable NESTML_SOCKET.'
+help_check = 'Only check the models, i.e., do not generate code.'
+help_shutdown = 'Stop the server.'
+
+
+def request(socket_path, method, params=None):
+    """
+    Sends a single request to the server and returns its response.
+    :param socket_path: the path to the socket of the server.
+    :type socket_path: str
+    :param method: the requested method, i.e., "compile", "check" or "shutdown".
+    :type method: str
+    :param params: the parameters of the request.
+    :type params: dict
+    :return: the response.
+    :rtype: dict
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        with client.makefile('rwb') as stream:
+            stream.write((json.dumps({'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params or {}}) +
+                          '\n').encode('utf-8'))
+            stream.flush()
+            response = stream.readline()
+    if not response:
+        raise ConnectionError('The server closed the connection')
+    return json.loads(response.decode('utf-8'))
+
+
+def main():
+    """Returns the process exit code: 0 for success, > 0 for failure"""
+    argument_parser = argparse.ArgumentParser(
+        description='Processes models by a server started by "nestml --serve SOCKET", which is faster than running '
+                    '"nestml" for each model.',
+        epilog='All other arguments are the ones of "nestml", cf. "nestml --help".')
+    argument_parser.add_argument('--socket', metavar='SOCKET', type=str, help=help_socket,
+                                 default=os.environ.get('NESTML_SOCKET'))
+    argument_parser.add_argument('--check', action='store_true', help=help_check)
+    argument_parser.add_argument('--shutdown', action='store_true', help=help_shutdown)
+    parsed_args, args = argument_parser.parse_known_args(sys.argv[1:])
+    if parsed_args.socket is None:
+        argument_parser.error('the following arguments are required: --socket')
+
+    if parsed_args.shutdown:
+        method = 'shutdown'
+    elif parsed_args.check:
+        method = 'check'
+    else:
+        method = 'compile'
+    try:
+        response = request(parsed_args.socket, method, {'args': args, 'cwd': os.getcwd()})
+    except (OSError, ValueError) as e:
+        print('Cannot connect to the server at "%s": %s' % (parsed_args.socket, e), file=sys.stderr)
+        return 1
+    if 'error' in response:
+        print(response['error']['message'], file=sys.stderr)
+        return 1
+    if response['result'] is None:
+        return 0
+    # print the messages as the command line interface does
+    for (message_nr, message) in enumerate(response['result']['messages']):
+        position = ', [%s:%s]' % (message['row'], message['col']) if message['row'] else ''
+        print('[%d,%s, %s%s]: %s' % (message_nr + 1, message['neuronName'], message['severity'], position,
+                                     message['message']))
+    return int(response['result']['errors_occurred'])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,283 @@
+#
+# compile_server.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import contextlib
+import importlib
+import io
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+
+from pynestml.codegeneration.build_manifest import BuildManifest
+from pynestml.codegeneration.codegenerator import CodeGenerator
+from pynestml.frontend.frontend_configuration import FrontendConfiguration, qualifier_target_arg
+from pynestml.utils.logger import Logger
+
+
+class CompileServer(object):
+    """
+    This class keeps a single process, in which the predefined symbols, the template environments and the caches are
+    loaded, and processes models on request. Tools which run the toolchain many times, e.g., continuous integration or
+    editors, thus do not pay for the start of the interpreter and the initialization of the toolchain on each run.
+    Requests and responses are JSON-RPC 2.0 objects, one per line, which are exchanged via the standard streams or via
+    a Unix domain socket:
+
+        {"jsonrpc": "2.0", "id": 1, "method": "compile", "params": {"args": ["--input_path", "models"], "cwd": "/home"}}
+        {"jsonrpc": "2.0", "id": 1, "result": {"errors_occurred": false, "messages": [...], "files": [...]}}
+
+    The method "compile" processes the models as the command line interface does with the handed over arguments,
+    relative paths being resolved against the handed over working directory; "check" only checks the models, i.e., no
+    code is generated; "shutdown" stops the server. The messages are the ones which the command line interface would
+    print, as stored by --store_log; the files are the ones generated, or found up to date, for the models of the
+    request. Requests are processed one after another. The predefined symbols are registered once and reused by all
+    requests, as they do not depend on the arguments; the units and types derived by earlier requests are discarded.
+
+    Attributes:
+        stopped  Indicates whether the server has been requested to stop. Type: bool
+    """
+    STDIO_ADDRESS = '-'
+    METHODS = ('compile', 'check', 'shutdown')
+    # the error codes defined by JSON-RPC 2.0
+    PARSE_ERROR = -32700
+    INVALID_REQUEST = -32600
+    METHOD_NOT_FOUND = -32601
+    INVALID_PARAMS = -32602
+    INTERNAL_ERROR = -32603
+
+    class InvalidParamsException(Exception):
+        """
+        This exception is thrown whenever the parameters of a request are invalid, e.g., the handed over arguments.
+        """
+        pass
+
+    class RequestHandler(socketserver.StreamRequestHandler):
+        """
+        Handles the requests received via a single connection to the socket.
+        """
+
+        def handle(self):
+            for line in self.rfile:
+                response = self.server.compile_server.handle_line(line.decode('utf-8'))
+                if response is not None:
+                    self.wfile.write((response + '\n').encode('utf-8'))
+                    self.wfile.flush()
+                if self.server.compile_server.stopped:
+                    break
+
+    def __init__(self):
+        """
+        Standard constructor.
+        """
+        self.stopped = False
+
+    def serve(self, address):
+        """
+        Processes requests until the server is requested to stop or, if requests are read from the standard input,
+        until it is closed.
+        :param address: the path to a Unix domain socket, or "-" for the standard streams.
+        :type address: str
+        :return: the exit code of the process.
+        :rtype: int
+        """
+        # the responses are the only output of the server, everything else is printed to the standard error
+        Logger.no_print = True
+        output_stream = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            self.warm_up()
+            if address == self.STDIO_ADDRESS:
+                self.serve_streams(sys.stdin, output_stream)
+            else:
+                self.serve_socket(address)
+        return 0
+
+    def warm_up(self):
+        """
+        Loads everything which is required to process models, such that the first request is processed as fast as all
+        later ones.
+        """
+        from pynestml.frontend.pynestml_frontend import init_caches, init_predefined
+
+        # the modules which take long to import are only imported once models are processed, cf. pynestml_frontend
+        for module_name in ['odetoolbox', 'pynestml.cocos.co_cos_manager', 'pynestml.utils.model_parser']:
+            importlib.import_module(module_name)
+        FrontendConfiguration.handle_cache_path(None)
+        init_caches()
+        init_predefined()
+        CodeGenerator(target='NEST').get_target_code_generator()
+
+    def serve_streams(self, input_stream, output_stream):
+        """
+        Processes the requests read from the handed over stream until it is closed or the server is requested to stop.
+        :param input_stream: the stream the requests are read from.
+        :type input_stream: io.TextIOBase
+        :param output_stream: the stream the responses are written to.
+        :type output_stream: io.TextIOBase
+        """
+        for line in input_stream:
+            response = self.handle_line(line)
+            if response is not None:
+                output_stream.write(response + '\n')
+                output_stream.flush()
+            if self.stopped:
+                break
+
+    def serve_socket(self, path):
+        """
+        Processes the requests received via the Unix domain socket at the handed over path until the server is
+        requested to stop. A socket left over by a server which is not running anymore is replaced.
+        :param path: the path to the socket.
+        :type path: str
+        """
+        if os.path.exists(path):
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise Exception('Cannot serve at "' + path + '": the file exists and is not a socket')
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                    client.connect(path)
+                raise Exception('Cannot serve at "' + path + '": another server is running')
+            except ConnectionRefusedError:
+                os.remove(path)
+        server = socketserver.UnixStreamServer(path, CompileServer.RequestHandler)
+        server.compile_server = self
+        try:
+            while not self.stopped:
+                server.handle_request()
+        finally:
+            server.server_close()
+            os.remove(path)
+
+    def handle_line(self, line):
+        """
+        Handles a single request in JSON notation.
+        :param line: the request.
+        :type line: str
+        :return: the response in JSON notation, or None if the request is a notification, i.e., has no id.
+        :rtype: str
+        """
+        if not line.strip():
+            return None
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return json.dumps(dict(self.get_error_response(self.PARSE_ERROR, str(e)), id=None))
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return json.dumps(dict(self.get_error_response(self.INVALID_REQUEST, 'Not a valid JSON-RPC request'),
+                                   id=None))
+        response = self.handle_request(request['method'], request.get('params', {}))
+        if 'id' not in request:
+            return None
+        response['id'] = request['id']
+        return json.dumps(response)
+
+    def handle_request(self, method, params):
+        """
+        Handles a single request and never throws, such that the server keeps running.
+        :param method: the requested method.
+        :type method: str
+        :param params: the parameters of the request.
+        :type params: dict
+        :return: the response without id.
+        :rtype: dict
+        """
+        if method not in self.METHODS:
+            return self.get_error_response(self.METHOD_NOT_FOUND, 'Unknown method "' + method + '"')
+        if method == 'shutdown':
+            self.stopped = True
+            return {'jsonrpc': '2.0', 'result': None}
+        try:
+            return {'jsonrpc': '2.0', 'result': self.process(params, check_only=method == 'check')}
+        except CompileServer.InvalidParamsException as e:
+            return self.get_error_response(self.INVALID_PARAMS, str(e))
+        except Exception as e:
+            return self.get_error_response(self.INTERNAL_ERROR, type(e).__name__ + ': ' + str(e))
+
+    def process(self, params, check_only=False):
+        """
+        Processes the models as the command line interface does with the handed over arguments.
+        :param params: the parameters of the request, i.e., the arguments and the working directory.
+        :type params: dict
+        :param check_only: whether the models shall only be checked, i.e., no code shall be generated.
+        :type check_only: bool
+        :return: whether errors occurred, the messages and the generated files.
+        :rtype: dict
+        """
+        from pynestml.frontend.pynestml_frontend import process
+
+        if not isinstance(params, dict) or not isinstance(params.get('args'), list) or \
+                not all(isinstance(arg, str) for arg in params['args']):
+            raise CompileServer.InvalidParamsException('The parameter "args" has to be a list of strings')
+        args = list(params['args'])
+        if check_only:
+            args.extend([qualifier_target_arg, 'none'])
+        cwd = os.getcwd()
+        try:
+            if params.get('cwd') is not None:
+                os.chdir(params['cwd'])
+            self.parse_config(args)
+            Logger.start_recording()
+            BuildManifest.touched_files = set()
+            try:
+                errors_occurred = process(reuse_predefined=True)
+            finally:
+                messages = Logger.stop_recording()
+                generated_files = sorted(BuildManifest.touched_files)
+                BuildManifest.touched_files = None
+        finally:
+            os.chdir(cwd)
+        return {'errors_occurred': bool(errors_occurred),
+                'messages': [Logger.to_json_object(neuron.get_artifact_name() if neuron is not None else None, neuron,
+                                                   log_level, code, error_position, message)
+                             for (neuron, code, message, error_position, log_level) in
+                             [entry for entry in messages if not isinstance(entry, str)]
+                             if Logger.logging_level.value <= log_level.value],
+                'files': generated_files}
+
+    def parse_config(self, args):
+        """
+        Configures the frontend by the handed over arguments.
+        :param args: the arguments as handed over to the command line interface.
+        :type args: list(str)
+        """
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                FrontendConfiguration.parse_config(args)
+        except SystemExit:
+            # the arguments are invalid, or the help message has been requested
+            raise CompileServer.InvalidParamsException(output.getvalue().strip())
+        except Exception as e:
+            raise CompileServer.InvalidParamsException(str(e))
+        if FrontendConfiguration.get_serve_address() is not None or FrontendConfiguration.watch:
+            raise CompileServer.InvalidParamsException('The server cannot be requested to serve or to watch')
+
+    @classmethod
+    def get_error_response(cls, code, message):
+        """
+        Returns a response which reports the handed over error.
+        :param code: the JSON-RPC error code.
+        :type code: int
+        :param message: a description of the error.
+        :type message: str
+        :return: the response.
+        :rtype: dict
+        """
+        return {'jsonrpc': '2.0', 'error': {'code': code, 'message': message}}
@@ -34,9 +34,17 @@ help_target_path = 'Path to a target directory where models should be generated
 help_target = 'Name of the target platform to build code for. Default is NEST.'
 help_logging = 'Indicates which messages shall be logged and printed to the screen. Standard is ERROR.'
 help_module = 'Indicates the name of the module. Optional. If not indicated, the name of the directory containing the models is used'
-help_log = 'Indicates whether a log file containing all messages shall be stored. Standard is NO.'
+help_log = 'Indicates whether a log file containing all messages shall be stored. The messages are also streamed to "report/log.jsonl" while they are received. Standard is NO.'
 help_suffix = 'A suffix string that will be appended to the name of all generated models.'
 help_dev = 'Enable development mode: code generation is attempted even for models that contain errors, and extra information is rendered in the generated code.'
+help_no_cache = 'Disables the cache of parsed models, predefined units, results of ode-toolbox and compiled templates, i.e., all models are parsed and analysed again.'
+help_clear_cache = 'Deletes all cached results before the models are processed.'
+help_cache_path = 'Path to a directory in which results are cached across runs. Standard is "$XDG_CACHE_HOME/nestml" or "~/.cache/nestml".'
+help_reproducible = 'Generate byte-identical code for identical models: the time of generation is taken from the SOURCE_DATE_EPOCH environment variable or omitted.'
+help_profile = 'Record the wall time, number of calls and peak memory of each phase of the toolchain per neuron, print a summary and store a report as "report/profile.json" next to the target directory.'
+help_jobs = 'Number of processes used to parse, check and generate code for the input files in parallel. Standard is 1.'
+help_watch = 'Process the models again whenever a file of the input path is added, modified or removed, until interrupted. Only the changed files are parsed, checked and generated again.'
+help_serve = 'Keep a single process running, which processes models on request, e.g., by "nestml-client". Requests are read from the Unix domain socket SOCKET, or from the standard input if no socket is given. All other arguments are handed over with each request.'
 
 qualifier_input_path_arg = '--input_path'
 qualifier_target_path_arg = '--target_path'
@@ -46,6 +54,14 @@ qualifier_module_name_arg = '--module_name'
 qualifier_store_log_arg = '--store_log'
 qualifier_suffix_arg = '--suffix'
 qualifier_dev_arg = '--dev'
+qualifier_jobs_arg = '--jobs'
+qualifier_reproducible_arg = '--reproducible'
+qualifier_no_cache_arg = '--no_cache'
+qualifier_clear_cache_arg = '--clear_cache'
+qualifier_cache_path_arg = '--cache_path'
+qualifier_profile_arg = '--profile'
+qualifier_watch_arg = '--watch'
+qualifier_serve_arg = '--serve'
 
 
 class FrontendConfiguration(object):
@@ -62,6 +78,15 @@ class FrontendConfiguration(object):
     store_log = False
     suffix = ''
     is_dev = False
+    is_reproducible = False
+    jobs = 1
+    use_cache = True
+    clear_cache = False
+    cache_path = None
+    profile = False
+    watch = False
+    serve = None
+    args = None
 
     @classmethod
     def parse_config(cls, args):
@@ -80,7 +105,7 @@ appropriate numeric solver otherwise.
 
  Version ''' + str(pynestml.__version__), formatter_class=argparse.RawDescriptionHelpFormatter)
 
-        cls.argument_parser.add_argument(qualifier_input_path_arg, metavar='PATH', type=str, help=help_input_path, required=True)
+        cls.argument_parser.add_argument(qualifier_input_path_arg, metavar='PATH', type=str, help=help_input_path)
         cls.argument_parser.add_argument(qualifier_target_path_arg, metavar='PATH', type=str, help=help_target_path)
         cls.argument_parser.add_argument(qualifier_target_arg, choices=['NEST', 'autodoc', 'none'], type=str, help=help_target, default='NEST')
         cls.argument_parser.add_argument(qualifier_logging_level_arg, metavar='{INFO, WARNING, ERROR, NONE}', choices=['INFO', 'WARNING', 'WARNINGS', 'ERROR', 'ERRORS', 'NONE', 'NO'], type=str, help=help_logging, default='ERROR')
@@ -88,8 +113,26 @@ appropriate numeric solver otherwise.
         cls.argument_parser.add_argument(qualifier_store_log_arg, action='store_true', help=help_log)
         cls.argument_parser.add_argument(qualifier_suffix_arg, metavar='SUFFIX', type=str, help=help_suffix, default='')
         cls.argument_parser.add_argument(qualifier_dev_arg, action='store_true', help=help_dev)
+        cls.argument_parser.add_argument(qualifier_reproducible_arg, action='store_true', help=help_reproducible)
+        cls.argument_parser.add_argument(qualifier_jobs_arg, metavar='N', type=int, help=help_jobs, default=1)
+        cls.argument_parser.add_argument(qualifier_no_cache_arg, action='store_true', help=help_no_cache)
+        cls.argument_parser.add_argument(qualifier_clear_cache_arg, action='store_true', help=help_clear_cache)
+        cls.argument_parser.add_argument(qualifier_cache_path_arg, metavar='PATH', type=str, help=help_cache_path)
+        cls.argument_parser.add_argument(qualifier_profile_arg, action='store_true', help=help_profile)
+        cls.argument_parser.add_argument(qualifier_watch_arg, action='store_true', help=help_watch)
+        cls.argument_parser.add_argument(qualifier_serve_arg, metavar='SOCKET', nargs='?', const='-', type=str, help=help_serve)
         parsed_args = cls.argument_parser.parse_args(args)
 
+        # keep the arguments around, e.g., to configure worker processes in the same way
+        cls.args = list(args)
+
+        # the server processes the models as handed over with each request, thus all other arguments are ignored
+        cls.serve = parsed_args.serve
+        if cls.serve is not None:
+            return
+        if parsed_args.input_path is None:
+            cls.argument_parser.error('the following arguments are required: ' + qualifier_input_path_arg)
+
         # initialize the logger
         cls.logging_level = parsed_args.logging_level
         Logger.init_logger(Logger.string_to_level(parsed_args.logging_level))
@@ -121,6 +164,17 @@ appropriate numeric solver otherwise.
         cls.store_log = parsed_args.store_log
         cls.suffix = parsed_args.suffix
         cls.is_dev = parsed_args.dev
+        cls.is_reproducible = parsed_args.reproducible
+
+        if parsed_args.jobs < 1:
+            raise Exception('Invalid number of jobs specified ("' + str(parsed_args.jobs) + '"): at least one job is required')
+        cls.jobs = parsed_args.jobs
+
+        cls.use_cache = not parsed_args.no_cache
+        cls.clear_cache = parsed_args.clear_cache
+        cls.handle_cache_path(parsed_args.cache_path)
+        cls.profile = parsed_args.profile
+        cls.watch = parsed_args.watch
 
     @classmethod
     def get_path(cls):
@@ -185,6 +239,43 @@ appropriate numeric solver otherwise.
         """
         return cls.is_dev
 
+    @classmethod
+    def get_jobs(cls):
+        """
+        Returns the number of processes which shall be used to process the input files.
+        :return: the number of jobs.
+        :rtype: int
+        """
+        return cls.jobs
+
+    @classmethod
+    def get_cache_path(cls):
+        """
+        Returns the path to the directory in which results are cached across runs.
+        :return: the cache path.
+        :rtype: str
+        """
+        return cls.cache_path
+
+    @classmethod
+    def get_serve_address(cls):
+        """
+        Returns the address at which models shall be processed on request.
+        :return: the path to a Unix domain socket, "-" for the standard streams, or None if the models handed over as
+                 input path shall be processed.
+        :rtype: str
+        """
+        return cls.serve
+
+    @classmethod
+    def get_args(cls):
+        """
+        Returns the arguments as handed over to the frontend.
+        :return: a list of arguments.
+        :rtype: list(str)
+        """
+        return cls.args
+
     @classmethod
     def handle_target(cls, target):
         if target is None or target.upper() == 'NONE':
@@ -214,6 +305,15 @@ appropriate numeric solver otherwise.
         if not os.path.isdir(cls.target_path):
             os.makedirs(cls.target_path)
 
+    @classmethod
+    def handle_cache_path(cls, path):
+        # check if a cache path has been selected, otherwise use the per-user cache directory
+        if path is not None:
+            cls.cache_path = os.path.abspath(path)
+        else:
+            cache_home = os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+            cls.cache_path = os.path.join(cache_home, 'nestml')
+
     @classmethod
     def handle_input_path(cls, path):
         if path is None or path == '':
@@ -228,14 +328,28 @@ appropriate numeric solver otherwise.
             pynestml_dir = os.getcwd()
             cls.provided_path = os.path.join(pynestml_dir, path)
 
-        if os.path.isfile(cls.provided_path):
-            cls.paths_to_compilation_units.append(cls.provided_path)
-        elif os.path.isdir(cls.provided_path):
-            for filename in os.listdir(cls.provided_path):
-                if filename.endswith('.nestml'):
-                    cls.paths_to_compilation_units.append(os.path.join(cls.provided_path, filename))
+        if os.path.isfile(cls.provided_path) or os.path.isdir(cls.provided_path):
+            cls.paths_to_compilation_units.extend(cls.list_files(cls.provided_path))
         else:
             # input_path should be either a file or a directory
             code, message = Messages.get_input_path_not_found(path=cls.provided_path)
             Logger.log_message(code=code, message=message, log_level=LoggingLevel.ERROR)
             raise Exception(message)
+
+    @classmethod
+    def list_files(cls, path):
+        """
+        Returns the files to process for the handed over input path, i.e., the path itself if it is a file, or all
+        models contained in it if it is a directory.
+        :param path: the absolute input path.
+        :type path: str
+        :return: a list of paths to files, which is empty if the path does not exist.
+        :rtype: list(str)
+        """
+        if os.path.isfile(path):
+            return [path]
+        if os.path.isdir(path):
+            # sorted, since the order of the neurons is rendered into the module files
+            return [os.path.join(path, filename) for filename in sorted(os.listdir(path))
+                    if filename.endswith('.nestml')]
+        return []
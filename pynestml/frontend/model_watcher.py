@@ -0,0 +1,186 @@
+#
+# model_watcher.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import time
+
+from pynestml.codegeneration.codegenerator import CodeGenerator
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.utils.disk_cache import DiskCache
+from pynestml.utils.logger import Logger, LoggingLevel
+from pynestml.utils.messages import Messages
+
+
+class ModelWatcher(object):
+    """
+    This class processes the models of the input path as the command line interface does, and then processes them
+    again whenever a file of the input path is added, modified or removed. The files are polled; only the changed
+    files are parsed, checked and generated again, whereas the compilation units and the (transformed) neurons of all
+    other files are kept in memory, such that the module code and the check for neurons with the same name across
+    files can take all models into account.
+
+        ModelWatcher().watch()
+
+    Attributes:
+        interval            The time between two polls of the input path in seconds. Type: float
+        states              A dict from the paths of all processed files to their modification time and size at the
+                            time of processing. Type: dict(str,(int,int))
+        compilation_units   A dict from the paths of all processed files to their compilation units, or None if a file
+                            could not be parsed. Type: dict(str,ASTNestMLCompilationUnit)
+        neurons             A dict from the paths of all processed files to the neurons for which code has been
+                            generated. Type: dict(str,list(ASTNeuron))
+        errors              A dict from the paths of all processed files to whether errors occurred. Type: dict(str,bool)
+    """
+    DEFAULT_INTERVAL = 0.5
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        """
+        Standard constructor.
+        :param interval: the time between two polls of the input path in seconds.
+        :type interval: float
+        """
+        self.interval = interval
+        self.states = dict()
+        self.compilation_units = dict()
+        self.neurons = dict()
+        self.errors = dict()
+
+    def watch(self):
+        """
+        Processes the models and waits for changes until interrupted. If processing fails, the failure is reported
+        and the watching goes on.
+        :return: the exit code of the process, i.e., 1 if errors occurred in the last processing of any file.
+        :rtype: int
+        """
+        from pynestml.frontend.pynestml_frontend import create_report_dir, init_caches, init_predefined
+
+        create_report_dir()
+        if FrontendConfiguration.clear_cache:
+            DiskCache(FrontendConfiguration.get_cache_path()).clear()
+        init_caches()
+        init_predefined()
+        try:
+            while True:
+                changed_paths, removed_paths = self.get_changes()
+                if len(changed_paths) > 0 or len(removed_paths) > 0:
+                    try:
+                        self.process_changes(changed_paths, removed_paths)
+                    except Exception as e:
+                        self.report_failure(changed_paths, e)
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+        return int(any(self.errors.values()))
+
+    @classmethod
+    def get_state(cls, path):
+        """
+        Returns the state of the handed over file, which changes whenever the file is modified.
+        :param path: the path to a file.
+        :type path: str
+        :return: the modification time in ns and the size, or None if the file does not exist.
+        :rtype: (int,int)
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def get_changes(self):
+        """
+        Returns the files of the input path which have been added or modified, and the processed files which have been
+        removed, since they have been processed.
+        :return: the paths of the changed files, in the order of the input path, and of the removed files.
+        :rtype: (list(str),list(str))
+        """
+        FrontendConfiguration.paths_to_compilation_units = FrontendConfiguration.list_files(
+            FrontendConfiguration.get_path())
+        changed_paths = [path for path in FrontendConfiguration.get_files()
+                         if path not in self.states or self.get_state(path) != self.states[path]]
+        removed_paths = [path for path in self.states if path not in FrontendConfiguration.get_files()]
+        return changed_paths, removed_paths
+
+    def process_changes(self, changed_paths, removed_paths):
+        """
+        Parses, checks and generates code for the handed over changed files, and generates the module code for the
+        neurons of all files.
+        :param changed_paths: the paths of the added or modified files.
+        :type changed_paths: list(str)
+        :param removed_paths: the paths of the removed files.
+        :type removed_paths: list(str)
+        """
+        from pynestml.cocos.co_cos_manager import CoCosManager
+        from pynestml.frontend.pynestml_frontend import exclude_neurons_with_errors, store_log_to_file
+        from pynestml.utils.model_parser import ModelParser
+
+        # the messages of the files which have not changed have been reported before
+        Logger.init_logger(Logger.string_to_level(FrontendConfiguration.get_logging_level()))
+        for path in removed_paths:
+            for entries in [self.states, self.compilation_units, self.neurons, self.errors]:
+                del entries[path]
+        for path in changed_paths:
+            # the state is taken before the file is read, such that modifications while processing are not missed
+            self.states[path] = self.get_state(path)
+            # the entries are reset first, such that no stale entries are kept if processing fails
+            self.compilation_units[path] = None
+            self.neurons[path] = list()
+            self.errors[path] = True
+            self.compilation_units[path] = ModelParser.parse_model(path)
+            self.errors[path] = self.compilation_units[path] is None
+            if self.compilation_units[path] is not None:
+                self.neurons[path].extend(self.compilation_units[path].get_neuron_list())
+                self.errors[path] = exclude_neurons_with_errors(self.neurons[path])
+        CoCosManager.check_not_two_neurons_across_units([self.compilation_units[path]
+                                                         for path in FrontendConfiguration.get_files()
+                                                         if self.compilation_units.get(path) is not None])
+        code_generator = CodeGenerator(target=FrontendConfiguration.get_target()).get_target_code_generator()
+        if code_generator is None:
+            code, message = Messages.get_no_code_generated()
+            Logger.log_message(None, code, message, None, LoggingLevel.INFO)
+        else:
+            changed_neurons = [neuron for path in changed_paths for neuron in self.neurons[path]]
+            code_generator.analyse_transform_neurons(changed_neurons)
+            code_generator.generate_neurons(changed_neurons)
+            code_generator.generate_module_code([neuron for path in FrontendConfiguration.get_files()
+                                                 for neuron in self.neurons[path]])
+            for path in changed_paths:
+                self.errors[path] = self.errors[path] or any(Logger.has_errors(neuron) for neuron in self.neurons[path])
+        if FrontendConfiguration.store_log:
+            store_log_to_file()
+
+    def report_failure(self, changed_paths, exception):
+        """
+        Reports that processing the handed over changed files has failed with an exception and marks those of them
+        which have been processed in part as erroneous. They are processed again as soon as they are modified, whereas
+        the files which have not been reached are processed on the next poll.
+        :param changed_paths: the paths of the added or modified files.
+        :type changed_paths: list(str)
+        :param exception: the exception by which processing has failed.
+        :type exception: Exception
+        """
+        from pynestml.frontend.pynestml_frontend import store_log_to_file
+
+        for path in changed_paths:
+            if path in self.states:
+                self.errors[path] = True
+                code, message = Messages.get_processing_failed(path, exception)
+                Logger.log_message(None, code, message, None, LoggingLevel.ERROR)
+        if FrontendConfiguration.store_log:
+            store_log_to_file()
@@ -18,26 +18,38 @@
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
+import contextlib
+import importlib
+import io
+import multiprocessing
 import os
 import sys
 
-from pynestml.cocos.co_cos_manager import CoCosManager
 from pynestml.codegeneration.codegenerator import CodeGenerator
 from pynestml.frontend.frontend_configuration import FrontendConfiguration, InvalidPathException, \
     qualifier_store_log_arg, qualifier_module_name_arg, qualifier_logging_level_arg, \
-    qualifier_target_arg, qualifier_target_path_arg, qualifier_input_path_arg, qualifier_suffix_arg, qualifier_dev_arg
-from pynestml.symbols.predefined_functions import PredefinedFunctions
-from pynestml.symbols.predefined_types import PredefinedTypes
-from pynestml.symbols.predefined_units import PredefinedUnits
-from pynestml.symbols.predefined_variables import PredefinedVariables
-from pynestml.utils.logger import Logger, LoggingLevel
-from pynestml.utils.messages import Messages
-from pynestml.utils.model_parser import ModelParser
+    qualifier_target_arg, qualifier_target_path_arg, qualifier_input_path_arg, qualifier_suffix_arg, qualifier_dev_arg, \
+    qualifier_reproducible_arg, qualifier_jobs_arg, qualifier_no_cache_arg, qualifier_clear_cache_arg, \
+    qualifier_cache_path_arg, qualifier_profile_arg
+from pynestml.utils.disk_cache import DiskCache
+from pynestml.utils.log_sink import LogSink
+from pynestml.utils.logger import Logger, LoggingLevel, OutputRecorder
+from pynestml.utils.messages import MessageCode, Messages
 from pynestml.utils.model_installer import install_nest as nest_installer
+from pynestml.utils.profiler import Profiler
+
+# N.B. the model parser, the context conditions and the predefined symbols depend on astropy (and the code generators
+# on sympy and odetoolbox), which take long to import. They are therefore only imported once models are processed,
+# such that, e.g., printing the help message is fast.
+
+# the units and types as registered by init_predefined(), without the ones derived while processing models, such that
+# they can be restored by restore_predefined()
+registered_predefined = None
 
 
 def to_nest(input_path, target_path=None, logging_level='ERROR',
-            module_name=None, store_log=False, suffix="", dev=False):
+            module_name=None, store_log=False, suffix="", dev=False, reproducible=False, jobs=1, no_cache=False,
+            clear_cache=False, cache_path=None, profile=False):
     '''Translate NESTML files into their equivalent C++ code for the NEST simulator.
 
     Parameters
@@ -56,6 +68,18 @@ def to_nest(input_path, target_path=None, logging_level='ERROR',
         Suffix which will be appended to the model's name (internal use to avoid naming conflicts with existing NEST models).
     dev : bool, optional (default: False)
         Enable development mode: code generation is attempted even for models that contain errors, and extra information is rendered in the generated code.
+    reproducible : bool, optional (default: False)
+        Generate byte-identical code for identical models: the time of generation is taken from the SOURCE_DATE_EPOCH environment variable or omitted.
+    jobs : int, optional (default: 1)
+        Number of processes used to parse, check and generate code for the input files in parallel.
+    no_cache : bool, optional (default: False)
+        Disable the cache of parsed models, i.e., parse all models again.
+    clear_cache : bool, optional (default: False)
+        Delete all cached results before the models are processed.
+    cache_path : str, optional (default: "~/.cache/nestml")
+        Path to a directory in which results are cached across runs.
+    profile : bool, optional (default: False)
+        Record the wall time, number of calls and peak memory of each phase of the toolchain per neuron, print a summary and store a report in JSON format next to the log. The records can also be retrieved by means of `Profiler.get_report()`.
     '''
     # if target_path is not None and not os.path.isabs(target_path):
     #    print('PyNestML: Please provide absolute target path!')
@@ -87,6 +111,26 @@ def to_nest(input_path, target_path=None, logging_level='ERROR',
     if dev:
         args.append(qualifier_dev_arg)
 
+    if reproducible:
+        args.append(qualifier_reproducible_arg)
+
+    if jobs != 1:
+        args.append(qualifier_jobs_arg)
+        args.append(str(jobs))
+
+    if no_cache:
+        args.append(qualifier_no_cache_arg)
+
+    if clear_cache:
+        args.append(qualifier_clear_cache_arg)
+
+    if cache_path is not None:
+        args.append(qualifier_cache_path_arg)
+        args.append(str(cache_path))
+
+    if profile:
+        args.append(qualifier_profile_arg)
+
     FrontendConfiguration.parse_config(args)
     if not process() == 0:
         raise Exception("Error(s) occurred while processing the model")
@@ -122,68 +166,305 @@ def main():
     except InvalidPathException:
         print('Not a valid path to model or directory: "%s"!' % FrontendConfiguration.get_path())
         return 1
+    if FrontendConfiguration.get_serve_address() is not None:
+        from pynestml.frontend.compile_server import CompileServer
+        return CompileServer().serve(FrontendConfiguration.get_serve_address())
+    if FrontendConfiguration.watch:
+        from pynestml.frontend.model_watcher import ModelWatcher
+        return ModelWatcher().watch()
     # after all argument have been collected, start the actual processing
     return int(process())
 
 
-def process():
+def process(reuse_predefined=False):
     """
+    Parameters
+    ----------
+    reuse_predefined : bool, optional (default: False)
+        Reuse the predefined symbols registered by an earlier run in this process. They do not depend on the
+        configuration, but only on the versions of PyNestML and astropy. The units and types derived by the earlier
+        run are discarded.
+
     Returns
     -------
     errors_occurred : bool
         Flag indicating whether errors occurred during processing
     """
 
+    from pynestml.cocos.co_cos_manager import CoCosManager
+    from pynestml.utils.model_parser import ModelParser
+
     errors_occurred = False
 
     # init log dir
     create_report_dir()
-    # The handed over parameters seem to be correct, proceed with the main routine
-    init_predefined()
-    # now proceed to parse all models
+    if FrontendConfiguration.store_log:
+        # the messages are streamed to the report while they are received, such that they are kept if the run aborts
+        Logger.set_sink(LogSink(os.path.join(FrontendConfiguration.get_target_path(), '..', 'report', 'log.jsonl')))
+    try:
+        if FrontendConfiguration.profile:
+            Profiler.enable()
+        with Profiler.phase('process'):
+            # The handed over parameters seem to be correct, proceed with the main routine
+            if FrontendConfiguration.clear_cache:
+                DiskCache(FrontendConfiguration.get_cache_path()).clear()
+            init_caches()
+            if not (reuse_predefined and restore_predefined()):
+                init_predefined()
+            if FrontendConfiguration.get_target().upper() == 'NEST':
+                # ode-toolbox prints warnings when it is imported, which are thus printed once and before the output
+                # of the models, also if these are processed by several worker processes
+                importlib.import_module('odetoolbox')
+            # now proceed to parse all models
+            nestml_files = FrontendConfiguration.get_files()
+            if not type(nestml_files) is list:
+                nestml_files = [nestml_files]
+            if FrontendConfiguration.get_jobs() > 1 and len(nestml_files) > 1:
+                errors_occurred = process_in_parallel(nestml_files)
+            else:
+                compilation_units = list()
+                for nestml_file in nestml_files:
+                    parsed_unit = ModelParser.parse_model(nestml_file)
+                    if parsed_unit is not None:
+                        compilation_units.append(parsed_unit)
+                if len(compilation_units) > 0:
+                    # generate a list of all neurons
+                    neurons = list()
+                    for compilationUnit in compilation_units:
+                        neurons.extend(compilationUnit.get_neuron_list())
+                    # check if across two files two neurons with same name have been defined
+                    CoCosManager.check_not_two_neurons_across_units(compilation_units)
+                    # now exclude those which are broken, i.e. have errors.
+                    errors_occurred = exclude_neurons_with_errors(neurons)
+                    # perform code generation
+                    _codeGenerator = CodeGenerator(target=FrontendConfiguration.get_target())
+                    _codeGenerator.generate_code(neurons)
+                    for neuron in neurons:
+                        if Logger.has_errors(neuron):
+                            errors_occurred = True
+                            break
+    finally:
+        if Logger.sink is not None:
+            Logger.sink.close()
+            Logger.set_sink(None)
+        if FrontendConfiguration.profile:
+            # also if processing failed, such that the profiler does not stay enabled, e.g., in the compile server
+            Profiler.disable()
+            print(Profiler.get_summary())
+            Profiler.store_report(os.path.join(FrontendConfiguration.get_target_path(), '..', 'report',
+                                               'profile.json'))
+    if FrontendConfiguration.store_log:
+        store_log_to_file()
+    return errors_occurred
+
+
+def process_in_parallel(nestml_files):
+    """
+    Parses, checks and generates code for each of the handed over files in a separate worker process. The workers
+    record the messages and the output of each phase separately, which are replayed phase by phase in the order of the
+    files, with the check across all compilation units after the parsing phase. Thus, the generated code, the log and
+    the output are the same as for a sequential run. As each file is processed with the predefined types only, the
+    message on the registration of a derived type is replayed for the first file which derives it only.
+    :param nestml_files: a list of paths to files.
+    :type nestml_files: list(str)
+    :return: True if errors occurred, otherwise False.
+    :rtype: bool
+    """
+    from pynestml.cocos.co_cos_manager import CoCosManager
+
+    errors_occurred = False
+    n_processes = min(FrontendConfiguration.get_jobs(), len(nestml_files))
+    with multiprocessing.Pool(n_processes, initializer=init_worker, initargs=(FrontendConfiguration.get_args(),)) \
+            as pool:
+        results = pool.map(process_file, nestml_files, chunksize=1)
+    registered_types = set()
     compilation_units = list()
-    nestml_files = FrontendConfiguration.get_files()
-    if not type(nestml_files) is list:
-        nestml_files = [nestml_files]
-    for nestml_file in nestml_files:
-        parsed_unit = ModelParser.parse_model(nestml_file)
+    neurons = list()
+    for (parsed_unit, generated_neurons, phase_messages, records, file_errors_occurred) in results:
+        replay_messages(phase_messages[0], registered_types)
+        Profiler.merge_records(records)
         if parsed_unit is not None:
             compilation_units.append(parsed_unit)
+            neurons.extend(generated_neurons)
+        errors_occurred = errors_occurred or file_errors_occurred
     if len(compilation_units) > 0:
-        # generate a list of all neurons
-        neurons = list()
-        for compilationUnit in compilation_units:
-            neurons.extend(compilationUnit.get_neuron_list())
-        # check if across two files two neurons with same name have been defined
         CoCosManager.check_not_two_neurons_across_units(compilation_units)
-        # now exclude those which are broken, i.e. have errors.
-        if not FrontendConfiguration.is_dev:
-            for neuron in neurons:
-                if Logger.has_errors(neuron):
-                    code, message = Messages.get_neuron_contains_errors(neuron.get_name())
-                    Logger.log_message(neuron=neuron, code=code, message=message,
-                                       error_position=neuron.get_source_position(),
-                                       log_level=LoggingLevel.INFO)
-                    neurons.remove(neuron)
-                    errors_occurred = True
-        # perform code generation
-        _codeGenerator = CodeGenerator(target=FrontendConfiguration.get_target())
-        _codeGenerator.generate_code(neurons)
-        for neuron in neurons:
+        # the remaining phases are the exclusion of neurons with errors, the analysis and the generation of code
+        all_phase_messages = [result[2] for result in results]
+        for phase in range(1, len(all_phase_messages[0])):
+            for phase_messages in all_phase_messages:
+                replay_messages(phase_messages[phase], registered_types)
+        _codeGenerator = CodeGenerator(target=FrontendConfiguration.get_target()).get_target_code_generator()
+        if _codeGenerator is not None:
+            _codeGenerator.generate_module_code(neurons)
+        else:
+            code, message = Messages.get_no_code_generated()
+            Logger.log_message(None, code, message, None, LoggingLevel.INFO)
+    return errors_occurred
+
+
+def replay_messages(messages, registered_types):
+    """
+    Replays the handed over messages and output recorded by a worker process of process_in_parallel(). A message on
+    the registration of a type is discarded if it has been replayed before, since the main process of a sequential run
+    registers each type once.
+    :param messages: the messages and output as recorded by the worker.
+    :type messages: list((ASTNeuron,MessageCode,str,ASTSourceLocation,LoggingLevel) or str)
+    :param registered_types: the messages on the registration of types replayed so far, which is updated.
+    :type registered_types: set(str)
+    """
+    for entry in messages:
+        if not isinstance(entry, str) and entry[1] == MessageCode.TYPE_REGISTERED:
+            if entry[2] in registered_types:
+                continue
+            registered_types.add(entry[2])
+        Logger.replay_messages([entry])
+
+
+def init_worker(args):
+    """
+    Initializes a worker process of process_in_parallel() with the same configuration as the main process. Messages
+    are not printed by the worker, but handed back to the main process.
+    :param args: the arguments as handed over to the frontend.
+    :type args: list(str)
+    """
+    Logger.no_print = True
+    # the messages of the worker are streamed by the main process
+    Logger.set_sink(None)
+    FrontendConfiguration.parse_config(args)
+    if FrontendConfiguration.profile:
+        Profiler.enable()
+    init_caches()
+    init_predefined()
+    if FrontendConfiguration.get_target().upper() == 'NEST':
+        # the warnings on the import have been printed by the main process
+        with contextlib.redirect_stdout(io.StringIO()):
+            importlib.import_module('odetoolbox')
+
+
+def process_file(nestml_file):
+    """
+    Parses, checks and generates code for all neurons in a single file. Module-level code is not generated. This
+    function is executed in a worker process of process_in_parallel(). The units and types derived while processing
+    other files in the same process are discarded first, such that the messages on their registration do not depend on which
+    files the process has been assigned.
+    :param nestml_file: the path to the file.
+    :type nestml_file: str
+    :return: the compilation unit, the neurons for which code has been generated, the messages and output recorded in
+             each phase, i.e., parsing, exclusion of neurons with errors, analysis and generation, the profiling records
+             and whether errors occurred.
+    :rtype: (ASTNestMLCompilationUnit,list(ASTNeuron),list(list),(dict,dict),bool)
+    """
+    from pynestml.utils.model_parser import ModelParser
+
+    Logger.init_logger(Logger.string_to_level(FrontendConfiguration.get_logging_level()))
+    Profiler.reset()
+    restore_predefined()
+    errors_occurred = False
+    phase_messages = list()
+    with contextlib.redirect_stdout(OutputRecorder()):
+        Logger.start_recording()
+        parsed_unit = ModelParser.parse_model(nestml_file)
+        phase_messages.append(Logger.stop_recording())
+        neurons = list()
+        if parsed_unit is not None:
+            neurons.extend(parsed_unit.get_neuron_list())
+        Logger.start_recording()
+        errors_occurred = exclude_neurons_with_errors(neurons)
+        phase_messages.append(Logger.stop_recording())
+        _codeGenerator = None
+        if parsed_unit is not None:
+            _codeGenerator = CodeGenerator(target=FrontendConfiguration.get_target()).get_target_code_generator()
+        Logger.start_recording()
+        if _codeGenerator is not None:
+            _codeGenerator.analyse_transform_neurons(neurons)
+        phase_messages.append(Logger.stop_recording())
+        Logger.start_recording()
+        if _codeGenerator is not None:
+            _codeGenerator.generate_neurons(neurons)
+        phase_messages.append(Logger.stop_recording())
+    for neuron in neurons:
+        if Logger.has_errors(neuron):
+            errors_occurred = True
+            break
+    return parsed_unit, neurons, phase_messages, Profiler.get_records(), errors_occurred
+
+
+def exclude_neurons_with_errors(neurons):
+    """
+    Removes all neurons which contain errors from the handed over list, unless the development mode is enabled.
+    :param neurons: a list of neurons.
+    :type neurons: list(ASTNeuron)
+    :return: True if at least one neuron has been excluded, otherwise False.
+    :rtype: bool
+    """
+    errors_occurred = False
+    if not FrontendConfiguration.is_dev:
+        for neuron in list(neurons):
             if Logger.has_errors(neuron):
+                code, message = Messages.get_neuron_contains_errors(neuron.get_name())
+                Logger.log_message(neuron=neuron, code=code, message=message,
+                                   error_position=neuron.get_source_position(),
+                                   log_level=LoggingLevel.INFO)
+                neurons.remove(neuron)
                 errors_occurred = True
-                break
-    if FrontendConfiguration.store_log:
-        store_log_to_file()
     return errors_occurred
 
 
 def init_predefined():
     # initialize the predefined elements
+    from pynestml.symbols.predefined_functions import PredefinedFunctions
+    from pynestml.symbols.predefined_types import PredefinedTypes
+    from pynestml.symbols.predefined_units import PredefinedUnits
+    from pynestml.symbols.predefined_variables import PredefinedVariables
+    global registered_predefined
+
     PredefinedUnits.register_units()
     PredefinedTypes.register_types()
     PredefinedFunctions.register_functions()
     PredefinedVariables.register_variables()
+    registered_predefined = (dict(PredefinedUnits.get_units()), dict(PredefinedTypes.get_types()))
+
+
+def restore_predefined():
+    """
+    Restores the predefined units and types as registered by init_predefined(), i.e., discards the ones derived while
+    processing models since. The predefined functions and variables are not changed by processing.
+    :return: True if restored, or False if init_predefined() has not been called yet, i.e., has to be called.
+    :rtype: bool
+    """
+    from pynestml.symbols.predefined_types import PredefinedTypes
+    from pynestml.symbols.predefined_units import PredefinedUnits
+    from pynestml.utils.type_dictionary import TypeDictionary
+
+    if registered_predefined is None:
+        return False
+    PredefinedUnits.name2unit = dict(registered_predefined[0])
+    PredefinedTypes.name2type = TypeDictionary(registered_predefined[1])
+    return True
+
+
+def init_caches():
+    # set up the caches which persist results across runs
+    from pynestml.codegeneration.template_bytecode_cache import TemplateBytecodeCache
+    from pynestml.symbols.predefined_units import PredefinedUnits
+    from pynestml.utils.compilation_unit_pickler import CompilationUnitPickler, CompilationUnitUnpickler
+    from pynestml.utils.model_parser import ModelParser
+
+    if FrontendConfiguration.use_cache:
+        PredefinedUnits.snapshot_path = os.path.join(FrontendConfiguration.get_cache_path(), 'predefined_units.json')
+        CodeGenerator.ode_toolbox_cache = DiskCache(os.path.join(FrontendConfiguration.get_cache_path(), 'ode_toolbox'))
+        CodeGenerator.template_bytecode_cache = TemplateBytecodeCache(os.path.join(FrontendConfiguration.get_cache_path(),
+                                                                                   'templates'))
+        ModelParser.compilation_unit_cache = DiskCache(os.path.join(FrontendConfiguration.get_cache_path(),
+                                                                    'compilation_units'),
+                                                       pickler_class=CompilationUnitPickler,
+                                                       unpickler_class=CompilationUnitUnpickler)
+    else:
+        PredefinedUnits.snapshot_path = None
+        CodeGenerator.ode_toolbox_cache = None
+        CodeGenerator.template_bytecode_cache = None
+        ModelParser.compilation_unit_cache = None
 
 
 def create_report_dir():
@@ -36,6 +36,8 @@ class ASTArithmeticOperator(ASTNode):
         is_pow_op = False  # type:bool
     """
 
+    __slots__ = ('is_times_op', 'is_div_op', 'is_modulo_op', 'is_plus_op', 'is_minus_op', 'is_pow_op')
+
     def __init__(self, is_times_op:bool, is_div_op:bool, is_modulo_op:bool, is_plus_op:bool, is_minus_op:bool, is_pow_op:bool, *args, **kwargs):
         super(ASTArithmeticOperator, self).__init__(*args, **kwargs)
         assert ((is_times_op + is_div_op + is_modulo_op + is_plus_op + is_minus_op + is_pow_op) == 1), \
@@ -64,9 +66,9 @@ class ASTArithmeticOperator(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -89,6 +91,8 @@ class ASTArithmeticOperator(ASTNode):
         """
         if not isinstance(other, ASTArithmeticOperator):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return (self.is_times_op == other.is_times_op and self.is_div_op == other.is_div_op and
                 self.is_modulo_op == other.is_modulo_op and self.is_plus_op == other.is_plus_op and
                 self.is_minus_op == other.is_minus_op and self.is_pow_op == other.is_pow_op)
@@ -46,6 +46,9 @@ class ASTAssignment(ASTNode):
         rhs = None
     """
 
+    __slots__ = ('lhs', 'is_direct_assignment', 'is_compound_sum', 'is_compound_minus', 'is_compound_product',
+                 'is_compound_quotient', 'rhs')
+
     def __init__(self, lhs:Optional[ASTVariable]=None, is_direct_assignment:bool=False, is_compound_sum:bool=False, is_compound_minus:bool=False,
                  is_compound_product:bool=False, is_compound_quotient:bool=False, rhs:Optional[ASTExpression]=None, *args, **kwargs):
         """
@@ -101,9 +104,9 @@ class ASTAssignment(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -152,6 +155,8 @@ class ASTAssignment(ASTNode):
         """
         if not isinstance(other, ASTAssignment):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return (self.get_variable().equals(other.get_variable()) and
                 self.is_compound_quotient == other.is_compound_quotient and
                 self.is_compound_product == other.is_compound_product and
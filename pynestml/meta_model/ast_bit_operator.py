@@ -34,6 +34,8 @@ class ASTBitOperator(ASTNode):
         is_bit_shift_right = False
     """
 
+    __slots__ = ('is_bit_shift_right', 'is_bit_shift_left', 'is_bit_or', 'is_bit_xor', 'is_bit_and')
+
     def __init__(self, is_bit_and=False, is_bit_xor=False, is_bit_or=False, is_bit_shift_left=False,
                  is_bit_shift_right=False, *args, **kwargs):
         """
@@ -75,9 +77,9 @@ class ASTBitOperator(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -102,6 +104,8 @@ class ASTBitOperator(ASTNode):
         """
         if not isinstance(other, ASTBitOperator):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return (self.is_bit_and == other.is_bit_and and self.is_bit_or == other.is_bit_or and
                 self.is_bit_xor == other.is_bit_xor and self.is_bit_shift_left == self.is_bit_shift_left and
                 self.is_bit_shift_right == other.is_bit_shift_right)
@@ -30,6 +30,8 @@ class ASTBlock(ASTNode):
         stmts = None
     """
 
+    __slots__ = ('stmts',)
+
     def __init__(self, stmts, *args, **kwargs):
         """
         Standard constructor.
@@ -62,9 +64,9 @@ class ASTBlock(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -84,6 +86,7 @@ class ASTBlock(ASTNode):
         :type stmt: ASTSmallStmt,ASTCompoundStmt
         """
         self.stmts.append(stmt)
+        self.structure_modified()
 
     def delete_stmt(self, stmt):
         """
@@ -94,6 +97,19 @@ class ASTBlock(ASTNode):
         :rtype: bool
         """
         self.stmts.remove(stmt)
+        self.structure_modified()
+
+    def replace_stmt(self, stmt, new_stmts):
+        """
+        Replaces the handed over statement by a list of statements at the same position.
+        :param stmt: a statement of this block
+        :type stmt: ASTSmallStmt,ASTCompoundStmt
+        :param new_stmts: a list of statements
+        :type new_stmts: list(ASTSmallStmt,ASTCompoundStmt)
+        """
+        index = self.stmts.index(stmt)
+        self.stmts[index:index + 1] = new_stmts
+        self.structure_modified()
 
     def get_parent(self, ast):
         """
@@ -120,6 +136,8 @@ class ASTBlock(ASTNode):
         """
         if not isinstance(other, ASTBlock):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if len(self.get_stmts()) != len(other.get_stmts()):
             return False
         my_stmt = self.get_stmts()
@@ -47,6 +47,8 @@ class ASTBlockWithVariables(ASTNode):
         declarations = None
     """
 
+    __slots__ = ('declarations', 'is_internals', 'is_parameters', 'is_initial_values', 'is_state')
+
     def __init__(self, is_state=False, is_parameters=False, is_internals=False, is_initial_values=False,
                  declarations=None, *args, **kwargs):
         """
@@ -97,9 +99,9 @@ class ASTBlockWithVariables(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -118,6 +120,25 @@ class ASTBlockWithVariables(ASTNode):
         """
         del self.declarations
         self.declarations = list()
+        self.structure_modified()
+
+    def add_declaration(self, declaration):
+        """
+        Adds a single declaration to the end of this block.
+        :param declaration: a single declaration
+        :type declaration: ASTDeclaration
+        """
+        self.declarations.append(declaration)
+        self.structure_modified()
+
+    def delete_declaration(self, declaration):
+        """
+        Deletes the handed over declaration from this block.
+        :param declaration: a declaration of this block
+        :type declaration: ASTDeclaration
+        """
+        self.declarations.remove(declaration)
+        self.structure_modified()
 
     def get_parent(self, ast=None):
         """
@@ -144,6 +165,8 @@ class ASTBlockWithVariables(ASTNode):
         """
         if not isinstance(other, ASTBlockWithVariables):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if not (self.is_initial_values == other.is_initial_values
                 and self.is_internals == other.is_internals and
                 self.is_parameters == other.is_parameters and self.is_state == other.is_state):
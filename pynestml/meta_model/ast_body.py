@@ -33,6 +33,8 @@ class ASTBody(ASTNode):
         body_elements = None
     """
 
+    __slots__ = ('body_elements',)
+
     def __init__(self, body_elements, *args, **kwargs):
         """
         Standard constructor.
@@ -60,9 +62,9 @@ class ASTBody(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -75,6 +77,24 @@ class ASTBody(ASTNode):
         """
         return self.body_elements
 
+    def add_body_element(self, body_element):
+        """
+        Adds a single element, e.g., a block, to the end of the body.
+        :param body_element: a single body element
+        :type body_element: ASTBlockWithVariables,ASTUpdateBlock,ASTEquationsBlock,ASTInputBlock,ASTOutputBlock,ASTFunction
+        """
+        self.body_elements.append(body_element)
+        self.structure_modified()
+
+    def delete_body_element(self, body_element):
+        """
+        Deletes the handed over element from the body.
+        :param body_element: an element of this body
+        :type body_element: ASTBlockWithVariables,ASTUpdateBlock,ASTEquationsBlock,ASTInputBlock,ASTOutputBlock,ASTFunction
+        """
+        self.body_elements.remove(body_element)
+        self.structure_modified()
+
     def get_functions(self):
         """
         Returns a list of all function block declarations in this body.
@@ -219,6 +239,8 @@ class ASTBody(ASTNode):
         """
         if not isinstance(other, ASTBody):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if len(self.get_body_elements()) != len(other.get_body_elements()):
             return False
         my_body_elements = self.get_body_elements()
@@ -36,6 +36,8 @@ class ASTComparisonOperator(ASTNode):
         is_gt = False
     """
 
+    __slots__ = ('is_gt', 'is_ge', 'is_ne2', 'is_ne', 'is_eq', 'is_le', 'is_lt')
+
     def __init__(self, is_lt=False, is_le=False, is_eq=False, is_ne=False, is_ne2=False, is_ge=False,
                  is_gt=False, *args, **kwargs):
         """
@@ -87,9 +89,9 @@ class ASTComparisonOperator(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -114,6 +116,8 @@ class ASTComparisonOperator(ASTNode):
         """
         if not isinstance(other, ASTComparisonOperator):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return (self.is_lt == other.is_lt and self.is_le == other.is_le and
                 self.is_eq == other.is_eq and self.is_ne == other.is_ne and
                 self.is_ne2 == other.is_ne2 and self.is_ge == other.is_ge and self.is_gt == other.is_gt)
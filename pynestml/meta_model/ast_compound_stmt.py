@@ -37,6 +37,8 @@ class ASTCompoundStmt(ASTNode):
         for_stmt = None
     """
 
+    __slots__ = ('if_stmt', 'while_stmt', 'for_stmt')
+
     def __init__(self, if_stmt=None, while_stmt=None, for_stmt=None, *args, **kwargs):
         """
         Standard constructor.
@@ -86,9 +88,9 @@ class ASTCompoundStmt(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -176,6 +178,12 @@ class ASTCompoundStmt(ASTNode):
         """
         if not isinstance(other, ASTCompoundStmt):
             return False
+        if self.has_different_structural_hash(other):
+            return False
+        # both have to be the same kind of statement
+        if self.is_for_stmt() != other.is_for_stmt() or self.is_while_stmt() != other.is_while_stmt() or \
+                self.is_if_stmt() != other.is_if_stmt():
+            return False
         if self.get_for_stmt() is not None and other.get_for_stmt() is not None and \
                 not self.get_for_stmt().equals(other.get_for_stmt()):
             return False
@@ -47,6 +47,8 @@ class ASTDataType(ASTNode):
         type_symbol = None  # the corresponding type symbol
     """
 
+    __slots__ = ('is_integer', 'is_real', 'is_string', 'is_boolean', 'is_void', 'unit_type', 'type_symbol')
+
     def __init__(self, is_integer=False, is_real=False, is_string=False, is_boolean=False, is_void=False,
                  unit_type:Optional[ASTUnitType]=None, type_symbol=None, *args, **kwargs):
         """
@@ -97,9 +99,9 @@ class ASTDataType(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -166,6 +168,8 @@ class ASTDataType(ASTNode):
         """
         if not isinstance(other, ASTDataType):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if not (self.is_integer == other.is_integer and self.is_real == other.is_real and
                 self.is_string == other.is_string and self.is_boolean == other.is_boolean and
                 self.is_void == other.is_void):
@@ -55,6 +55,8 @@ class ASTDeclaration(ASTNode):
         invariant = None
     """
 
+    __slots__ = ('is_recordable', 'is_function', 'variables', 'data_type', 'size_parameter', 'expression', 'invariant')
+
     def __init__(self, is_recordable:bool=False, is_function:bool=False, _variables:Optional[List[ASTVariable]]=None, data_type:Optional[ASTDataType]=None, size_parameter:Optional[str]=None,
                  expression:Optional[ASTExpression]=None, invariant:Optional[ASTExpression]=None, *args, **kwargs):
         """
@@ -118,9 +120,9 @@ class ASTDeclaration(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -166,6 +168,7 @@ class ASTDeclaration(ASTNode):
         assert (_parameter is not None and isinstance(_parameter, str)), \
             '(PyNestML.AST.Declaration) No or wrong type of size parameter provided (%s)!' % type(_parameter)
         self.size_parameter = _parameter
+        self.structure_modified()
 
     def has_expression(self):
         """
@@ -186,6 +189,7 @@ class ASTDeclaration(ASTNode):
     def set_expression(self, expr):
         # type: (ASTExpression) -> None
         self.expression = expr
+        self.structure_modified()
 
     def has_invariant(self):
         """
@@ -242,6 +246,8 @@ class ASTDeclaration(ASTNode):
         """
         if not isinstance(other, ASTDeclaration):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if not (self.is_function == other.is_function and self.is_recordable == other.is_recordable):
             return False
         if self.get_size_parameter() != other.get_size_parameter():
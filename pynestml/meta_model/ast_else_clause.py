@@ -29,6 +29,8 @@ class ASTElseClause(ASTNode):
         block = None
     """
 
+    __slots__ = ('block',)
+
     def __init__(self, block, *args, **kwargs):
         """
         Standard constructor.
@@ -56,9 +58,9 @@ class ASTElseClause(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -95,4 +97,6 @@ class ASTElseClause(ASTNode):
         """
         if not isinstance(other, ASTElseClause):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.get_block().equals(other.get_block())
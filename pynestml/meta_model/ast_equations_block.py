@@ -43,6 +43,8 @@ class ASTEquationsBlock(ASTNode):
         declarations = None
     """
 
+    __slots__ = ('declarations',)
+
     def __init__(self, declarations, *args, **kwargs):
         """
         Standard constructor.
@@ -69,17 +71,15 @@ class ASTEquationsBlock(ASTNode):
         :return: new AST node instance
         :rtype: ASTEquationsBlock
         """
-        declarations_dup = None
-        if self.declarations:
-            declarations_dup = [decl.clone() for decl in self.declarations]
+        declarations_dup = [decl.clone() for decl in self.declarations]
         dup = ASTEquationsBlock(declarations=declarations_dup,
          # ASTNode common attributes:
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -149,6 +149,25 @@ class ASTEquationsBlock(ASTNode):
         """
         del self.declarations
         self.declarations = list()
+        self.structure_modified()
+
+    def add_declaration(self, declaration):
+        """
+        Adds a single declaration to the end of this block.
+        :param declaration: a single declaration
+        :type declaration: ASTOdeEquation,ASTOdeShape,ASTOdeFunction
+        """
+        self.declarations.append(declaration)
+        self.structure_modified()
+
+    def delete_declaration(self, declaration):
+        """
+        Deletes the handed over declaration from this block.
+        :param declaration: a declaration of this block
+        :type declaration: ASTOdeEquation,ASTOdeShape,ASTOdeFunction
+        """
+        self.declarations.remove(declaration)
+        self.structure_modified()
 
     def equals(self, other):
         """
@@ -160,6 +179,8 @@ class ASTEquationsBlock(ASTNode):
         """
         if not isinstance(other, ASTEquationsBlock):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if len(self.get_declarations()) != len(other.get_declarations()):
             return False
         my_declarations = self.get_declarations()
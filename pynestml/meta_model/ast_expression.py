@@ -60,6 +60,9 @@ class ASTExpression(ASTExpressionNode):
         simple_expression = None
     """
 
+    __slots__ = ('is_encapsulated', 'is_logical_not', 'unary_operator', 'expression', 'lhs', 'binary_operator', 'rhs',
+                 'condition', 'if_true', 'if_not')
+
     def __init__(self, is_encapsulated=False, unary_operator=None, is_logical_not=False,
                  expression=None, lhs=None, binary_operator=None, rhs=None, condition=None, if_true=None,
                  if_not=None, *args, **kwargs):
@@ -153,9 +156,9 @@ class ASTExpression(ASTExpressionNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -367,6 +370,8 @@ class ASTExpression(ASTExpressionNode):
         """
         if not isinstance(other, ASTExpression):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         # we have to ensure that both either are encapsulated or not
         if self.is_encapsulated + other.is_encapsulated == 1:
             return False
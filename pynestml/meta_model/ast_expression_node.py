@@ -17,7 +17,6 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
-from abc import ABCMeta
 from copy import copy
 
 from pynestml.meta_model.ast_node import ASTNode
@@ -29,12 +28,11 @@ class ASTExpressionNode(ASTNode):
 
     This class is abstract, thus no instances can be created.
     """
-    __type = None
-    __typeEither = None
-    __metaclass__ = ABCMeta
+    __slots__ = ('__type',)
 
     def __init__(self, *args, **kwargs):
         super(ASTExpressionNode, self).__init__(*args, **kwargs)
+        self.__type = None
 
     @property
     def type(self):
@@ -35,6 +35,8 @@ class ASTForStmt(ASTNode):
         block = None
     """
 
+    __slots__ = ('block', 'step', 'end_at', 'start_from', 'variable')
+
     def __init__(self, variable, start_from, end_at, step, block, *args, **kwargs):
         """
         Standard constructor.
@@ -66,33 +68,28 @@ class ASTForStmt(ASTNode):
         :return: new AST node instance
         :rtype: ASTForStmt
         """
-        variable_dup = None
-        if self.variable:
-            variable_dup = self.variable.clone()
         start_from_dup = None
         if self.start_from:
             start_from_dup = self.start_from.clone()
         end_at_dup = None
         if self.end_at:
             end_at_dup = self.end_at.clone()
-        step_dup = None
-        if self.step:
-            step_dup = self.step.clone()
         block_dup = None
         if self.block:
             block_dup = self.block.clone()
-        dup = ASTForStmt(variable=variable_dup,
+        # the variable is a name and the step a number, thus both are immutable
+        dup = ASTForStmt(variable=self.variable,
          start_from=start_from_dup,
          end_at=end_at_dup,
-         step=step_dup,
+         step=self.step,
          block=block_dup,
          # ASTNode common attributes:
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -169,6 +166,8 @@ class ASTForStmt(ASTNode):
         """
         if not isinstance(other, ASTForStmt):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if self.get_variable() != other.get_variable():
             return False
         if not self.get_start_from().equals(other.get_start_from()):
@@ -49,6 +49,8 @@ class ASTFunction(ASTNode):
         type_symbol = None
     """
 
+    __slots__ = ('block', 'return_type', 'parameters', 'name', 'type_symbol')
+
     def __init__(self, name, parameters, return_type, block, type_symbol=None, *args, **kwargs):
         """
         Standard constructor.
@@ -96,9 +98,9 @@ class ASTFunction(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -201,6 +203,8 @@ class ASTFunction(ASTNode):
         """
         if not isinstance(other, ASTFunction):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if self.get_name() != other.get_name():
             return False
         if len(self.get_parameters()) != len(other.get_parameters()):
@@ -34,6 +34,8 @@ class ASTFunctionCall(ASTNode):
         args = None
     """
 
+    __slots__ = ('callee_name', 'args')
+
     def __init__(self, callee_name, function_call_args, *args, **kwargs):
         """
         Standard constructor.
@@ -66,9 +68,9 @@ class ASTFunctionCall(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -122,6 +124,8 @@ class ASTFunctionCall(ASTNode):
         """
         if not isinstance(other, ASTFunctionCall):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if self.get_name() != other.get_name():
             return False
         if len(self.get_args()) != len(other.get_args()):
@@ -31,6 +31,8 @@ class ASTIfClause(ASTNode):
         block = None
     """
 
+    __slots__ = ('block', 'condition')
+
     def __init__(self, condition, block, *args, **kwargs):
         """
         Standard constructor.
@@ -65,9 +67,9 @@ class ASTIfClause(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -116,4 +118,6 @@ class ASTIfClause(ASTNode):
         """
         if not isinstance(other, ASTIfClause):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.get_condition().equals(other.get_condition()) and self.get_block().equals(other.get_block())
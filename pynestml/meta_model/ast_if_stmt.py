@@ -35,6 +35,8 @@ class ASTIfStmt(ASTNode):
         else_clause = None
     """
 
+    __slots__ = ('else_clause', 'if_clause', 'elif_clauses')
+
     def __init__(self, if_clause, elif_clauses=None, else_clause=None, *args, **kwargs):
         """
         Standard constructor.
@@ -80,9 +82,9 @@ class ASTIfStmt(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -161,6 +163,8 @@ class ASTIfStmt(ASTNode):
         """
         if not isinstance(other, ASTIfStmt):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if not self.get_if_clause().equals(other.get_if_clause()):
             return False
         if len(self.get_elif_clauses()) != len(other.get_elif_clauses()):
@@ -41,6 +41,8 @@ class ASTInputBlock(ASTNode):
         input_definitions = None
     """
 
+    __slots__ = ('input_definitions',)
+
     def __init__(self, input_definitions=None, *args, **kwargs):
         """
         Standard constructor.
@@ -73,9 +75,9 @@ class ASTInputBlock(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -113,6 +115,8 @@ class ASTInputBlock(ASTNode):
         """
         if not isinstance(other, ASTInputBlock):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if len(self.get_input_ports()) != len(other.get_input_ports()):
             return False
         my_input_ports = self.get_input_ports()
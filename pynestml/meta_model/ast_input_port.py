@@ -47,6 +47,8 @@ class ASTInputPort(ASTNode):
 
     """
 
+    __slots__ = ('signal_type', 'input_qualifiers', 'size_parameter', 'name', 'data_type')
+
     def __init__(self, name=None, size_parameter=None, data_type=None, input_qualifiers=None, signal_type=None,
                  *args, **kwargs):
         """
@@ -106,9 +108,9 @@ class ASTInputPort(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -243,6 +245,8 @@ class ASTInputPort(ASTNode):
         """
         if not isinstance(other, ASTInputPort):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if self.get_name() != other.get_name():
             return False
         if self.has_index_parameter() + other.has_index_parameter() == 1:
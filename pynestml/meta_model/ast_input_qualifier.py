@@ -37,6 +37,8 @@ class ASTInputQualifier(ASTNode):
         is_excitatory = False
     """
 
+    __slots__ = ('is_excitatory', 'is_inhibitory')
+
     def __init__(self, is_inhibitory=False, is_excitatory=False, *args, **kwargs):
         """
         Standard constructor.
@@ -65,9 +67,9 @@ class ASTInputQualifier(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -92,4 +94,6 @@ class ASTInputQualifier(ASTNode):
         """
         if not isinstance(other, ASTInputQualifier):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.is_excitatory == other.is_excitatory and self.is_inhibitory == other.is_inhibitory
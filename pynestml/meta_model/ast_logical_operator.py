@@ -30,6 +30,8 @@ class ASTLogicalOperator(ASTNode):
         is_logical_or = False
     """
 
+    __slots__ = ('is_logical_and', 'is_logical_or')
+
     def __init__(self, is_logical_and=False, is_logical_or=False, *args, **kwargs):
         """
         Standard constructor.
@@ -61,9 +63,9 @@ class ASTLogicalOperator(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -89,4 +91,6 @@ class ASTLogicalOperator(ASTNode):
         """
         if not isinstance(other, ASTLogicalOperator):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.is_logical_and == other.is_logical_and and self.is_logical_or == other.is_logical_or
@@ -30,8 +30,11 @@ class ASTNestMLCompilationUnit(ASTNode):
     Attributes:
         neuron_list = None # a list of all processed neurons
         artifact_name = None
+        file_path = None # the path to the file this compilation unit has been parsed from, set by the ModelParser
     """
 
+    __slots__ = ('neuron_list', 'artifact_name', 'file_path')
+
     def __init__(self, neuron_list=None, artifact_name=None, *args, **kwargs):
         """
         Standard constructor.
@@ -51,6 +54,7 @@ class ASTNestMLCompilationUnit(ASTNode):
             assert type(neuron_list) is list
             self.neuron_list.extend(neuron_list)
         self.artifact_name = artifact_name
+        self.file_path = None
 
 
     def clone(self):
@@ -67,9 +71,9 @@ class ASTNestMLCompilationUnit(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -83,6 +87,7 @@ class ASTNestMLCompilationUnit(ASTNode):
         assert (neuron is not None and isinstance(neuron, ASTNeuron)), \
             '(PyNestML.AST.CompilationUnit) No or wrong type of neuron provided (%s)!' % type(neuron)
         self.neuron_list.append(neuron)
+        self.structure_modified()
 
     def delete_neuron(self, neuron):
         """
@@ -94,6 +99,7 @@ class ASTNestMLCompilationUnit(ASTNode):
         """
         if self.neuron_list.__contains__(neuron):
             self.neuron_list.remove(neuron)
+            self.structure_modified()
             return True
         return False
 
@@ -129,6 +135,8 @@ class ASTNestMLCompilationUnit(ASTNode):
         """
         if not isinstance(other, ASTNestMLCompilationUnit):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if len(self.get_neuron_list()) != len(other.get_neuron_list()):
             return False
         my_neurons = self.get_neuron_list()
@@ -23,6 +23,7 @@ from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_ode_shape import ASTOdeShape
 from pynestml.meta_model.ast_body import ASTBody
 from pynestml.meta_model.ast_equations_block import ASTEquationsBlock
+from pynestml.symbol_table.scope import Scope
 from pynestml.symbols.variable_symbol import BlockType
 from pynestml.symbols.variable_symbol import VariableSymbol
 from pynestml.utils.ast_utils import ASTUtils
@@ -42,8 +43,19 @@ class ASTNeuron(ASTNode):
         name = None
         body = None
         artifact_name = None
+        file_path = None # the path to the file this neuron is contained in, set by the ModelParser
+        structure_version = 0 # incremented by each modification of a node of this neuron, cf. ASTNode.structure_modified()
+        node_index = None # the index of the nodes of this neuron by class, cf. ASTNodeIndex
+        derived_views = None # the cached results of queries of the symbols of this neuron, cf. get_derived_view()
+        derived_views_key = None # the state of the neuron and its scope for which derived_views are valid
+
+    The queries of the symbols of this neuron, e.g., get_parameter_symbols(), are called many times while generating
+    code, thus their results are cached until the structure of the neuron, its scope or any other scope is modified.
     """
 
+    __slots__ = ('name', 'body', 'artifact_name', 'file_path', 'structure_version', 'node_index', 'derived_views',
+                 'derived_views_key')
+
     def __init__(self, name, body, artifact_name=None, *args, **kwargs):
         """
         Standard constructor.
@@ -67,6 +79,11 @@ class ASTNeuron(ASTNode):
         self.name = name
         self.body = body
         self.artifact_name = artifact_name
+        self.file_path = None
+        self.structure_version = 0
+        self.node_index = None
+        self.derived_views = None
+        self.derived_views_key = None
 
     def clone(self):
         """
@@ -82,9 +99,9 @@ class ASTNeuron(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -113,6 +130,32 @@ class ASTNeuron(ASTNode):
         """
         return self.artifact_name
 
+    def get_derived_view(self, name, query):
+        """
+        Returns the result of the handed over query, which is only evaluated if it has not been evaluated since the
+        last modification of this neuron or of a scope. Lists are copied, such that callers can modify them.
+        Queries may depend on the structure of the neuron, on the symbols of scopes and on all attributes of variable
+        symbols which are updated by setters, cf. Scope.modification_count; attributes which are assigned directly,
+        e.g., the comment of a symbol, are not tracked.
+        :param name: the name of the query.
+        :type name: str
+        :param query: a function without parameters which evaluates the query, e.g., filters the symbols of the scope.
+        :type query: function
+        :return: the result of the query.
+        :rtype: object
+        """
+        from pynestml.utils.ast_node_index import ASTNodeIndex
+        # all nodes report their modifications to the neuron only once they have been indexed
+        ASTNodeIndex.get_index(self)
+        key = (self.scope, self.structure_version, Scope.modification_count)
+        if self.derived_views is None or self.derived_views_key != key:
+            self.derived_views = dict()
+            self.derived_views_key = key
+        if name not in self.derived_views:
+            self.derived_views[name] = query()
+        result = self.derived_views[name]
+        return list(result) if isinstance(result, list) else result
+
     def get_functions(self):
         """
         Returns a list of all function block declarations in this body.
@@ -243,7 +286,7 @@ class ASTNeuron(ASTNode):
 
         for elem in self.get_body().get_body_elements():
             if isinstance(elem, ASTEquationsBlock):
-                self.get_body().get_body_elements().remove(elem)
+                self.get_body().delete_body_element(elem)
 
     def get_initial_values_declarations(self):
         """
@@ -296,13 +339,10 @@ class ASTNeuron(ASTNode):
         :return: a list of all input buffers.
         :rtype: list(VariableSymbol)
         """
-        symbols = self.get_scope().get_symbols_in_this_scope()
-        ret = list()
-        for symbol in symbols:
+        return self.get_derived_view('input_buffers', lambda: [
+            symbol for symbol in self.get_scope().get_symbols_in_this_scope()
             if isinstance(symbol, VariableSymbol) and (symbol.block_type == BlockType.INPUT_BUFFER_SPIKE or
-                                                       symbol.block_type == BlockType.INPUT_BUFFER_CURRENT):
-                ret.append(symbol)
-        return ret
+                                                       symbol.block_type == BlockType.INPUT_BUFFER_CURRENT)])
 
     def get_spike_buffers(self):
         """
@@ -310,11 +350,8 @@ class ASTNeuron(ASTNode):
         :return: a list of all spike input buffers.
         :rtype: list(VariableSymbol)
         """
-        ret = list()
-        for BUFFER in self.get_input_buffers():
-            if BUFFER.is_spike_buffer():
-                ret.append(BUFFER)
-        return ret
+        return self.get_derived_view('spike_buffers', lambda: [
+            buffer for buffer in self.get_input_buffers() if buffer.is_spike_buffer()])
 
     def get_current_buffers(self):
         """
@@ -322,11 +359,8 @@ class ASTNeuron(ASTNode):
         :return: a list of all current input buffers.
         :rtype: list(VariableSymbol)
         """
-        ret = list()
-        for BUFFER in self.get_input_buffers():
-            if BUFFER.is_current_buffer():
-                ret.append(BUFFER)
-        return ret
+        return self.get_derived_view('current_buffers', lambda: [
+            buffer for buffer in self.get_input_buffers() if buffer.is_current_buffer()])
 
     def get_parameter_symbols(self):
         """
@@ -334,13 +368,10 @@ class ASTNeuron(ASTNode):
         :return: a list of parameter symbols.
         :rtype: list(VariableSymbol)
         """
-        symbols = self.get_scope().get_symbols_in_this_scope()
-        ret = list()
-        for symbol in symbols:
-            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.PARAMETERS and \
-                    not symbol.is_predefined:
-                ret.append(symbol)
-        return ret
+        return self.get_derived_view('parameter_symbols', lambda: [
+            symbol for symbol in self.get_scope().get_symbols_in_this_scope()
+            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.PARAMETERS and
+            not symbol.is_predefined])
 
     def get_state_symbols(self):
         """
@@ -348,13 +379,10 @@ class ASTNeuron(ASTNode):
         :return: a list of state symbols.
         :rtype: list(VariableSymbol)
         """
-        symbols = self.get_scope().get_symbols_in_this_scope()
-        ret = list()
-        for symbol in symbols:
-            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.STATE and \
-                    not symbol.is_predefined:
-                ret.append(symbol)
-        return ret
+        return self.get_derived_view('state_symbols', lambda: [
+            symbol for symbol in self.get_scope().get_symbols_in_this_scope()
+            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.STATE and
+            not symbol.is_predefined])
 
     def get_internal_symbols(self):
         """
@@ -362,13 +390,10 @@ class ASTNeuron(ASTNode):
         :return: a list of internals symbols.
         :rtype: list(VariableSymbol)
         """
-        symbols = self.get_scope().get_symbols_in_this_scope()
-        ret = list()
-        for symbol in symbols:
-            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.INTERNALS and \
-                    not symbol.is_predefined:
-                ret.append(symbol)
-        return ret
+        return self.get_derived_view('internal_symbols', lambda: [
+            symbol for symbol in self.get_scope().get_symbols_in_this_scope()
+            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.INTERNALS and
+            not symbol.is_predefined])
 
     def get_ode_aliases(self):
         """
@@ -376,13 +401,9 @@ class ASTNeuron(ASTNode):
         :return: a list of equation function  symbols.
         :rtype: list(VariableSymbol)
         """
-        symbols = self.get_scope().get_symbols_in_this_scope()
-        ret = list()
-        for symbol in symbols:
-            if isinstance(symbol,
-                          VariableSymbol) and symbol.block_type == BlockType.EQUATION and symbol.is_function:
-                ret.append(symbol)
-        return ret
+        return self.get_derived_view('ode_aliases', lambda: [
+            symbol for symbol in self.get_scope().get_symbols_in_this_scope()
+            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.EQUATION and symbol.is_function])
 
     def variables_defined_by_ode(self):
         """
@@ -390,12 +411,9 @@ class ASTNeuron(ASTNode):
         :return: a list of variable symbols
         :rtype: list(VariableSymbol)
         """
-        symbols = self.get_scope().get_symbols_in_complete_scope()
-        ret = list()
-        for symbol in symbols:
-            if isinstance(symbol, VariableSymbol) and symbol.is_ode_defined():
-                ret.append(symbol)
-        return ret
+        return self.get_derived_view('variables_defined_by_ode', lambda: [
+            symbol for symbol in self.get_scope().get_symbols_in_complete_scope()
+            if isinstance(symbol, VariableSymbol) and symbol.is_ode_defined()])
 
     def get_output_blocks(self):
         """
@@ -420,11 +438,8 @@ class ASTNeuron(ASTNode):
         :return: True if multi-synaptic, otherwise False.
         :rtype: bool
         """
-        buffers = self.get_spike_buffers()
-        for iBuffer in buffers:
-            if iBuffer.has_vector_parameter():
-                return True
-        return False
+        return self.get_derived_view('multisynapse_spikes', lambda: any(
+            buffer.has_vector_parameter() for buffer in self.get_spike_buffers()))
 
     def get_multiple_receptors(self):
         """
@@ -452,11 +467,8 @@ class ASTNeuron(ASTNode):
         :return: a list of variable symbols
         :rtype: list(VariableSymbol)
         """
-        ret = list()
-        for param in self.get_parameter_symbols():
-            if not param.is_function and not param.is_predefined:
-                ret.append(param)
-        return ret
+        return self.get_derived_view('parameter_non_alias_symbols', lambda: [
+            param for param in self.get_parameter_symbols() if not param.is_function and not param.is_predefined])
 
     def get_state_non_alias_symbols(self):
         """
@@ -464,18 +476,12 @@ class ASTNeuron(ASTNode):
         :return: a list of variable symbols
         :rtype: list(VariableSymbol)
         """
-        ret = list()
-        for param in self.get_state_symbols():
-            if not param.is_function and not param.is_predefined:
-                ret.append(param)
-        return ret
+        return self.get_derived_view('state_non_alias_symbols', lambda: [
+            param for param in self.get_state_symbols() if not param.is_function and not param.is_predefined])
 
     def get_initial_values_non_alias_symbols(self):
-        ret = list()
-        for init in self.get_initial_values_symbols():
-            if not init.is_function and not init.is_predefined:
-                ret.append(init)
-        return ret
+        return self.get_derived_view('initial_values_non_alias_symbols', lambda: [
+            init for init in self.get_initial_values_symbols() if not init.is_function and not init.is_predefined])
 
     def get_internal_non_alias_symbols(self):
         """
@@ -483,12 +489,8 @@ class ASTNeuron(ASTNode):
         :return: a list of variable symbols
         :rtype: list(VariableSymbol)
         """
-        ret = list()
-        for param in self.get_internal_symbols():
-            if not param.is_function and not param.is_predefined:
-                ret.append(param)
-
-        return ret
+        return self.get_derived_view('internal_non_alias_symbols', lambda: [
+            param for param in self.get_internal_symbols() if not param.is_function and not param.is_predefined])
 
     def get_initial_values_symbols(self):
         """
@@ -496,13 +498,10 @@ class ASTNeuron(ASTNode):
         :return: a list of initial values symbols.
         :rtype: list(VariableSymbol)
         """
-        symbols = self.get_scope().get_symbols_in_this_scope()
-        ret = list()
-        for symbol in symbols:
-            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.INITIAL_VALUES and \
-                    not symbol.is_predefined:
-                ret.append(symbol)
-        return ret
+        return self.get_derived_view('initial_values_symbols', lambda: [
+            symbol for symbol in self.get_scope().get_symbols_in_this_scope()
+            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.INITIAL_VALUES and
+            not symbol.is_predefined])
 
     def get_initial_values_blocks(self):
         """
@@ -528,7 +527,7 @@ class ASTNeuron(ASTNode):
         from pynestml.meta_model.ast_block_with_variables import ASTBlockWithVariables
         for elem in self.get_body().get_body_elements():
             if isinstance(elem, ASTBlockWithVariables) and elem.is_initial_values:
-                self.get_body().get_body_elements().remove(elem)
+                self.get_body().delete_body_element(elem)
 
     def get_function_initial_values_symbols(self):
         """
@@ -536,11 +535,8 @@ class ASTNeuron(ASTNode):
         :return: a list of symbols
         :rtype: list(VariableSymbol)
         """
-        ret = list()
-        for symbol in self.get_initial_values_symbols():
-            if symbol.is_function:
-                ret.append(symbol)
-        return ret
+        return self.get_derived_view('function_initial_values_symbols', lambda: [
+            symbol for symbol in self.get_initial_values_symbols() if symbol.is_function])
 
     def get_non_function_initial_values_symbols(self):
         """
@@ -548,11 +544,8 @@ class ASTNeuron(ASTNode):
         :return: a list of symbols
         :rtype:list(VariableSymbol)
         """
-        ret = list()
-        for symbol in self.get_initial_values_symbols():
-            if not symbol.is_function:
-                ret.append(symbol)
-        return ret
+        return self.get_derived_view('non_function_initial_values_symbols', lambda: [
+            symbol for symbol in self.get_initial_values_symbols() if not symbol.is_function])
 
     def get_ode_defined_symbols(self):
         """
@@ -561,14 +554,10 @@ class ASTNeuron(ASTNode):
         :return: a list of initial value variables with odes
         :rtype: list(VariableSymbol)
         """
-        symbols = self.get_scope().get_symbols_in_this_scope()
-        ret = list()
-        for symbol in symbols:
-            if isinstance(symbol, VariableSymbol) and \
-                    symbol.block_type == BlockType.INITIAL_VALUES and symbol.is_ode_defined() \
-                    and not symbol.is_predefined:
-                ret.append(symbol)
-        return ret
+        return self.get_derived_view('ode_defined_symbols', lambda: [
+            symbol for symbol in self.get_scope().get_symbols_in_this_scope()
+            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.INITIAL_VALUES and
+            symbol.is_ode_defined() and not symbol.is_predefined])
 
     def get_state_symbols_without_ode(self):
         """
@@ -576,14 +565,10 @@ class ASTNeuron(ASTNode):
         :return: a list of of state variable symbols.
         :rtype: list(VariableSymbol)
         """
-        symbols = self.get_scope().get_symbols_in_this_scope()
-        ret = list()
-        for symbol in symbols:
-            if isinstance(symbol, VariableSymbol) and \
-                    symbol.block_type == BlockType.STATE and not symbol.is_ode_defined() \
-                    and not symbol.is_predefined:
-                ret.append(symbol)
-        return ret
+        return self.get_derived_view('state_symbols_without_ode', lambda: [
+            symbol for symbol in self.get_scope().get_symbols_in_this_scope()
+            if isinstance(symbol, VariableSymbol) and symbol.block_type == BlockType.STATE and
+            not symbol.is_ode_defined() and not symbol.is_predefined])
 
     def is_array_buffer(self):
         """
@@ -591,11 +576,8 @@ class ASTNeuron(ASTNode):
         :return: True if vector buffers defined, otherwise False.
         :rtype: bool
         """
-        buffers = self.get_input_buffers()
-        for BUFFER in buffers:
-            if BUFFER.has_vector_parameter():
-                return True
-        return False
+        return self.get_derived_view('array_buffer', lambda: any(
+            buffer.has_vector_parameter() for buffer in self.get_input_buffers()))
 
     def get_parameter_invariants(self):
         """
@@ -627,7 +609,7 @@ class ASTNeuron(ASTNode):
         """
         if self.get_internals_blocks() is None:
             ASTUtils.create_internal_block(self)
-        self.get_internals_blocks().get_declarations().append(declaration)
+        self.get_internals_blocks().add_declaration(declaration)
 
     def add_to_initial_values_block(self, declaration):
         # todo by KP: factor me out to utils
@@ -638,7 +620,7 @@ class ASTNeuron(ASTNode):
         """
         if self.get_initial_blocks() is None:
             ASTUtils.create_initial_values_block(self)
-        self.get_initial_blocks().get_declarations().append(declaration)
+        self.get_initial_blocks().add_declaration(declaration)
 
     def add_shape(self, shape):
         # type: (ASTOdeShape) -> None
@@ -647,7 +629,7 @@ class ASTNeuron(ASTNode):
         :param shape: a single declaration.
         """
         assert self.get_equations_block() is not None
-        self.get_equations_block().get_declarations().append(shape)
+        self.get_equations_block().add_declaration(shape)
 
     """
     The following print methods are used by the backend and represent the comments as stored at the corresponding 
@@ -745,4 +727,6 @@ class ASTNeuron(ASTNode):
         """
         if not isinstance(other, ASTNeuron):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.get_name() == other.get_name() and self.get_body().equals(other.get_body())
@@ -19,6 +19,7 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 from abc import ABCMeta, abstractmethod
+from enum import Enum
 
 from pynestml.utils.ast_source_location import ASTSourceLocation
 
@@ -39,8 +40,39 @@ class ASTNode(metaclass=ABCMeta):
         post_comments = list()
         #
         implicit_conversion_factor = None
+
+    Nodes store their attributes in slots instead of a dict, thus each subclass declares its attributes in __slots__.
+    Comment containers are not modified once they have been set, thus nodes without pre- or post-comments share the
+    empty tuple NO_COMMENTS instead of allocating empty lists.
+
+    Each node computes a structural hash on demand, cf. get_structural_hash(), which is cached along with the
+    structure version it has been computed for. Nodes which belong to a neuron are marked with the neuron as owner when
+    the neuron is indexed, cf. ASTNodeIndex. All methods which modify the structure of a node, e.g., set_name() or
+    add_stmt(), report the modification by structure_modified(), which increments the structure version of the owning
+    neuron, thus invalidates the cached hashes, the index and the derived views of this neuron only, as well as the
+    global modification count. While the index of the owning neuron is up to date, all children of a node report their
+    modifications to the same neuron, thus its structure version applies; for all other nodes, e.g., free-standing
+    expressions, the hash is valid as long as no node at all has been modified.
     """
 
+    __slots__ = ('source_position', 'scope', 'comment', 'pre_comments', 'in_comment', 'post_comments',
+                 'implicit_conversion_factor', 'owner', 'structural_hash', 'hash_version')
+    NO_COMMENTS = ()
+    # attributes which are not compared by equals(), thus do not contribute to the structural hash
+    NON_STRUCTURAL_ATTRIBUTES = frozenset(['source_position', 'scope', 'comment', 'pre_comments', 'in_comment',
+                                           'post_comments', 'implicit_conversion_factor', 'owner',
+                                           'structural_hash', 'hash_version', 'artifact_name', 'file_path',
+                                           'type_symbol', 'type', '_ASTExpressionNode__type', 'structure_version',
+                                           'node_index', 'derived_views', 'derived_views_key'])
+    # attributes which cache information on the structure, thus are only valid within the interpreter which computed
+    # them and are not pickled
+    CACHE_ATTRIBUTES = frozenset(['owner', 'structural_hash', 'hash_version', 'node_index', 'derived_views',
+                                  'derived_views_key'])
+    structural_attributes = dict()
+    slot_names = dict()
+    # the number of modifications of the structure of any node, cf. structure_modified()
+    modification_count = 0
+
     def __init__(self, source_position=None, scope=None, comment=None, pre_comments=None, in_comment=None, post_comments=None, implicit_conversion_factor=None):
         """
         The standard constructor.
@@ -62,14 +94,105 @@ class ASTNode(metaclass=ABCMeta):
         self.source_position = source_position
         self.scope = scope
         self.comment = comment
-        if pre_comments is None:
-            pre_comments = []
-        self.pre_comments = pre_comments
+        self.pre_comments = pre_comments if pre_comments else ASTNode.NO_COMMENTS
         self.in_comment = in_comment
-        if post_comments is None:
-            post_comments = []
-        self.post_comments = post_comments
+        self.post_comments = post_comments if post_comments else ASTNode.NO_COMMENTS
         self.implicit_conversion_factor = implicit_conversion_factor
+        self.owner = None
+        self.structural_hash = None
+        self.hash_version = None
+
+    def __getstate__(self):
+        node_class = type(self)
+        if node_class not in ASTNode.slot_names:
+            ASTNode.slot_names[node_class] = tuple(get_attribute_name(cls, name) for cls in node_class.__mro__
+                                                   for name in cls.__dict__.get('__slots__', ()))
+        return dict((name, getattr(self, name)) for name in ASTNode.slot_names[node_class]
+                    if name not in ASTNode.CACHE_ATTRIBUTES and hasattr(self, name))
+
+    def __setstate__(self, state):
+        for (name, value) in state.items():
+            setattr(self, name, value)
+        for name in ASTNode.CACHE_ATTRIBUTES:
+            if hasattr(type(self), name):
+                setattr(self, name, None)
+
+    def structure_modified(self):
+        """
+        Reports that the structure of this node, i.e., one of the attributes compared by equals(), has been modified.
+        This has to be called by all methods which modify the structure, including in-place modifications of lists of
+        child nodes. Invalidates the caches of the neuron this node belongs to, and the hashes of all nodes which do
+        not belong to a neuron.
+        """
+        ASTNode.modification_count += 1
+        if self.owner is not None:
+            self.owner.structure_version += 1
+
+    def is_structure_tracked(self):
+        """
+        Indicates whether all modifications of this node and its children are reported to the neuron it belongs to,
+        i.e., whether the node is part of the up to date index of a neuron.
+        :return: True if tracked, otherwise False.
+        :rtype: bool
+        """
+        owner = self.owner
+        return owner is not None and owner.node_index is not None and owner.node_index.is_valid()
+
+    def get_structure_version(self):
+        """
+        Returns the version of the structure of this node and its children, which changes whenever one of them is
+        modified: the structure version of the neuron this node belongs to if tracked, cf. is_structure_tracked(),
+        otherwise the negated global modification count, since it is unknown to which neuron the children report.
+        :return: a version.
+        :rtype: int
+        """
+        if self.is_structure_tracked():
+            return self.owner.structure_version
+        return -1 - ASTNode.modification_count
+
+    def has_cached_structural_hash(self):
+        """
+        Indicates whether the structural hash of this node is cached for the current structure.
+        :return: True if cached, otherwise False.
+        :rtype: bool
+        """
+        return self.structural_hash is not None and self.hash_version == self.get_structure_version()
+
+    def get_structural_hash(self):
+        """
+        Returns a hash of the structure of this node and its children, i.e., of all attributes compared by equals(),
+        such that equal nodes have equal hashes. The hash is cached until the structure version changes, cf.
+        get_structure_version(). To use nodes as keys of dicts, cf. StructuralKey.
+        As the hash of strings is randomized per interpreter, the hash must not be stored across runs.
+        :return: a hash value.
+        :rtype: int
+        """
+        version = self.get_structure_version()
+        if self.hash_version == version and self.structural_hash is not None:
+            return self.structural_hash
+        node_class = type(self)
+        attributes = ASTNode.structural_attributes.get(node_class)
+        if attributes is None:
+            attributes = tuple(name for name in node_class.__slots__
+                               if name not in ASTNode.NON_STRUCTURAL_ATTRIBUTES)
+            ASTNode.structural_attributes[node_class] = attributes
+        structural_hash = hash((node_class.__name__,) + tuple(get_structural_value(getattr(self, name))
+                                                              for name in attributes))
+        self.structural_hash = structural_hash
+        self.hash_version = version
+        return structural_hash
+
+    def has_different_structural_hash(self, other):
+        """
+        Indicates whether this and the handed over node are known to be not equal by their structural hashes. Hashes
+        are only compared if both are cached, since otherwise computing them costs as much as comparing the nodes.
+        :param other: a different node.
+        :type other: ASTNode
+        :return: True if the hashes differ, otherwise False.
+        :rtype: bool
+        """
+        return (self.has_cached_structural_hash() and other.has_cached_structural_hash() and
+                self.structural_hash != other.structural_hash)
 
     @abstractmethod
     def clone(self):
@@ -218,3 +341,36 @@ class ASTNode(metaclass=ABCMeta):
     def __str__(self):
         from pynestml.utils.ast_nestml_printer import ASTNestMLPrinter
         return ASTNestMLPrinter().print_node(self)
+
+
+def get_attribute_name(node_class, slot_name):
+    """
+    Returns the name of the attribute which is stored in the handed over slot of the handed over class, i.e., the
+    mangled name for private slots.
+    :param node_class: a class of the meta_model.
+    :type node_class: type
+    :param slot_name: the name of a slot as declared in __slots__.
+    :type slot_name: str
+    :return: the name of the attribute.
+    :rtype: str
+    """
+    if slot_name.startswith('__') and not slot_name.endswith('__'):
+        return '_' + node_class.__name__.lstrip('_') + slot_name
+    return slot_name
+
+
+def get_structural_value(value):
+    """
+    Returns a hashable representation of the handed over attribute value of a node, cf. ASTNode.get_structural_hash().
+    :param value: the value of an attribute, i.e., a node, a list of nodes, a primitive value or an enum member.
+    :type value: object
+    :return: a hashable value.
+    :rtype: object
+    """
+    if isinstance(value, ASTNode):
+        return value.get_structural_hash()
+    if isinstance(value, (list, tuple)):
+        return tuple(get_structural_value(element) for element in value)
+    assert value is None or isinstance(value, (str, int, float, Enum)), \
+        '(PyNestML.ASTNode) Attribute of type %s can not be hashed structurally!' % type(value)
+    return value
@@ -39,6 +39,8 @@ class ASTOdeEquation(ASTNode):
         rhs = None
     """
 
+    __slots__ = ('lhs', 'rhs')
+
     def __init__(self, lhs, rhs, *args, **kwargs):
         """
         Standard constructor.
@@ -69,9 +71,9 @@ class ASTOdeEquation(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -92,6 +94,15 @@ class ASTOdeEquation(ASTNode):
         """
         return self.rhs
 
+    def set_rhs(self, rhs):
+        """
+        Updates the right-hand side of the equation.
+        :param rhs: an object of the meta_model-expr class.
+        :type rhs: Union[ASTExpression, ASTSimpleExpression]
+        """
+        self.rhs = rhs
+        self.structure_modified()
+
     def get_parent(self, ast=None):
         """
         Indicates whether a this node contains the handed over node.
@@ -120,4 +131,6 @@ class ASTOdeEquation(ASTNode):
         """
         if not isinstance(other, ASTOdeEquation):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.get_lhs().equals(other.get_lhs()) and self.get_rhs().equals(other.get_rhs())
@@ -34,6 +34,8 @@ class ASTOdeFunction(ASTNode):
         expression = None
     """
 
+    __slots__ = ('is_recordable', 'variable_name', 'data_type', 'expression')
+
     def __init__(self, is_recordable=False, variable_name=None, data_type=None, expression=None, *args, **kwargs):
         """
         Standard constructor.
@@ -76,9 +78,9 @@ class ASTOdeFunction(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -107,6 +109,15 @@ class ASTOdeFunction(ASTNode):
         """
         return self.expression
 
+    def set_expression(self, expression):
+        """
+        Updates the rhs of this function.
+        :param expression: a single expression.
+        :type expression: ast_expression
+        """
+        self.expression = expression
+        self.structure_modified()
+
     def get_parent(self, ast):
         """
         Indicates whether a this node contains the handed over node.
@@ -135,6 +146,8 @@ class ASTOdeFunction(ASTNode):
         """
         if not isinstance(other, ASTOdeFunction):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if self.is_recordable != other.is_recordable:
             return False
         if self.get_variable_name() != other.get_variable_name():
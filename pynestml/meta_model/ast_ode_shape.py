@@ -31,6 +31,8 @@ class ASTOdeShape(ASTNode):
         rhs = None
     """
 
+    __slots__ = ('lhs', 'rhs')
+
     def __init__(self, lhs, rhs, *args, **kwargs):
         """
         Standard constructor.
@@ -59,9 +61,9 @@ class ASTOdeShape(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -110,4 +112,6 @@ class ASTOdeShape(ASTNode):
         """
         if not isinstance(other, ASTOdeShape):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.get_variable().equals(other.get_variable()) and self.get_expression().equals(other.get_expression())
@@ -35,6 +35,8 @@ class ASTOutputBlock(ASTNode):
         type = None
     """
 
+    __slots__ = ('type',)
+
     def __init__(self, o_type, *args, **kwargs):
         """
         Standard constructor.
@@ -60,9 +62,9 @@ class ASTOutputBlock(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -103,4 +105,6 @@ class ASTOutputBlock(ASTNode):
         """
         if not isinstance(other, ASTOutputBlock):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.is_spike() == other.is_spike() and self.is_current() == other.is_current()
@@ -36,6 +36,8 @@ class ASTParameter(ASTNode):
         data_type (ASTDataType): The data type of the parameter.
     """
 
+    __slots__ = ('data_type', 'name')
+
     def __init__(self, name=None, data_type=None, *args, **kwargs):
         """
         Standard constructor.
@@ -65,9 +67,9 @@ class ASTParameter(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -112,4 +114,6 @@ class ASTParameter(ASTNode):
         """
         if not isinstance(other, ASTParameter):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.get_name() == other.get_name() and self.get_data_type().equals(other.get_data_type())
@@ -35,6 +35,8 @@ class ASTReturnStmt(ASTNode):
           expression (ASTSimpleExpression or ASTExpression): An rhs representing the returned value.
     """
 
+    __slots__ = ('expression',)
+
     def __init__(self, expression=None, *args, **kwargs):
         """
         Standard constructor.
@@ -62,9 +64,9 @@ class ASTReturnStmt(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -110,4 +112,6 @@ class ASTReturnStmt(ASTNode):
         """
         if not isinstance(other, ASTReturnStmt):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.get_expression().equals(other.get_expression())
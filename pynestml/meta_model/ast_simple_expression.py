@@ -48,6 +48,9 @@ class ASTSimpleExpression(ASTExpressionNode):
 
     """
 
+    __slots__ = ('function_call', 'is_boolean_true', 'is_boolean_false', 'numeric_literal', 'is_inf_literal',
+                 'variable', 'string')
+
     def __init__(self, function_call=None, boolean_literal=None, numeric_literal=None, is_inf=False,
                  variable=None, string=None, *args, **kwargs):
         """
@@ -124,9 +127,9 @@ class ASTSimpleExpression(ASTExpressionNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -265,6 +268,7 @@ class ASTSimpleExpression(ASTExpressionNode):
         assert (variable is None or isinstance(variable, ASTVariable)), \
             '(PyNestML.AST.SimpleExpression) No or wrong type of variable provided (%s)!' % type(variable)
         self.variable = variable
+        self.structure_modified()
 
     def set_function_call(self, function_call):
         """
@@ -275,6 +279,7 @@ class ASTSimpleExpression(ASTExpressionNode):
         assert (function_call is None or isinstance(function_call, ASTVariable)), \
             '(PyNestML.AST.SimpleExpression) No or wrong type of function call provided (%s)!' % type(function_call)
         self.function_call = function_call
+        self.structure_modified()
 
     def equals(self, other):
         """
@@ -286,6 +291,8 @@ class ASTSimpleExpression(ASTExpressionNode):
         """
         if not isinstance(other, ASTSimpleExpression):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if self.is_function_call() + other.is_function_call() == 1:
             return False
         if self.is_function_call() and other.is_function_call() and not self.get_function_call().equals(
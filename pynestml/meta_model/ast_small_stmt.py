@@ -37,6 +37,8 @@ class ASTSmallStmt(ASTNode):
         return_stmt (ast_return_stmt): A reference to the returns statement.
     """
 
+    __slots__ = ('assignment', 'function_call', 'declaration', 'return_stmt')
+
     def __init__(self, assignment=None, function_call=None, declaration=None, return_stmt=None, *args, **kwargs):
         """
         Standard constructor.
@@ -85,9 +87,9 @@ class ASTSmallStmt(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -196,6 +198,8 @@ class ASTSmallStmt(ASTNode):
         """
         if not isinstance(other, ASTSmallStmt):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if self.is_function_call() + other.is_function_call() == 1:
             return False
         if self.is_function_call() and other.is_function_call() and \
@@ -33,6 +33,8 @@ class ASTStmt(ASTNode):
         compound_stmt = None
     """
 
+    __slots__ = ('small_stmt', 'compound_stmt')
+
     def __init__(self, small_stmt, compound_stmt, *args, **kwargs):
         """
         Standard constructor.
@@ -67,9 +69,9 @@ class ASTStmt(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -97,6 +99,8 @@ class ASTStmt(ASTNode):
     def equals(self, other=None):
         if not isinstance(other, ASTStmt):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if self.is_small_stmt() and other.is_small_stmt():
             return self.small_stmt.equals(other.small_stmt)
         if self.is_compound_stmt() and other.is_compound_stmt():
@@ -32,6 +32,8 @@ class ASTUnaryOperator(ASTNode):
         is_unary_tilde = False
     """
 
+    __slots__ = ('is_unary_plus', 'is_unary_minus', 'is_unary_tilde')
+
     def __init__(self, is_unary_plus=False, is_unary_minus=False, is_unary_tilde=False, *args, **kwargs):
         """
         Standard constructor.
@@ -66,9 +68,9 @@ class ASTUnaryOperator(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -93,6 +95,8 @@ class ASTUnaryOperator(ASTNode):
         """
         if not isinstance(other, ASTUnaryOperator):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return (self.is_unary_minus == other.is_unary_minus
                 and self.is_unary_plus == other.is_unary_plus
                 and self.is_unary_tilde == other.is_unary_tilde)
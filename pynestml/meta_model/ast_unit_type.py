@@ -52,6 +52,9 @@ class ASTUnitType(ASTNode):
         type_symbol = None
     """
 
+    __slots__ = ('is_encapsulated', 'compound_unit', 'base', 'is_pow', 'exponent', 'lhs', 'is_times', 'is_div', 'rhs',
+                 'unit', 'type_symbol')
+
     def __init__(self, is_encapsulated=False, compound_unit=None, base=None, is_pow=False,
                  exponent=None, lhs=None, rhs=None, is_div=False, is_times=False, _unit=None, type_symbol=None, *args, **kwargs):
         """
@@ -132,9 +135,9 @@ class ASTUnitType(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -218,6 +221,8 @@ class ASTUnitType(ASTNode):
         """
         if not isinstance(other, ASTUnitType):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         if self.is_encapsulated + other.is_encapsulated == 1:
             return False
         if self.is_encapsulated and other.is_encapsulated and not self.compound_unit.equals(other.compound_unit):
@@ -43,6 +43,8 @@ class ASTUpdateBlock(ASTNode):
         block = None
     """
 
+    __slots__ = ('block',)
+
     def __init__(self, block, *args, **kwargs):
         """
         Standard constructor.
@@ -68,9 +70,9 @@ class ASTUpdateBlock(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -107,4 +109,6 @@ class ASTUpdateBlock(ASTNode):
         """
         if not isinstance(other, ASTUpdateBlock):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.get_block().equals(other.get_block())
@@ -38,6 +38,8 @@ class ASTVariable(ASTNode):
         type_symbol = None
     """
 
+    __slots__ = ('name', 'differential_order', 'type_symbol')
+
     def __init__(self, name, differential_order=0, type_symbol=None, *args, **kwargs):
         """
         Standard constructor.
@@ -68,9 +70,9 @@ class ASTVariable(ASTNode):
          source_position=self.get_source_position(),
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
     def resolve_in_own_scope(self):
@@ -93,6 +95,7 @@ class ASTVariable(ASTNode):
         :name: the name to set.
         """
         self.name = name
+        self.structure_modified()
 
     def get_differential_order(self):
         """
@@ -102,6 +105,15 @@ class ASTVariable(ASTNode):
         """
         return self.differential_order
 
+    def set_differential_order(self, differential_order):
+        # type: (int) -> None
+        """
+        Sets the differential order of the variable.
+        :param differential_order: the differential order to set.
+        """
+        self.differential_order = differential_order
+        self.structure_modified()
+
     def get_complete_name(self):
         """
         Returns the complete name, consisting of the name and the differential order.
@@ -170,4 +182,6 @@ class ASTVariable(ASTNode):
         """
         if not isinstance(other, ASTVariable):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.get_name() == other.get_name() and self.get_differential_order() == other.get_differential_order()
@@ -33,6 +33,8 @@ class ASTWhileStmt(ASTNode):
         block = None
     """
 
+    __slots__ = ('block', 'condition')
+
     def __init__(self, condition:ASTExpression, block:ASTBlock, *args, **kwargs):
         """
         Standard constructor.
@@ -67,9 +69,9 @@ class ASTWhileStmt(ASTNode):
          source_position=self.source_position,
          scope=self.scope,
          comment=self.comment,
-         pre_comments=[s for s in self.pre_comments],
+         pre_comments=self.pre_comments,
          in_comment=self.in_comment,
-         post_comments=[s for s in self.post_comments],
+         post_comments=self.post_comments,
          implicit_conversion_factor=self.implicit_conversion_factor)
 
         return dup
@@ -118,4 +120,6 @@ class ASTWhileStmt(ASTNode):
         """
         if not isinstance(other, ASTWhileStmt):
             return False
+        if self.has_different_structural_hash(other):
+            return False
         return self.get_condition().equals(other.get_condition()) and self.get_block().equals(other.get_block())
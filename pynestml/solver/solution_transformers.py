@@ -125,7 +125,7 @@ def functional_shapes_to_odes(neuron, transformed_shapes):
             if declaration.get_variable().get_name() in shape_names:
                 shapes_to_delete.append(declaration)
     for declaration in shapes_to_delete:
-        neuron.get_equations_block().get_declarations().remove(declaration)
+        neuron.get_equations_block().delete_declaration(declaration)
 
     state_shape_variables_declarations = {}
     for shape_name in shape_names:
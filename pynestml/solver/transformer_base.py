@@ -166,10 +166,9 @@ def replace_integrate_call(neuron, update_instructions):
         block = neuron.get_parent(neuron.get_parent(small_statement))
         assert (block is not None and isinstance(block, ASTBlock))
 
-        for i in range(0, len(block.get_stmts())):
-            if block.get_stmts()[i].equals(neuron.get_parent(small_statement)):
-                del block.get_stmts()[i]
-                block.get_stmts()[i:i] = list((ModelParser.parse_stmt(prop) for prop in update_instructions))
+        for stmt in block.get_stmts():
+            if stmt.equals(neuron.get_parent(small_statement)):
+                block.replace_stmt(stmt, list((ModelParser.parse_stmt(prop) for prop in update_instructions)))
                 break
     return neuron
 
@@ -215,7 +214,7 @@ def add_assignment_to_update_block(assignment, neuron):
                                                       source_position=ASTSourceLocation.get_added_source_position())
     stmt = ASTNodeFactory.create_ast_stmt(small_stmt=small_stmt,
                                           source_position=ASTSourceLocation.get_added_source_position())
-    neuron.get_update_blocks().get_block().get_stmts().append(stmt)
+    neuron.get_update_blocks().get_block().add_stmt(stmt)
     return neuron
 
 
@@ -231,7 +230,7 @@ def add_declaration_to_update_block(declaration, neuron):
                                                       source_position=ASTSourceLocation.get_added_source_position())
     stmt = ASTNodeFactory.create_ast_stmt(small_stmt=small_stmt,
                                           source_position=ASTSourceLocation.get_added_source_position())
-    neuron.get_update_blocks().get_block().get_stmts().append(stmt)
+    neuron.get_update_blocks().get_block().add_stmt(stmt)
     return neuron
 
 
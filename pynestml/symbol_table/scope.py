@@ -29,9 +29,18 @@ class Scope(object):
     Attributes:
         enclosing_scope The scope this scope is enclosed in. Type: Scope
         declared_elements Elements declared in this scope, i.e., scopes and symbols. Type: list(Scope,Symbol)
+        symbols_by_key Index of the symbols declared in this scope: map from (name, kind) tuples to the symbols with
+                       this name and kind, in the order of their declaration. Type: dict((str,SymbolKind)->list(Symbol))
+        scopes The sub-scopes declared in this scope, in the order of their declaration. Type: list(Scope)
         scope_type The type of this scope. Type: ScopeType
         source_position The position in the source file this scope spans over.
+
+    Scopes are modified by add_symbol(), update_variable_symbol(), add_scope(), delete_symbol() and delete_scope()
+    only; each modification of any scope, as well as each update of a variable symbol by one of its setters, increments
+    the class attribute modification_count, such that queries derived from the symbols of a scope can be cached,
+    cf. ASTNeuron.get_derived_view().
     """
+    modification_count = 0
 
     def __init__(self, scope_type, enclosing_scope=None, source_position=None):
         """
@@ -44,6 +53,8 @@ class Scope(object):
         :type source_position: ast_source_location
         """
         self.declared_elements = list()
+        self.symbols_by_key = dict()
+        self.scopes = list()
         self.scope_type = scope_type
         self.enclosing_scope = enclosing_scope
         self.source_position = source_position
@@ -55,14 +66,14 @@ class Scope(object):
         :type symbol: Symbol
         """
         self.declared_elements.append(symbol)
+        self.symbols_by_key.setdefault((symbol.get_symbol_name(), symbol.get_symbol_kind()), []).append(symbol)
+        Scope.modification_count += 1
 
     def update_variable_symbol(self, _symbol):
-        for symbol in self.get_symbols_in_this_scope():
-            if (symbol.get_symbol_kind() == SymbolKind.VARIABLE
-                    and symbol.get_symbol_name() == _symbol.get_symbol_name()):
-                self.declared_elements.remove(symbol)
-                self.add_symbol(_symbol)
-                break
+        symbols = self.symbols_by_key.get((_symbol.get_symbol_name(), SymbolKind.VARIABLE))
+        if symbols:
+            self.delete_symbol(symbols[0])
+            self.add_symbol(_symbol)
 
     def add_scope(self, scope):
         """
@@ -71,6 +82,8 @@ class Scope(object):
         :type scope: Scope
         """
         self.declared_elements.append(scope)
+        self.scopes.append(scope)
+        Scope.modification_count += 1
 
     def delete_symbol(self, symbol):
         """
@@ -82,6 +95,11 @@ class Scope(object):
         """
         if symbol in self.declared_elements:
             self.declared_elements.remove(symbol)
+            key = (symbol.get_symbol_name(), symbol.get_symbol_kind())
+            self.symbols_by_key[key] = [other for other in self.symbols_by_key[key] if other is not symbol]
+            if len(self.symbols_by_key[key]) == 0:
+                del self.symbols_by_key[key]
+            Scope.modification_count += 1
             return True
         else:
             return False
@@ -96,6 +114,8 @@ class Scope(object):
         """
         if scope in self.declared_elements:
             self.declared_elements.remove(scope)
+            self.scopes.remove(scope)
+            Scope.modification_count += 1
             return True
         else:
             return False
@@ -130,11 +150,7 @@ class Scope(object):
         :return: a list of scope objects
         :rtype: list
         """
-        ret = list()
-        for elem in self.declared_elements:
-            if isinstance(elem, Scope):
-                ret.append(elem)
-        return ret
+        return list(self.scopes)
 
     def resolve_to_all_scopes(self, name, kind):
         """
@@ -167,11 +183,8 @@ class Scope(object):
         :return: the corresponding scope object.
         :rtype: Scope
         """
-        ret = list()
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                ret.append(self)
-        for elem in self.get_scopes():  # otherwise check if it is in one of the sub-scopes
+        ret = [self] * len(self.symbols_by_key.get((name, kind), ()))
+        for elem in self.scopes:  # otherwise check if it is in one of the sub-scopes
             temp = elem.__resolve_to_scope_in_spanned_scope(name, kind)
             if temp is not None:
                 ret.extend(temp)
@@ -211,11 +224,8 @@ class Scope(object):
         :return: the corresponding symbol object.
         :rtype: list(Symbol)
         """
-        ret = list()
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                ret.append(sim)
-        for elem in self.get_scopes():  # otherwise check if it is in one of the sub-scopes
+        ret = list(self.symbols_by_key.get((name, kind), ()))
+        for elem in self.scopes:  # otherwise check if it is in one of the sub-scopes
             temp = elem.__resolve_to_symbol_in_spanned_scope(name, kind)
             if temp is not None:
                 ret.extend(temp)
@@ -232,13 +242,12 @@ class Scope(object):
         :return: the first matching scope.
         :rtype: Scope.
         """
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                return self
-        if self.has_enclosing_scope():
-            return self.get_enclosing_scope().resolve_to_symbol(name, kind)
-        else:
-            return None
+        scope = self
+        while scope is not None:
+            if (name, kind) in scope.symbols_by_key:
+                return scope
+            scope = scope.get_enclosing_scope() if scope.has_enclosing_scope() else None
+        return None
 
     def resolve_to_symbol(self, name, kind):
         """
@@ -251,13 +260,14 @@ class Scope(object):
         :return: the first matching symbol.
         :rtype: variable_symbol or function_symbol
         """
-        for sim in self.get_symbols_in_this_scope():
-            if sim.get_symbol_name() == name and sim.get_symbol_kind() == kind:
-                return sim
-        if self.has_enclosing_scope():
-            return self.get_enclosing_scope().resolve_to_symbol(name, kind)
-        else:
-            return None
+        # only the index of each scope is inspected, thus the costs depend on the depth of this scope only
+        scope = self
+        while scope is not None:
+            symbols = scope.symbols_by_key.get((name, kind))
+            if symbols:
+                return symbols[0]
+            scope = scope.get_enclosing_scope() if scope.has_enclosing_scope() else None
+        return None
 
     def get_global_scope(self):
         """
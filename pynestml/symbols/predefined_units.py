@@ -17,8 +17,15 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+import tempfile
+import unicodedata
+
+import astropy
 from astropy import units as u
 
+import pynestml
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.messages import Messages
 from pynestml.utils.unit_type import UnitType
@@ -29,27 +36,92 @@ class PredefinedUnits(object):
     This class represents a collection of physical units. Units can be retrieved by means of get_unit(name).
     Attribute:
         name2unit (dict):  Dict of all predefined units, map from name to unit object.
+        snapshot_path (str):  Path to a file storing the collected units, such that they do not have to be collected
+                              from astropy on each run. If None, no snapshot is used.
     """
     name2unit = None
+    snapshot_path = None
 
     @classmethod
     def register_units(cls):
         """
         Registers all units in astropy.units (more specifically, from the si, cgs and astrophys submodules) as predefined units into NESTML.
+        Collecting these units takes long, thus the result is stored in a snapshot which is reused as long as the
+        versions of astropy and PyNestML do not change.
         """
-        # first store all base units and the derived units without the prefix in a list
+        unit_attributes = cls.__load_snapshot()
+        if unit_attributes is None:
+            unit_attributes = cls.__collect_unit_attributes()
+            cls.__store_snapshot(unit_attributes)
         cls.name2unit = {}
+        for (unit_name, unit_attribute) in unit_attributes:
+            cls.name2unit[unit_name] = UnitType(name=unit_name, unit=getattr(u, unit_attribute))
 
+    @classmethod
+    def __collect_unit_attributes(cls):
+        """
+        Collects all units in the si, cgs and astrophys submodules of astropy.units.
+        :return: a list of (unit name, name of the corresponding attribute of astropy.units) tuples.
+        :rtype: list((str,str))
+        """
+        # first store all base units and the derived units without the prefix in a list
+        unit_attributes = {}
         for unit_str in dir(u.si) + dir(u.cgs) + dir(u.astrophys):
-            try:
-                unit = eval("u." + unit_str)    # grab the unit object
-            except:
-                unit = None
-
+            # identifiers are normalized, e.g., the micro sign is resolved to the greek letter mu
+            unit_attribute = unicodedata.normalize('NFKC', unit_str)
+            unit = getattr(u, unit_attribute, None)    # grab the unit object
             if issubclass(type(unit), u.core.UnitBase):
                 for unit_name in unit.names:
-                    temp_unit = UnitType(name=str(unit_name), unit=unit)
-                    cls.name2unit[str(unit_name)] = temp_unit
+                    unit_attributes[str(unit_name)] = unit_attribute
+        return list(unit_attributes.items())
+
+    @classmethod
+    def __get_snapshot_versions(cls):
+        return {'astropy': astropy.__version__, 'pynestml': pynestml.__version__}
+
+    @classmethod
+    def __load_snapshot(cls):
+        """
+        Loads the collected units from the snapshot.
+        :return: a list of (unit name, name of the corresponding attribute of astropy.units) tuples, or None if no
+                 valid snapshot for the current versions exists.
+        :rtype: list((str,str))
+        """
+        if cls.snapshot_path is None:
+            return None
+        try:
+            with open(cls.snapshot_path) as f:
+                snapshot = json.load(f)
+            if snapshot['versions'] != cls.__get_snapshot_versions():
+                return None
+            unit_attributes = [(str(unit_name), str(unit_attribute))
+                               for (unit_name, unit_attribute) in snapshot['units']]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not all(issubclass(type(getattr(u, unit_attribute, None)), u.core.UnitBase)
+                   for (unit_name, unit_attribute) in unit_attributes):
+            return None
+        return unit_attributes
+
+    @classmethod
+    def __store_snapshot(cls, unit_attributes):
+        """
+        Stores the collected units in the snapshot.
+        :param unit_attributes: a list of (unit name, name of the corresponding attribute of astropy.units) tuples.
+        :type unit_attributes: list((str,str))
+        """
+        if cls.snapshot_path is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(cls.snapshot_path)), exist_ok=True)
+            handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(cls.snapshot_path)),
+                                                suffix='.tmp')
+            with os.fdopen(handle, 'w') as f:
+                json.dump({'versions': cls.__get_snapshot_versions(), 'units': unit_attributes}, f)
+            os.replace(tmp_path, cls.snapshot_path)
+        except OSError:
+            # the snapshot is an optimization only, thus failures are not reported
+            pass
 
     @classmethod
     def get_unit(cls, name):
@@ -24,6 +24,7 @@ from enum import Enum
 from pynestml.meta_model.ast_expression import ASTExpression
 from pynestml.meta_model.ast_input_port import ASTInputPort
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.symbol_table.scope import Scope
 from pynestml.symbols.symbol import Symbol
 from pynestml.symbols.symbol import SymbolKind
 
@@ -280,6 +281,7 @@ class VariableSymbol(Symbol):
         :type type_symbol: type_symbol
         """
         self.type_symbol = type_symbol
+        Scope.modification_count += 1
 
     def is_ode_defined(self):
         """
@@ -305,6 +307,7 @@ class VariableSymbol(Symbol):
         :type expression: ASTExpression
         """
         self.ode_declaration = expression
+        Scope.modification_count += 1
 
     def is_conductance_based(self):
         """
@@ -322,6 +325,7 @@ class VariableSymbol(Symbol):
         :type is_conductance_base: bool
         """
         self.is_conductance_based = is_conductance_base
+        Scope.modification_count += 1
 
     def get_variable_type(self):
         """
@@ -338,6 +342,7 @@ class VariableSymbol(Symbol):
         :rtype: VariableType
         """
         self.variable_type = v_type
+        Scope.modification_count += 1
 
     def has_initial_value(self):
         """
@@ -363,6 +368,7 @@ class VariableSymbol(Symbol):
         :type value: ASTExpression or ASTSimpleExpression
         """
         self.initial_value = value
+        Scope.modification_count += 1
 
     def equals(self, other):
         """
@@ -20,4 +20,5 @@
 
 __all__ = ['ast_utils', 'cloning_helpers', 'logger', 'stack', 'either', 'error_listener', 'error_strings',
            'logging_helper', 'messages', 'model_parser', 'ode_transformer', 'type_caster', 'type_dictionary',
-           'unit_type', 'ast_nestml_printer', 'source_location', 'port_signal_type']
+           'unit_type', 'ast_nestml_printer', 'source_location', 'port_signal_type',
+           'disk_cache', 'compilation_unit_pickler', 'profiler', 'log_sink', 'ast_node_index', 'ast_structural_key']
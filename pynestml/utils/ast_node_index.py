@@ -0,0 +1,107 @@
+#
+# ast_node_index.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+
+class ASTNodeIndex(object):
+    """
+    This class indexes the nodes of a neuron by their class, such that all nodes of a given type can be retrieved
+    without traversing the neuron. The index is built by a single traversal; it marks the neuron as the owner of all
+    indexed nodes, such that they report modifications to the neuron, cf. ASTNode.structure_modified(), and thus is
+    rebuilt on the next lookup once the structure of the neuron has been modified.
+
+        for variable in ASTNodeIndex.get_index(neuron).get_all(ASTVariable):
+            ...
+
+    Attributes:
+        neuron        The indexed neuron. Type: ASTNeuron
+        nodes         All nodes of the neuron in the order of traversal. Type: list(ASTNode)
+        by_type       Maps each queried type, and initially each class of the indexed nodes, to the list of nodes of
+                      this type in the order of traversal. Type: dict(type,list(ASTNode))
+        classes       The classes of the indexed nodes. Type: list(type)
+        version       The structure version of the neuron at the time of indexing. Type: int
+    """
+
+    def __init__(self, neuron):
+        """
+        Standard constructor. Indexes all nodes of the handed over neuron.
+        :param neuron: a single neuron.
+        :type neuron: ASTNeuron
+        """
+        self.neuron = neuron
+        self.nodes = list()
+        self.by_type = dict()
+
+        def index_node(node):
+            node.owner = neuron
+            self.nodes.append(node)
+            self.by_type.setdefault(type(node), list()).append(node)
+
+        neuron.accept(ASTHigherOrderVisitor(visit_funcs=index_node))
+        self.version = neuron.structure_version
+        self.classes = list(self.by_type.keys())
+
+    def is_valid(self):
+        """
+        Indicates whether the indexed tree has not been modified since it has been indexed.
+        :return: True if valid, otherwise False.
+        :rtype: bool
+        """
+        return self.version == self.neuron.structure_version
+
+    def get_all(self, node_type):
+        """
+        Returns all indexed nodes of the handed over type, including nodes of its subclasses, in the order of traversal.
+        :param node_type: a class of the meta_model.
+        :type node_type: type
+        :return: a new list of nodes.
+        :rtype: list(ASTNode)
+        """
+        nodes = self.by_type.get(node_type)
+        if nodes is None:
+            # nodes of more than one class have to be collected in the order of traversal
+            matching_classes = [cls for cls in self.classes if issubclass(cls, node_type)]
+            if len(matching_classes) == 1:
+                nodes = self.by_type[matching_classes[0]]
+            else:
+                nodes = [node for node in self.nodes if isinstance(node, node_type)]
+            self.by_type[node_type] = nodes
+        return list(nodes)
+
+    @classmethod
+    def get_index(cls, neuron):
+        """
+        Returns the index of the nodes of the handed over neuron, which is built if the neuron has not been indexed
+        yet or has been modified since.
+        :param neuron: a single neuron.
+        :type neuron: ASTNeuron
+        :return: the index of the neuron.
+        :rtype: ASTNodeIndex
+        """
+        if neuron.node_index is None or not neuron.node_index.is_valid():
+            previous_index = neuron.node_index
+            neuron.node_index = ASTNodeIndex(neuron)
+            if previous_index is not None:
+                # nodes which have been removed from the neuron do not belong to it anymore
+                indexed = set(id(node) for node in neuron.node_index.nodes)
+                for node in previous_index.nodes:
+                    if node.owner is neuron and id(node) not in indexed:
+                        node.owner = None
+        return neuron.node_index
@@ -0,0 +1,55 @@
+#
+# ast_structural_key.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+
+
+class ASTStructuralKey(object):
+    """
+    This class wraps a node, such that nodes which are equal by structure, cf. ASTNode.equals(), are equal keys of
+    dicts and elements of sets, e.g., to deduplicate expressions or to detect common subexpressions:
+
+        expressions_by_key = dict()
+        for expression in expressions:
+            expressions_by_key.setdefault(ASTStructuralKey(expression), expression)
+
+    The structural hash of the node is taken once, thus the node must not be modified while the key is in use.
+
+    Attributes:
+        node          The wrapped node. Type: ASTNode
+        hash          The structural hash of the node at the time of wrapping. Type: int
+    """
+
+    __slots__ = ('node', 'hash')
+
+    def __init__(self, node):
+        """
+        Standard constructor.
+        :param node: a single node.
+        :type node: ASTNode
+        """
+        self.node = node
+        self.hash = node.get_structural_hash()
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        if not isinstance(other, ASTStructuralKey):
+            return NotImplemented
+        return self.node is other.node or (self.hash == other.hash and self.node.equals(other.node))
@@ -197,17 +197,8 @@ class ASTUtils(object):
         :rtype: list(VariableSymbol)
         """
         ret = list()
-        from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
         from pynestml.meta_model.ast_variable import ASTVariable
-        res = list()
-
-        def loc_get_vars(node):
-            if isinstance(node, ASTVariable):
-                res.append(node)
-
-        ast.accept(ASTHigherOrderVisitor(visit_funcs=loc_get_vars))
-
-        for var in res:
+        for var in cls.get_all(ast, ASTVariable):
             if '\'' not in var.get_complete_name():
                 symbol = ast.get_scope().resolve_to_symbol(var.get_complete_name(), SymbolKind.VARIABLE)
                 if symbol is not None and symbol.is_function:
@@ -244,7 +235,8 @@ class ASTUtils(object):
     def get_all(cls, ast, node_type):
         """
         Finds all meta_model which are part of the tree as spanned by the handed over meta_model.
-        The type has to be specified.
+        The type has to be specified. The nodes of neurons are looked up in their index, cf. ASTNodeIndex, all other
+        trees are traversed.
         :param ast: a single meta_model node
         :type ast: AST_
         :param node_type: the type
@@ -252,7 +244,11 @@ class ASTUtils(object):
         :return: a list of all meta_model of the specified type
         :rtype: list(AST_)
         """
+        from pynestml.meta_model.ast_neuron import ASTNeuron
+        from pynestml.utils.ast_node_index import ASTNodeIndex
         from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+        if isinstance(ast, ASTNeuron):
+            return ASTNodeIndex.get_index(ast).get_all(node_type)
         ret = list()
 
         def loc_get_all_of_type(node):
@@ -294,16 +290,7 @@ class ASTUtils(object):
         :return: a list of all function calls contained in _ast
         :rtype: list(ASTFunctionCall)
         """
-        from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
-        from pynestml.meta_model.ast_function_call import ASTFunctionCall
-        ret = list()
-
-        def loc_get_function(node):
-            if isinstance(node, ASTFunctionCall) and node.get_name() == function_name:
-                ret.append(node)
-
-        ast.accept(ASTHigherOrderVisitor(loc_get_function, list()))
-        return ret
+        return [node for node in cls.get_all(ast, ASTFunctionCall) if node.get_name() == function_name]
 
     @classmethod
     def get_tuple_from_single_dict_entry(cls, dict_entry):
@@ -347,7 +334,7 @@ class ASTUtils(object):
         if neuron.get_internals_blocks() is None:
             internal = ASTNodeFactory.create_ast_block_with_variables(False, False, True, False, list(),
                                                                       ASTSourceLocation.get_added_source_position())
-            neuron.get_body().get_body_elements().append(internal)
+            neuron.get_body().add_body_element(internal)
         return neuron
 
     @classmethod
@@ -364,7 +351,7 @@ class ASTUtils(object):
         if neuron.get_internals_blocks() is None:
             state = ASTNodeFactory.create_ast_block_with_variables(True, False, False, False, list(),
                                                                    ASTSourceLocation.get_added_source_position())
-            neuron.get_body().get_body_elements().append(state)
+            neuron.get_body().add_body_element(state)
         return neuron
 
     @classmethod
@@ -382,7 +369,7 @@ class ASTUtils(object):
             initial_values = ASTNodeFactory. \
                 create_ast_block_with_variables(False, False, False, True, list(),
                                                 ASTSourceLocation.get_added_source_position())
-            neuron.get_body().get_body_elements().append(initial_values)
+            neuron.get_body().add_body_element(initial_values)
         return neuron
 
     @classmethod
@@ -413,7 +400,7 @@ class ASTUtils(object):
         """
         if neuron.get_state_blocks() is None:
             ASTUtils.create_state_block(neuron)
-        neuron.get_state_blocks().get_declarations().append(declaration)
+        neuron.get_state_blocks().add_declaration(declaration)
         return
 
     @classmethod
@@ -0,0 +1,104 @@
+#
+# compilation_unit_pickler.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import pickle
+
+from pynestml.symbols.function_symbol import FunctionSymbol
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.symbols.unit_type_symbol import UnitTypeSymbol
+from pynestml.symbols.variable_symbol import VariableSymbol
+from pynestml.utils.unit_type import UnitType
+
+UNIT = 'unit'
+TYPE = 'type'
+TYPE_UNIT = 'type_unit'
+VARIABLE = 'variable'
+FUNCTION = 'function'
+
+
+class CompilationUnitPickler(pickle.Pickler):
+    """
+    Serializes cache entries of the form (compilation unit, messages, registered units, registered types), cf.
+    ModelParser.parse_model(). Units, types and symbols which are currently registered as predefined ones are stored
+    by name only, since the toolchain compares them by identity. Only the units and types which have been registered
+    while parsing the compilation unit are stored by value, such that they can be registered again.
+    Attributes:
+        stored_by_value  The ids of all registered objects which are stored by value. Type: set(int)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(CompilationUnitPickler, self).__init__(*args, **kwargs)
+        self.stored_by_value = set()
+
+    def dump(self, obj):
+        (ast, messages, registered_units, registered_types) = obj
+        self.stored_by_value = set(id(registered) for registered in
+                                   list(registered_units.values()) + list(registered_types.values()))
+        super(CompilationUnitPickler, self).dump(obj)
+
+    def persistent_id(self, obj):
+        if id(obj) in self.stored_by_value:
+            return None
+        if isinstance(obj, UnitType):
+            if dict.get(PredefinedUnits.get_units(), obj.get_name()) is obj:
+                return UNIT, obj.get_name(), obj.get_unit()
+            type_symbol = dict.get(PredefinedTypes.get_types(), obj.get_name())
+            if isinstance(type_symbol, UnitTypeSymbol) and type_symbol.unit is obj:
+                return TYPE_UNIT, obj.get_name(), obj.get_unit()
+        if isinstance(obj, UnitTypeSymbol) and dict.get(PredefinedTypes.get_types(), obj.unit.get_name()) is obj:
+            return TYPE, obj.unit.get_name(), obj.unit.get_unit()
+        if isinstance(obj, VariableSymbol) and PredefinedVariables.get_variables().get(obj.get_symbol_name()) is obj:
+            return VARIABLE, obj.get_symbol_name()
+        if isinstance(obj, FunctionSymbol) and \
+                PredefinedFunctions.get_function_symbols().get(obj.get_symbol_name()) is obj:
+            return FUNCTION, obj.get_symbol_name()
+        return None
+
+
+class CompilationUnitUnpickler(pickle.Unpickler):
+    """
+    Deserializes cache entries as stored by the CompilationUnitPickler. References to predefined units, types and
+    symbols are resolved to the ones currently registered. If a referenced unit or type is not registered (yet), e.g.,
+    because it has been derived while processing a different model, it is registered.
+    """
+
+    def persistent_load(self, pid):
+        kind, name = pid[0], pid[1]
+        if kind == UNIT:
+            if name not in PredefinedUnits.get_units().keys():
+                PredefinedUnits.register_unit(UnitType(name=name, unit=pid[2]))
+            return PredefinedUnits.get_units()[name]
+        if kind == TYPE or kind == TYPE_UNIT:
+            if name not in PredefinedTypes.get_types().keys():
+                unit = PredefinedUnits.get_units().get(name)
+                if unit is None:
+                    unit = UnitType(name=name, unit=pid[2])
+                    PredefinedUnits.register_unit(unit)
+                # the message on the registration of the type has already been recorded, thus it is not logged again
+                PredefinedTypes.get_types()[name] = UnitTypeSymbol(unit=unit)
+            type_symbol = dict.get(PredefinedTypes.get_types(), name)
+            return type_symbol if kind == TYPE else type_symbol.unit
+        if kind == VARIABLE:
+            return PredefinedVariables.get_variables()[name]
+        if kind == FUNCTION:
+            return PredefinedFunctions.get_function_symbols()[name]
+        raise pickle.UnpicklingError('Unknown persistent id %s!' % str(pid))
@@ -0,0 +1,220 @@
+#
+# disk_cache.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+
+
+class DiskCache(object):
+    """
+    This class represents a persistent, content-addressed cache of arbitrary (picklable) objects. Each entry is stored
+    in a single file named after its key. Whenever the overall size of the cache exceeds the maximal size, the least
+    recently used entries are evicted. The entries are only listed to determine the size once, when the first entry is
+    stored, and on eviction, which shrinks the cache below the maximal size by a margin. In between, the size is
+    estimated from the sizes of the stored entries, thus storing N entries lists the cache O(1) rather than O(N) times.
+    Attributes:
+        path             The directory in which the entries are stored. Type: str
+        max_size         The maximal overall size of all entries in bytes. Type: int
+        pickler_class    The class used to serialize entries. Type: type(pickle.Pickler)
+        unpickler_class  The class used to deserialize entries. Type: type(pickle.Unpickler)
+        size             The estimated overall size of all entries in bytes, or None if not determined yet. Entries
+                         stored by other processes in the meantime are not included. Type: int
+    """
+    DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+    # the fraction of the maximal size to which the cache is shrunk on eviction by store
+    EVICTION_TARGET = 0.75
+    ENTRY_SUFFIX = '.pickle'
+
+    def __init__(self, path, max_size=DEFAULT_MAX_SIZE, pickler_class=pickle.Pickler,
+                 unpickler_class=pickle.Unpickler):
+        """
+        Standard constructor.
+        :param path: the directory in which the entries are stored.
+        :type path: str
+        :param max_size: the maximal overall size of all entries in bytes.
+        :type max_size: int
+        :param pickler_class: the class used to serialize entries, e.g., one which implements persistent_id().
+        :type pickler_class: type(pickle.Pickler)
+        :param unpickler_class: the class used to deserialize entries, e.g., one which implements persistent_load().
+        :type unpickler_class: type(pickle.Unpickler)
+        """
+        self.path = path
+        self.max_size = max_size
+        self.pickler_class = pickler_class
+        self.unpickler_class = unpickler_class
+        self.size = None
+
+    @classmethod
+    def compute_key(cls, *parts):
+        """
+        Computes a key from the handed over parts, e.g., the content of a file and the version of the toolchain.
+        :param parts: a list of str or bytes objects.
+        :type parts: list(str or bytes)
+        :return: a hex digest which can be used as key.
+        :rtype: str
+        """
+        key = hashlib.sha256()
+        for part in parts:
+            if not isinstance(part, bytes):
+                part = str(part).encode('utf-8')
+            # prefix each part with its length, such that different sequences of parts never collide
+            key.update(str(len(part)).encode('utf-8') + b':')
+            key.update(part)
+        return key.hexdigest()
+
+    def get_entry_path(self, key):
+        """
+        Returns the path to the file which stores the entry with the handed over key.
+        :param key: a key as computed by compute_key().
+        :type key: str
+        :return: the path to the entry.
+        :rtype: str
+        """
+        return os.path.join(self.path, key[:2], key + self.ENTRY_SUFFIX)
+
+    def load(self, key):
+        """
+        Returns the object stored under the handed over key.
+        :param key: a key as computed by compute_key().
+        :type key: str
+        :return: the stored object, or None if no (readable) entry exists.
+        :rtype: object
+        """
+        entry_path = self.get_entry_path(key)
+        try:
+            with open(entry_path, 'rb') as f:
+                obj = self.unpickler_class(f).load()
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # the entry is broken or has been written by an incompatible version, thus discard it
+            self.delete(key)
+            return None
+        # mark the entry as recently used
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+        return obj
+
+    def store(self, key, obj):
+        """
+        Stores the handed over object under the handed over key. The entry is written atomically, thus several
+        processes can use the same cache concurrently.
+        :param key: a key as computed by compute_key().
+        :type key: str
+        :param obj: a picklable object.
+        :type obj: object
+        """
+        entry_path = self.get_entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+            handle, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix='.tmp')
+            try:
+                with os.fdopen(handle, 'wb') as f:
+                    self.pickler_class(f, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+                    entry_size = f.tell()
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except (OSError, pickle.PicklingError, RecursionError):
+            # caching is an optimization only, thus failures are not reported
+            return
+        if self.size is None:
+            self.size = self.get_size()
+        else:
+            # a replaced entry is counted twice, which merely results in an earlier eviction
+            self.size += entry_size
+        if self.size > self.max_size:
+            # shrink the cache by a margin, such that the following stores do not evict again right away
+            self.evict(int(self.max_size * self.EVICTION_TARGET))
+
+    def delete(self, key):
+        """
+        Deletes the entry with the handed over key if it exists.
+        :param key: a key as computed by compute_key().
+        :type key: str
+        """
+        try:
+            os.remove(self.get_entry_path(key))
+        except OSError:
+            pass
+
+    def get_entries(self):
+        """
+        Returns all entries of the cache, sorted from the least to the most recently used one.
+        :return: a list of (last access time, size, path) tuples.
+        :rtype: list((float,int,str))
+        """
+        entries = list()
+        if not os.path.isdir(self.path):
+            return entries
+        for dirpath, dirnames, filenames in os.walk(self.path):
+            for filename in filenames:
+                if filename.endswith(self.ENTRY_SUFFIX):
+                    try:
+                        stat = os.stat(os.path.join(dirpath, filename))
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, os.path.join(dirpath, filename)))
+        entries.sort()
+        return entries
+
+    def get_size(self):
+        """
+        Returns the overall size of all entries.
+        :return: the size in bytes.
+        :rtype: int
+        """
+        return sum(size for (mtime, size, path) in self.get_entries())
+
+    def evict(self, target_size=None):
+        """
+        Deletes the least recently used entries if the overall size of the cache exceeds the maximal size, until it
+        does not exceed the target size.
+        :param target_size: the size to shrink the cache to, by default the maximal size
+        :type target_size: int
+        """
+        entries = self.get_entries()
+        size = sum(entry_size for (mtime, entry_size, path) in entries)
+        if size <= self.max_size:
+            target_size = size
+        elif target_size is None:
+            target_size = self.max_size
+        for (mtime, entry_size, path) in entries:
+            if size <= target_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= entry_size
+        self.size = size
+
+    def clear(self):
+        """
+        Deletes all entries of the cache.
+        """
+        if os.path.isdir(self.path):
+            shutil.rmtree(self.path, ignore_errors=True)
+        self.size = 0
@@ -0,0 +1,152 @@
+#
+# log_sink.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import json
+from collections import OrderedDict
+
+
+class LogSink(object):
+    """
+    This class streams the messages received by the Logger to a file in JSON Lines notation, i.e., one JSON object per
+    line and message, in the order in which they are received. Messages are collected in a bounded buffer, which is
+    written whenever it is full, whenever an error is received and when the sink is closed; thus, even if a run is
+    aborted, the file contains all errors received so far, and the memory required does not grow with the number of
+    messages.
+
+    A sink receives messages once it has been handed over to the Logger:
+
+        sink = LogSink('report/log.jsonl')
+        Logger.set_sink(sink)
+        ...
+        Logger.set_sink(None)
+        sink.close()
+        for message in LogSink.read_messages('report/log.jsonl'):
+            print(message['severity'], message['message'])
+
+    Attributes:
+        file_path    The path to the file the messages are written to. Type: str
+        buffer_size  The maximal number of messages which are kept in memory before they are written. Type: int
+        buffer       The messages which have not been written yet, as (message id, line) tuples. Type: list
+        batches      For each write of the buffer, the id of its first message and the offset in the file at which it
+                     has been written, such that written messages can be discarded again. Type: list((int,int))
+        last_written The id of the last message written to the file, or None. Type: int
+        file         The file the messages are written to. Type: file
+    """
+    DEFAULT_BUFFER_SIZE = 1000
+
+    def __init__(self, file_path, buffer_size=DEFAULT_BUFFER_SIZE):
+        """
+        Standard constructor. An existing file is overwritten.
+        :param file_path: the path to the file.
+        :type file_path: str
+        :param buffer_size: the maximal number of messages which are kept in memory before they are written.
+        :type buffer_size: int
+        """
+        self.file_path = file_path
+        self.buffer_size = max(buffer_size, 1)
+        self.buffer = list()
+        self.batches = list()
+        self.last_written = None
+        self.file = open(file_path, 'wb+')
+
+    def write(self, message, flush=False):
+        """
+        Appends the handed over message.
+        :param message: the message as a dict which can be represented in JSON notation. Its key 'id' has to be an int
+                        which is greater than the ids of all previous messages.
+        :type message: dict
+        :param flush: whether the message shall be written to the file immediately, e.g., in the case of an error.
+        :type flush: bool
+        """
+        self.buffer.append((message['id'], json.dumps(message)))
+        if flush or len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered messages to the file.
+        """
+        if len(self.buffer) == 0 or self.file.closed:
+            return
+        self.batches.append((self.buffer[0][0], self.file.tell()))
+        self.file.write(''.join(line + '\n' for (message_id, line) in self.buffer).encode('utf-8'))
+        self.file.flush()
+        self.last_written = self.buffer[-1][0]
+        self.buffer = list()
+
+    def discard(self, message_id):
+        """
+        Discards all messages whose id is equal to or greater than the handed over one, e.g., if the Logger is rolled
+        back to a checkpoint. Takes time proportional to the number of discarded messages and the size of the buffer.
+        :param message_id: the id of the first message to discard.
+        :type message_id: int
+        """
+        while len(self.buffer) > 0 and self.buffer[-1][0] >= message_id:
+            self.buffer.pop()
+        if self.file.closed or self.last_written is None or self.last_written < message_id:
+            return
+        # all buffered messages are newer than the written ones, thus the buffer is empty now. The discarded messages
+        # are at the end of the file: find the batch which contains the first of them, truncate the file at the start
+        # of this batch and write the messages of the batch which are retained again
+        (first_id, offset) = self.batches.pop()
+        while first_id >= message_id and len(self.batches) > 0:
+            (first_id, offset) = self.batches.pop()
+        self.file.seek(offset)
+        lines = self.file.read().decode('utf-8').splitlines()
+        self.file.seek(offset)
+        self.file.truncate(offset)
+        for line in lines:
+            line_id = json.loads(line)['id']
+            if line_id < message_id:
+                self.buffer.append((line_id, line))
+        # all messages still written have smaller ids than the discarded ones
+        self.last_written = message_id - 1 if len(self.batches) > 0 else None
+        self.flush()
+
+    def close(self):
+        """
+        Writes all buffered messages and closes the file.
+        """
+        self.flush()
+        if not self.file.closed:
+            self.file.close()
+
+    def iter_messages(self):
+        """
+        Returns an iterator over all messages received so far, which reads the messages from the file one by one.
+        :return: an iterator over the messages as dicts.
+        :rtype: iterator(dict)
+        """
+        self.flush()
+        return self.read_messages(self.file_path)
+
+    @classmethod
+    def read_messages(cls, file_path):
+        """
+        Returns an iterator over the messages stored in the handed over file, e.g., by a previous run, which reads the
+        messages from the file one by one.
+        :param file_path: the path to a file in JSON Lines notation.
+        :type file_path: str
+        :return: an iterator over the messages as dicts.
+        :rtype: iterator(dict)
+        """
+        with open(file_path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line, object_pairs_hook=OrderedDict)
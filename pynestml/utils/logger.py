@@ -17,7 +17,9 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import io
 import json
+import sys
 from collections import OrderedDict
 
 from enum import Enum
@@ -40,12 +42,23 @@ class Logger(object):
         curr_message A counter indicating the current message, this enables a sorting by the number of message
         logging_level Indicates messages of which level shall be printed to the screen.
         current_neuron The currently processed model. This enables to retrieve all messages belonging to a certain model
+        recordings A stack of lists in which all received messages, and the output written to an OutputRecorder, are
+                   additionally recorded, such that they can be replayed later, e.g., in a different process
+        messages_by_artifact Index of the log: map from artifact name (str) to the ids of its messages, in order
+        messages_by_level Index of the log: map from logging level to the ids of its messages, in order
+        error_counts Map from artifact name (str) to the number of errors reported for it
+        sink      If not None, a LogSink to which all messages of the log are streamed as they are received
     """
     log = {}
     curr_message = None
     logging_level = None
     current_neuron = None
     no_print = False
+    recordings = []
+    messages_by_artifact = {}
+    messages_by_level = {}
+    error_counts = {}
+    sink = None
 
     @classmethod
     def init_logger(cls, logging_level):
@@ -57,6 +70,9 @@ class Logger(object):
         cls.logging_level = logging_level
         cls.curr_message = 0
         cls.log = {}
+        cls.messages_by_artifact = {}
+        cls.messages_by_level = {}
+        cls.error_counts = {}
         return
 
     @classmethod
@@ -77,6 +93,72 @@ class Logger(object):
         """
         cls.log = log
         cls.curr_message = counter
+        cls.messages_by_artifact = {}
+        cls.messages_by_level = {}
+        cls.error_counts = {}
+        for message_nr in log.keys():
+            cls.__add_to_indexes(message_nr)
+
+    @classmethod
+    def checkpoint(cls):
+        """
+        Returns the current state of the log, such that all messages received afterwards can be discarded by means of
+        rollback(), e.g., the messages of a transformation which is undone. Takes constant time.
+        :return: a checkpoint.
+        :rtype: (int,list(int))
+        """
+        return cls.curr_message, [len(recording) for recording in cls.recordings]
+
+    @classmethod
+    def rollback(cls, checkpoint):
+        """
+        Discards all messages received since the handed over checkpoint, from the log as well as from all recordings,
+        and resets the message counter. Takes time proportional to the number of discarded messages only.
+        :param checkpoint: a checkpoint as returned by checkpoint().
+        :type checkpoint: (int,list(int))
+        """
+        counter, recording_lengths = checkpoint
+        if cls.curr_message is None or counter > cls.curr_message:
+            # the logger has been initialized again since the checkpoint
+            return
+        # the indexes are in the order of the messages, thus the discarded messages are at their ends
+        for message_nr in range(cls.curr_message - 1, counter - 1, -1):
+            if message_nr not in cls.log:
+                continue
+            (artifact_name, neuron, log_level, code, error_position, message) = cls.log.pop(message_nr)
+            cls.messages_by_artifact[artifact_name].pop()
+            cls.messages_by_level[log_level].pop()
+            if log_level == LoggingLevel.ERROR:
+                cls.error_counts[artifact_name] -= 1
+        for (recording, length) in zip(cls.recordings, recording_lengths):
+            # the output has been printed already, thus it is kept
+            recording[length:] = [entry for entry in recording[length:] if isinstance(entry, str)]
+        if cls.sink is not None:
+            cls.sink.discard(counter)
+        cls.curr_message = counter
+
+    @classmethod
+    def set_sink(cls, sink):
+        """
+        Sets the handed over sink, to which all messages of the log received from now on are streamed.
+        :param sink: a single sink, or None if messages shall not be streamed anymore.
+        :type sink: LogSink
+        """
+        cls.sink = sink
+
+    @classmethod
+    def __add_to_indexes(cls, message_nr):
+        """
+        Adds the handed over message of the log to the indexes, such that queries for the messages of a neuron or a
+        level do not have to inspect the whole log.
+        :param message_nr: the id of the message in the log.
+        :type message_nr: int
+        """
+        (artifact_name, neuron, log_level, code, error_position, message) = cls.log[message_nr]
+        cls.messages_by_artifact.setdefault(artifact_name, []).append(message_nr)
+        cls.messages_by_level.setdefault(log_level, []).append(message_nr)
+        if log_level == LoggingLevel.ERROR:
+            cls.error_counts[artifact_name] = cls.error_counts.get(artifact_name, 0) + 1
 
     @classmethod
     def log_message(cls, neuron=None, code=None, message=None, error_position=None, log_level=None):
@@ -102,12 +184,22 @@ class Logger(object):
             '(PyNestML.Logger) Wrong type of neuron provided (%s)!' % type(neuron)
         assert (error_position is None or isinstance(error_position, ASTSourceLocation)), \
             '(PyNestML.Logger) Wrong type of error position provided (%s)!' % type(error_position)
+        for recording in cls.recordings:
+            recording.append((neuron if neuron is not None else cls.current_neuron, code, message, error_position,
+                              log_level))
         if isinstance(neuron, ASTNeuron):
             cls.log[cls.curr_message] = (
                 neuron.get_artifact_name(), neuron, log_level, code, error_position, message)
         elif cls.current_neuron is not None:
             cls.log[cls.curr_message] = (cls.current_neuron.get_artifact_name(), cls.current_neuron,
                                          log_level, code, error_position, message)
+        if cls.curr_message in cls.log:
+            cls.__add_to_indexes(cls.curr_message)
+            if cls.sink is not None:
+                json_object = OrderedDict(id=cls.curr_message)
+                json_object.update(cls.__to_json_object(cls.curr_message))
+                # errors are written immediately, such that they are not lost if the run is aborted
+                cls.sink.write(json_object, flush=log_level == LoggingLevel.ERROR)
         cls.curr_message += 1
         if cls.no_print:
             return
@@ -121,6 +213,51 @@ class Logger(object):
             print(to_print)
         return
 
+    @classmethod
+    def start_recording(cls):
+        """
+        Starts recording all received messages, such that they can be replayed by means of replay_messages().
+        Recordings can be nested. The output written to an OutputRecorder in the meantime is recorded as well, in
+        order with the messages.
+        """
+        cls.recordings.append(list())
+
+    @classmethod
+    def stop_recording(cls):
+        """
+        Stops the innermost recording and returns all messages received since the corresponding call of
+        start_recording().
+        :return: a list of recorded messages, and of recorded output as strings.
+        :rtype: list((ASTNeuron,MessageCode,str,ASTSourceLocation,LoggingLevel) or str)
+        """
+        return cls.recordings.pop()
+
+    @classmethod
+    def record_output(cls, text):
+        """
+        Records the handed over output in all recordings.
+        :param text: the output, e.g., as printed.
+        :type text: str
+        """
+        for recording in cls.recordings:
+            recording.append(text)
+
+    @classmethod
+    def replay_messages(cls, messages):
+        """
+        Logs the handed over recorded messages in their original order as if they had been received just now. The
+        recorded output is printed in between.
+        :param messages: a list of messages as returned by stop_recording().
+        :type messages: list((ASTNeuron,MessageCode,str,ASTSourceLocation,LoggingLevel) or str)
+        """
+        for entry in messages:
+            if isinstance(entry, str):
+                sys.stdout.write(entry)
+                continue
+            (neuron, code, message, error_position, log_level) = entry
+            cls.log_message(neuron=neuron, code=code, message=message, error_position=error_position,
+                            log_level=log_level)
+
     @classmethod
     def string_to_level(cls, string):
         """
@@ -176,11 +313,12 @@ class Logger(object):
         """
         if level is None and neuron is None:
             return cls.get_log()
+        if neuron is None:
+            return cls.get_all_messages_of_level(level)
         ret = list()
-        for (artifactName, neuron_i, logLevel, code, errorPosition, message) in cls.log.values():
-            if (level == logLevel if level is not None else True) and (
-                    neuron if neuron is not None else True) and (
-                    neuron.get_artifact_name() == artifactName if neuron is not None else True):
+        for message_nr in cls.messages_by_artifact.get(neuron.get_artifact_name(), ()):
+            (artifactName, neuron_i, logLevel, code, errorPosition, message) = cls.log[message_nr]
+            if level == logLevel if level is not None else True:
                 ret.append((neuron, logLevel, message))
         return ret
 
@@ -196,9 +334,9 @@ class Logger(object):
         if level is None:
             return cls.get_log()
         ret = list()
-        for (artifactName, neuron, logLevel, code, errorPosition, message) in cls.log.values():
-            if level == logLevel:
-                ret.append((neuron, logLevel, message))
+        for message_nr in cls.messages_by_level.get(level, ()):
+            (artifactName, neuron, logLevel, code, errorPosition, message) = cls.log[message_nr]
+            ret.append((neuron, logLevel, message))
         return ret
 
     @classmethod
@@ -213,9 +351,9 @@ class Logger(object):
         if neuron is None:
             return cls.get_log()
         ret = list()
-        for (artifactName, neuron_i, logLevel, code, errorPosition, message) in cls.log.values():
-            if (neuron_i == neuron if neuron is not None else True) and \
-                    (neuron.get_artifact_name() == artifactName if neuron is not None else True):
+        for message_nr in cls.messages_by_artifact.get(neuron.get_artifact_name(), ()):
+            (artifactName, neuron_i, logLevel, code, errorPosition, message) = cls.log[message_nr]
+            if neuron_i == neuron:
                 ret.append((neuron, logLevel, message))
         return ret
 
@@ -228,7 +366,51 @@ class Logger(object):
         :return: True if errors detected, otherwise False
         :rtype: bool
         """
-        return len(cls.get_all_messages_of_level_and_or_neuron(neuron, LoggingLevel.ERROR)) > 0
+        if neuron is None:
+            return len(cls.messages_by_level.get(LoggingLevel.ERROR, ())) > 0
+        return cls.error_counts.get(neuron.get_artifact_name(), 0) > 0
+
+    @classmethod
+    def __to_json_object(cls, message_nr):
+        """
+        Returns the handed over message of the log as a dict which can be represented in JSON notation.
+        :param message_nr: the id of the message in the log.
+        :type message_nr: int
+        :return: the message.
+        :rtype: OrderedDict
+        """
+        (artifact_name, neuron, log_level, code, error_position, message) = cls.log[message_nr]
+        return cls.to_json_object(artifact_name, neuron, log_level, code, error_position, message)
+
+    @classmethod
+    def to_json_object(cls, artifact_name, neuron, log_level, code, error_position, message):
+        """
+        Returns the handed over message as a dict which can be represented in JSON notation.
+        :param artifact_name: the name of the file the message belongs to, or None.
+        :type artifact_name: str
+        :param neuron: the neuron the message belongs to, or None.
+        :type neuron: ast_neuron
+        :param log_level: the corresponding log level.
+        :type log_level: LoggingLevel
+        :param code: a single message code, or None.
+        :type code: MessageCode
+        :param error_position: the position the message refers to, or None.
+        :type error_position: ASTSourceLocation
+        :param message: a message.
+        :type message: str
+        :return: the message.
+        :rtype: OrderedDict
+        """
+        ret = OrderedDict()
+        ret['filename'] = artifact_name
+        ret['neuronName'] = neuron.get_name() if neuron is not None else 'GLOBAL'
+        ret['severity'] = str(log_level.name)
+        if code is not None:
+            ret['code'] = code.name
+        ret['row'] = str(error_position.get_start_line()) if error_position is not None else ''
+        ret['col'] = str(error_position.get_start_column()) if error_position is not None else ''
+        ret['message'] = str(message)
+        return ret
 
     @classmethod
     def get_json_format(cls):
@@ -237,36 +419,8 @@ class Logger(object):
         :return: a str containing the log
         :rtype: str
         """
-        ret = '['
-        for messageNr in cls.log.keys():
-            (artifactName, neuron, logLevel, code, errorPosition, message) = cls.log[messageNr]
-            ret += '{' + \
-                   '"filename":"' + \
-                   artifactName + \
-                   '", ' + \
-                   '"neuronName":"' + \
-                   (neuron.get_name() if neuron is not None else 'GLOBAL') + '", ' + \
-                   '"severity":"' \
-                   + str(logLevel.name) + '", '
-            if not code is None:
-                ret += '"code":"' + \
-                       code.name + \
-                       '", '
-            ret += '"row":"' + \
-                   (str(errorPosition.get_start_line()) if errorPosition is not None else '') + \
-                   '", ' + \
-                   '"col":"' \
-                   + (str(errorPosition.get_start_column()) if errorPosition is not None else '') + \
-                   '", ' + \
-                   '"message":"' + str(message).replace('"', "'") + '"}'
-            ret += ','
-        if len(cls.log.keys()) == 0:
-            parsed = json.loads('[]', object_pairs_hook=OrderedDict)
-        else:
-            ret = ret[:-1]  # delete the last ","
-            ret += ']'
-            parsed = json.loads(ret, object_pairs_hook=OrderedDict)
-        return json.dumps(parsed, indent=2, sort_keys=False)
+        return json.dumps([cls.__to_json_object(message_nr) for message_nr in cls.log.keys()], indent=2,
+                          sort_keys=False)
 
 
 class LoggingLevel(Enum):
@@ -277,3 +431,20 @@ class LoggingLevel(Enum):
     WARNING = 1
     ERROR = 2
     NO = 3
+
+
+class OutputRecorder(io.TextIOBase):
+    """
+    A text stream which records everything written to it in the current recordings of the logger, e.g., the output of
+    a worker process, whose standard output is redirected to it:
+
+        with contextlib.redirect_stdout(OutputRecorder()):
+            ...
+    """
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        Logger.record_output(text)
+        return len(text)
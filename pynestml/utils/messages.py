@@ -334,6 +334,43 @@ class Messages(object):
         message = 'Successfully generated NEST module code in \'' + path + '\' !'
         return MessageCode.MODULE_SUCCESSFULLY_GENERATED, message
 
+    @classmethod
+    def get_code_up_to_date(cls, name, path):
+        """
+        Returns a message indicating that the code for a neuron or module has not been generated again, since neither
+        the model nor the toolchain have changed since the last generation.
+        :param name: the name of the neuron or module.
+        :type name: str
+        :param path: the path to the generated files
+        :type path: str
+        :return: a message
+        :rtype: (MessageCode,str)
+        """
+        assert (name is not None and isinstance(name, str)), \
+            '(PyNestML.Utils.Message) Not a string provided (%s)!' % type(name)
+        assert (path is not None and isinstance(path, str)), \
+            '(PyNestML.Utils.Message) Not a string provided (%s)!' % type(path)
+        message = 'Code for \'' + name + '\' in \'' + path + '\' is up to date, thus it is not generated again.'
+        return MessageCode.CODE_UP_TO_DATE, message
+
+    @classmethod
+    def get_processing_failed(cls, path, exception):
+        """
+        Returns a message indicating that processing a file in watch mode has failed, and that the file is processed
+        again as soon as it is modified.
+        :param path: the path to the file
+        :type path: str
+        :param exception: the exception by which processing has failed
+        :type exception: Exception
+        :return: a message
+        :rtype: (MessageCode,str)
+        """
+        assert (path is not None and isinstance(path, str)), \
+            '(PyNestML.Utils.Message) Not a string provided (%s)!' % type(path)
+        message = 'Processing \'' + path + '\' failed (' + type(exception).__name__ + ': ' + str(exception) \
+                  + '), waiting for further changes.'
+        return MessageCode.PROCESSING_FAILED, message
+
     @classmethod
     def get_variable_used_before_declaration(cls, variable_name):
         """
@@ -1070,3 +1107,5 @@ class MessageCode(Enum):
     TARGET_PATH_INFO = 68
     ODE_FUNCTION_NEEDS_CONSISTENT_UNITS = 69
     EMIT_SPIKE_FUNCTION_BUT_NO_OUTPUT_PORT = 70
+    CODE_UP_TO_DATE = 71
+    PROCESSING_FAILED = 72
@@ -17,12 +17,16 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
-import copy
+import glob
+import os
+from collections import OrderedDict
 
 from antlr4 import *
 from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
 from antlr4.error.ErrorListener import ConsoleErrorListener
+from antlr4.error.Errors import ParseCancellationException
 
+import pynestml
 from pynestml.generated.PyNestMLLexer import PyNestMLLexer
 from pynestml.generated.PyNestMLParser import PyNestMLParser
 from pynestml.meta_model.ast_arithmetic_operator import ASTArithmeticOperator
@@ -65,15 +69,37 @@ from pynestml.meta_model.ast_update_block import ASTUpdateBlock
 from pynestml.meta_model.ast_variable import ASTVariable
 from pynestml.meta_model.ast_while_stmt import ASTWhileStmt
 from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.disk_cache import DiskCache
 from pynestml.utils.logger import Logger, LoggingLevel
-from pynestml.utils.messages import Messages
+from pynestml.utils.messages import Messages, MessageCode
+from pynestml.utils.profiler import Profiler
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
 from pynestml.visitors.ast_symbol_table_visitor import ASTSymbolTableVisitor
 from pynestml.utils.error_listener import NestMLErrorListener
 
 class ModelParser(object):
+    """
+    Attributes:
+        compilation_unit_cache  If not None, parsed compilation units are stored in and retrieved from this cache, such
+                                that unchanged files do not have to be parsed again. Type: DiskCache
+        source_hash             A hash of the sources of PyNestML, including the generated lexer and parser, computed
+                                on first use. Type: str
+        string_lexer            The lexer used by parse_string(), created on first use. Type: PyNestMLLexer
+        string_parser           The parser used by parse_string(), created on first use. Type: PyNestMLParser
+        parsed_strings          The most recently parsed strings, as a dict from (rule, string) tuples to their ASTs,
+                                least recently used first. Type: OrderedDict
+        parsed_strings_max_size The maximal number of entries of parsed_strings. Type: int
+    """
+    compilation_unit_cache = None
+    source_hash = None
+    string_lexer = None
+    string_parser = None
+    parsed_strings = OrderedDict()
+    parsed_strings_max_size = 1024
 
     @classmethod
     def parse_model(cls, file_path=None):
@@ -90,8 +116,107 @@ class ModelParser(object):
             code, message = Messages.get_input_path_not_found(path=file_path)
             Logger.log_message(neuron=None, code=None, message=message, error_position=None, log_level=LoggingLevel.ERROR)
             return
+        if cls.compilation_unit_cache is None:
+            return cls.build_model(input_file, file_path)
+
+        key = cls.get_cache_key(input_file, file_path)
+        # loading the cached compilation unit registers the types it refers to
+        type_names_before = set(PredefinedTypes.get_types().keys())
+        with Profiler.phase('cache_load', os.path.basename(file_path)):
+            cached = cls.compilation_unit_cache.load(key)
+            if cached is not None:
+                ast, messages, registered_units, registered_types = cached
+                cls.restore_cached_model(ast, messages, registered_units, registered_types, type_names_before)
+        if cached is not None:
+            return ast
+
+        # parsing derives new units and types as a side effect, thus these have to be stored along with the model
+        units_before = dict(PredefinedUnits.get_units())
+        types_before = dict(PredefinedTypes.get_types())
+        Logger.start_recording()
+        try:
+            ast = cls.build_model(input_file, file_path)
+        finally:
+            messages = Logger.stop_recording()
+        if ast is not None:
+            registered_units = {name: unit for (name, unit) in PredefinedUnits.get_units().items()
+                                if units_before.get(name) is not unit}
+            registered_types = {name: typ for (name, typ) in PredefinedTypes.get_types().items()
+                                if types_before.get(name) is not typ}
+            with Profiler.phase('cache_store', os.path.basename(file_path)):
+                cls.compilation_unit_cache.store(key, (ast, messages, registered_units, registered_types))
+        return ast
+
+    @classmethod
+    def get_cache_key(cls, input_file, file_path):
+        """
+        Computes the key under which the compilation unit of the handed over file is cached. Besides the content of
+        the file, the key covers everything else the parsed compilation unit depends on.
+        :param input_file: the content of the file.
+        :type input_file: FileStream
+        :param file_path: the path to the file.
+        :type file_path: str
+        :return: a key for the compilation unit cache.
+        :rtype: str
+        """
+        import astropy
+        from pynestml.frontend.frontend_configuration import FrontendConfiguration
+        if cls.source_hash is None:
+            # the classes of the cached objects, e.g., of the scopes, can change without a change of the version of
+            # PyNestML, e.g., in a development installation
+            source_paths = sorted(glob.glob(os.path.join(os.path.dirname(pynestml.__file__), '**', '*.py'),
+                                            recursive=True))
+            sources = list()
+            for source_path in source_paths:
+                with open(source_path, 'rb') as source_file:
+                    sources.append(source_file.read())
+            cls.source_hash = DiskCache.compute_key(*sources)
+        return DiskCache.compute_key(input_file.strdata, pynestml.__version__, cls.source_hash,
+                                     astropy.__version__, os.path.abspath(file_path), FrontendConfiguration.suffix)
+
+    @classmethod
+    def restore_cached_model(cls, ast, messages, registered_units, registered_types, type_names_before=None):
+        """
+        Brings the toolchain into the same state as if the handed over compilation unit had just been parsed, i.e.,
+        replays the messages and registers the derived units and types as well as the neuron scopes.
+        :param ast: a cached compilation unit.
+        :type ast: ASTNestMLCompilationUnit
+        :param messages: the messages as recorded while parsing the compilation unit.
+        :type messages: list
+        :param registered_units: the units registered while parsing the compilation unit.
+        :type registered_units: dict(str->UnitType)
+        :param registered_types: the types registered while parsing the compilation unit.
+        :type registered_types: dict(str->UnitTypeSymbol)
+        :param type_names_before: the names of the types registered before the compilation unit has been loaded; the
+                                  messages on their registration are not replayed, as parsing would not log them.
+        :type type_names_before: set(str)
+        """
+        if type_names_before is None:
+            type_names_before = set(PredefinedTypes.get_types().keys())
+        registered_before = {Messages.get_new_type_registered(name)[1] for name in registered_types
+                             if name in type_names_before}
+        Logger.replay_messages([entry for entry in messages if isinstance(entry, str)
+                                or entry[1] != MessageCode.TYPE_REGISTERED or entry[2] not in registered_before])
+        PredefinedUnits.get_units().update(registered_units)
+        PredefinedTypes.get_types().update(registered_types)
+        SymbolTable.initialize_symbol_table(ast.get_source_position())
+        for neuron in ast.get_neuron_list():
+            SymbolTable.add_neuron_scope(neuron.get_name(), neuron.get_scope())
+
+    @classmethod
+    def build_model(cls, input_file, file_path):
+        """
+        Builds the meta_model representation of the handed over file content, including its symbol table.
+        :param input_file: the content of the file.
+        :type input_file: FileStream
+        :param file_path: the path to the file.
+        :type file_path: str
+        :return: a new ASTNESTMLCompilationUnit object.
+        :rtype: ASTNestMLCompilationUnit
+        """
         code, message = Messages.get_start_processing_file(file_path)
         Logger.log_message(neuron=None, code=code, message=message, error_position=None, log_level=LoggingLevel.INFO)
+        file_name = os.path.basename(file_path)
 
         # create a lexer and hand over the input
         lexer = PyNestMLLexer()
@@ -104,7 +229,8 @@ class ModelParser(object):
         lexer.inputStream = input_file
         # create a token stream
         stream = CommonTokenStream(lexer)
-        stream.fill()
+        with Profiler.phase('lexer', file_name):
+            stream.fill()
         if lexerErrorListener._error_occurred:
             code, message = Messages.get_lexer_error()
             Logger.log_message(neuron=None, code=None, message=message, error_position=None, log_level=LoggingLevel.ERROR)
@@ -115,50 +241,57 @@ class ModelParser(object):
         parser.addErrorListener(ConsoleErrorListener())
         parserErrorListener = NestMLErrorListener()
         parser.addErrorListener(parserErrorListener)
-        # parser._errHandler = BailErrorStrategy()	# N.B. uncomment this line and the next to halt immediately on parse errors
-        # parser._errHandler.reset(parser)
         parser.setTokenStream(stream)
-        compilation_unit = parser.nestMLCompilationUnit()
+        with Profiler.phase('parser', file_name):
+            compilation_unit = parse_with_fallback(parser, parser.nestMLCompilationUnit)
         if parserErrorListener._error_occurred:
             code, message = Messages.get_parser_error()
             Logger.log_message(neuron=None, code=None, message=message, error_position=None, log_level=LoggingLevel.ERROR)
             return
 
         # create a new visitor and return the new AST
-        ast_builder_visitor = ASTBuilderVisitor(stream.tokens)
-        ast = ast_builder_visitor.visit(compilation_unit)
+        with Profiler.phase('ast_builder', file_name):
+            ast_builder_visitor = ASTBuilderVisitor(stream.tokens)
+            ast = ast_builder_visitor.visit(compilation_unit)
 
         # create and update the corresponding symbol tables
         SymbolTable.initialize_symbol_table(ast.get_source_position())
-        log_to_restore = copy.deepcopy(Logger.get_log())
-        counter = Logger.curr_message
+        # messages of the renaming of derived variables are discarded
+        checkpoint = Logger.checkpoint()
 
         # replace all derived variables through a computer processable names: e.g. g_in''' -> g_in__ddd
+        # the renaming does not add or remove nodes, thus all nodes are looked up in the index of each neuron at once
+        (odes, shapes, variables) = (list(), list(), list())
+        for neuron in ast.get_neuron_list():
+            odes.extend(ASTUtils.get_all(neuron, ASTOdeEquation))
+            shapes.extend(ASTUtils.get_all(neuron, ASTOdeShape))
+            variables.extend(ASTUtils.get_all(neuron, ASTVariable))
         restore_differential_order = []
-        for ode in ASTUtils.get_all(ast, ASTOdeEquation):
+        for ode in odes:
             lhs_variable = ode.get_lhs()
             if lhs_variable.get_differential_order() > 0:
-                lhs_variable.differential_order = lhs_variable.get_differential_order() - 1
+                lhs_variable.set_differential_order(lhs_variable.get_differential_order() - 1)
                 restore_differential_order.append(lhs_variable)
 
-        for shape in ASTUtils.get_all(ast, ASTOdeShape):
+        for shape in shapes:
             lhs_variable = shape.get_variable()
             if lhs_variable.get_differential_order() > 0:
-                lhs_variable.differential_order = lhs_variable.get_differential_order() - 1
+                lhs_variable.set_differential_order(lhs_variable.get_differential_order() - 1)
                 restore_differential_order.append(lhs_variable)
 
         # than replace remaining variables
-        for variable in ASTUtils.get_all(ast, ASTVariable):
+        for variable in variables:
             if variable.get_differential_order() > 0:
                 variable.set_name(variable.get_name() + "__" + "d" * variable.get_differential_order())
-                variable.differential_order = 0
+                variable.set_differential_order(0)
 
         # now also equations have no ' at lhs. replace every occurrence of last d to ' to compensate
         for ode_variable in restore_differential_order:
-            ode_variable.differential_order = 1
-        Logger.set_log(log_to_restore, counter)
+            ode_variable.set_differential_order(1)
+        Logger.rollback(checkpoint)
         for neuron in ast.get_neuron_list():
-            neuron.accept(ASTSymbolTableVisitor())
+            with Profiler.phase('symbol_table', neuron.get_name()):
+                neuron.accept(ASTSymbolTableVisitor())
             SymbolTable.add_neuron_scope(neuron.get_name(), neuron.get_scope())
 
         # store source paths
@@ -169,320 +302,278 @@ class ModelParser(object):
         return ast
 
     @classmethod
-    def parse_expression(cls, string):
-        # type: (str) -> ASTExpression
+    def parse_string(cls, string, rule, cache=True):
+        """
+        Parses the handed over string by means of the handed over rule of the grammar and returns the meta_model
+        representation of it. The code generators parse many small, often identical strings, e.g., the update
+        statements of each state variable, thus a single lexer and parser are reused for all strings, and the most
+        recently parsed strings are cached. As the returned ASTs are usually modified, e.g., by adding them to a
+        neuron, each call returns a clone of the cached AST.
+        :param string: the string to parse.
+        :type string: str
+        :param rule: the name of the rule of the grammar, e.g., 'expression'.
+        :type rule: str
+        :param cache: whether the AST may be taken from and stored in the cache. Must be False for rules whose
+                      construction has side effects, e.g., checks which log messages.
+        :type cache: bool
+        :return: a new AST.
+        :rtype: ASTNode
+        """
+        key = (rule, string)
+        if cache and key in cls.parsed_strings:
+            cls.parsed_strings.move_to_end(key)
+            return cls.parsed_strings[key].clone()
         (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.expression())
+        ret = builder.visit(parse_with_fallback(parser, getattr(parser, rule)))
         ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
+        if cache:
+            cls.parsed_strings[key] = ret
+            while len(cls.parsed_strings) > cls.parsed_strings_max_size:
+                cls.parsed_strings.popitem(last=False)
+            return ret.clone()
         return ret
 
+    @classmethod
+    def parse_expression(cls, string):
+        # type: (str) -> ASTExpression
+        return cls.parse_string(string, 'expression')
+
     @classmethod
     def parse_declaration(cls, string):
         # type: (str) -> ASTDeclaration
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.declaration())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'declaration')
 
     @classmethod
     def parse_stmt(cls, string):
         # type: (str) -> ASTStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.stmt())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'stmt')
 
     @classmethod
     def parse_assignment(cls, string):
         # type: (str) -> ASTAssignment
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.assignment())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'assignment')
 
     @classmethod
     def parse_bit_operator(cls, string):
         # type: (str) -> ASTArithmeticOperator
-        builder, parser = tokenize(string)
-        ret = builder.visit(parser.bitOperator())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'bitOperator')
 
     @classmethod
     def parse_block(cls, string):
         # type: (str) -> ASTBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.block())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'block')
 
     @classmethod
     def parse_block_with_variables(cls, string):
         # type: (str) -> ASTBlockWithVariables
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.blockWithVariables())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'blockWithVariables')
 
     @classmethod
     def parse_body(cls, string):
         # type: (str) -> ASTBody
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.body())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'body')
 
     @classmethod
     def parse_comparison_operator(cls, string):
         # type: (str) -> ASTComparisonOperator
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.comparisonOperator())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'comparisonOperator')
 
     @classmethod
     def parse_compound_stmt(cls, string):
         # type: (str) -> ASTCompoundStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.compoundStmt())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'compoundStmt')
 
     @classmethod
     def parse_data_type(cls, string):
         # type: (str) -> ASTDataType
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.dataType())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'dataType')
 
     @classmethod
     def parse_elif_clause(cls, string):
         # type: (str) -> ASTElifClause
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.elifClause())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'elifClause')
 
     @classmethod
     def parse_else_clause(cls, string):
         # type: (str) -> ASTElseClause
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.elseClause())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'elseClause')
 
     @classmethod
     def parse_equations_block(cls, string):
         # type: (str) -> ASTEquationsBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.equationsBlock())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'equationsBlock')
 
     @classmethod
     def parse_for_stmt(cls, string):
         # type: (str) -> ASTForStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.forStmt())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'forStmt')
 
     @classmethod
     def parse_function(cls, string):
         # type: (str) -> ASTFunction
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.function())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'function')
 
     @classmethod
     def parse_function_call(cls, string):
         # type: (str) -> ASTFunctionCall
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.functionCall())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'functionCall')
 
     @classmethod
     def parse_if_clause(cls, string):
         # type: (str) -> ASTIfClause
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.ifClause())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'ifClause')
 
     @classmethod
     def parse_if_stmt(cls, string):
         # type: (str) -> ASTIfStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.ifStmt())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'ifStmt')
 
     @classmethod
     def parse_input_block(cls, string):
         # type: (str) -> ASTInputBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputBlock())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'inputBlock')
 
     @classmethod
     def parse_input_port(cls, string):
         # type: (str) -> ASTInputPort
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputPort())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'inputPort')
 
     @classmethod
     def parse_input_qualifier(cls, string):
         # type: (str) -> ASTInputQualifier
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.inputQualifier())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'inputQualifier')
 
     @classmethod
     def parse_logic_operator(cls, string):
         # type: (str) -> ASTLogicalOperator
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.logicalOperator())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'logicalOperator')
 
     @classmethod
     def parse_nestml_compilation_unit(cls, string):
         # type: (str) -> ASTNestMLCompilationUnit
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.nestMLCompilationUnit())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'nestMLCompilationUnit', cache=False)
 
     @classmethod
     def parse_neuron(cls, string):
         # type: (str) -> ASTNeuron
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.neuron())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'neuron', cache=False)
 
     @classmethod
     def parse_ode_equation(cls, string):
         # type: (str) -> ASTOdeEquation
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.odeEquation())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'odeEquation')
 
     @classmethod
     def parse_ode_function(cls, string):
         # type: (str) -> ASTOdeFunction
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.odeFunction())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'odeFunction')
 
     @classmethod
     def parse_ode_shape(cls, string):
         # type: (str) -> ASTOdeShape
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.odeShape())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'odeShape')
 
     @classmethod
     def parse_output_block(cls, string):
         # type: (str) -> ASTOutputBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.outputBlock())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'outputBlock')
 
     @classmethod
     def parse_parameter(cls, string):
         # type: (str) -> ASTParameter
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.parameter())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'parameter')
 
     @classmethod
     def parse_return_stmt(cls, string):
         # type: (str) -> ASTReturnStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.returnStmt())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'returnStmt')
 
     @classmethod
     def parse_simple_expression(cls, string):
         # type: (str) -> ASTSimpleExpression
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.simpleExpression())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'simpleExpression')
 
     @classmethod
     def parse_small_stmt(cls, string):
         # type: (str) -> ASTSmallStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.smallStmt())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'smallStmt')
 
     @classmethod
     def parse_unary_operator(cls, string):
         # type: (str) -> ASTUnaryOperator
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.unaryOperator())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'unaryOperator')
 
     @classmethod
     def parse_unit_type(cls, string):
         # type: (str) -> ASTUnitType
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.unitType())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'unitType')
 
     @classmethod
     def parse_update_block(cls, string):
         # type: (str) -> ASTUpdateBlock
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.updateBlock())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'updateBlock')
 
     @classmethod
     def parse_variable(cls, string):
         # type: (str) -> ASTVariable
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.variable())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'variable')
 
     @classmethod
     def parse_while_stmt(cls, string):
         # type: (str) -> ASTWhileStmt
-        (builder, parser) = tokenize(string)
-        ret = builder.visit(parser.whileStmt())
-        ret.accept(ASTHigherOrderVisitor(log_set_added_source_position))
-        return ret
+        return cls.parse_string(string, 'whileStmt')
 
 
 def tokenize(string):
     # type: (str) -> (ASTBuilderVisitor,PyNestMLParser)
-    lexer = PyNestMLLexer(InputStream(string))
+    """
+    Tokenizes the handed over string and hands the tokens over to the parser. Creating a lexer and a parser is
+    expensive compared to parsing a short string, thus the same instances are reused by all calls; the returned parser
+    is only valid until the next call.
+    """
+    if ModelParser.string_lexer is None:
+        ModelParser.string_lexer = PyNestMLLexer()
+        ModelParser.string_parser = PyNestMLParser(None)
+    # setting the input resets the lexer, setting the token stream resets the parser
+    ModelParser.string_lexer.inputStream = InputStream(string)
     # create a token stream
-    stream = CommonTokenStream(lexer)
+    stream = CommonTokenStream(ModelParser.string_lexer)
     stream.fill()
-    parser = PyNestMLParser(stream)
+    parser = ModelParser.string_parser
+    parser.setTokenStream(stream)
     builder = ASTBuilderVisitor(stream.tokens)
     return builder, parser
 
 
+def parse_with_fallback(parser, rule):
+    """
+    Parses the input of the handed over parser by means of the handed over rule in two stages: first with the fast SLL
+    prediction mode, which is sufficient for virtually all models, and only if this fails with the full LL prediction
+    mode. Syntax errors are reported to the error listeners of the parser by the second stage only, thus exactly the
+    same messages are reported as by a single full LL parse, and the error recovery of the parser is retained.
+    :param parser: a parser whose token stream has been set.
+    :type parser: PyNestMLParser
+    :param rule: the method of the parser which parses the rule, e.g., parser.nestMLCompilationUnit.
+    :type rule: function
+    :return: the parse tree.
+    :rtype: ParserRuleContext
+    """
+    error_listeners = parser._listeners
+    parser.removeErrorListeners()
+    parser._errHandler = BailErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.SLL
+    try:
+        return rule()
+    except ParseCancellationException:
+        # either the input contains a syntax error or requires full context, thus parse it again from the start
+        pass
+    finally:
+        parser._listeners = error_listeners
+    parser._errHandler = DefaultErrorStrategy()
+    parser._interp.predictionMode = PredictionMode.LL
+    parser.reset()
+    return rule()
+
+
 def log_set_added_source_position(node):
     node.set_source_position(ASTSourceLocation.get_added_source_position())
@@ -22,6 +22,7 @@ from copy import copy
 from pynestml.meta_model.ast_function_call import ASTFunctionCall
 from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
 from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.utils.ast_utils import ASTUtils
 from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
 
 
@@ -96,13 +97,7 @@ class OdeTransformer(object):
         :return: a list of all functions in the meta_model
         :rtype: list(ASTFunctionCall)
         """
-        res = list()
-        from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
-        from pynestml.meta_model.ast_function_call import ASTFunctionCall
-        fun = (lambda x: res.append(x) if isinstance(x, ASTFunctionCall) and x.get_name() in function_list else True)
-        vis = ASTHigherOrderVisitor(visit_funcs=fun)
-        ast_node.accept(vis)
-        return res
+        return [node for node in ASTUtils.get_all(ast_node, ASTFunctionCall) if node.get_name() in function_list]
 
     @classmethod
     def get_cond_sum_function_calls(cls, node):
@@ -113,11 +108,4 @@ class OdeTransformer(object):
         :return: a list of all functions in the meta_model
         :rtype: list(ASTFunctionCall)
         """
-        res = list()
-
-        def loc_get_cond_sum(a_node):
-            if isinstance(a_node, ASTFunctionCall) and a_node.get_name() == PredefinedFunctions.COND_SUM:
-                res.append(a_node)
-
-        node.accept(ASTHigherOrderVisitor(loc_get_cond_sum))
-        return res
+        return ASTUtils.get_function_call(node, PredefinedFunctions.COND_SUM)
@@ -0,0 +1,210 @@
+#
+# profiler.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Profiler(object):
+    """
+    This class records where the toolchain spends its time. Each phase of the toolchain, e.g., parsing a file or
+    checking a context condition for a neuron, is enclosed in phase(). For each phase and artifact, i.e., the neuron or
+    file processed in the phase, the number of calls, the overall wall time and the peak memory are recorded. As long
+    as profiling is not enabled, phase() does nothing.
+
+    Profiling can be enabled by the --profile option of the frontend, or programmatically:
+
+        Profiler.enable()
+        to_nest(input_path='models', target_path='target')
+        print(Profiler.get_summary())
+
+    Attributes:
+        enabled           Indicates whether profiling is enabled. Type: bool
+        records           A dict from (phase, artifact) tuples to [calls, wall time in seconds, peak memory in bytes]
+                          lists. Type: dict
+        totals            A dict from artifacts to their overall wall time in seconds. Phases nested in a phase of the
+                          same artifact are not counted twice. Type: dict
+        stack             The currently active phases, innermost last, as [artifact, start time, peak memory] lists.
+                          Type: list
+        started_tracing   Indicates whether tracing of memory allocations has been started by the profiler. Type: bool
+    """
+    enabled = False
+    records = dict()
+    totals = dict()
+    stack = list()
+    started_tracing = False
+
+    @classmethod
+    def enable(cls, trace_memory=True):
+        """
+        Discards all records and enables profiling. Peak memory is measured by tracing all memory allocations, which
+        slows down the toolchain; wall times thus should only be compared between profiled runs.
+        :param trace_memory: whether to measure the peak memory. If False, wall times are not distorted, but the
+                             peak memory of all phases is reported as 0.
+        :type trace_memory: bool
+        """
+        cls.reset()
+        cls.enabled = True
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            cls.started_tracing = True
+
+    @classmethod
+    def disable(cls):
+        """
+        Disables profiling. The records are retained until profiling is enabled again.
+        """
+        cls.enabled = False
+        cls.stack = list()
+        if cls.started_tracing:
+            tracemalloc.stop()
+            cls.started_tracing = False
+
+    @classmethod
+    def reset(cls):
+        """
+        Discards all records.
+        """
+        cls.records = dict()
+        cls.totals = dict()
+
+    @classmethod
+    @contextmanager
+    def phase(cls, name, artifact=None):
+        """
+        Records the execution of the enclosed block as a phase of the toolchain:
+
+            with Profiler.phase('symbol_table', neuron.get_name()):
+                neuron.accept(ASTSymbolTableVisitor())
+
+        :param name: the name of the phase.
+        :type name: str
+        :param artifact: the name of the neuron or file processed in the phase. If None, the artifact of the enclosing
+                         phase is used.
+        :type artifact: str
+        """
+        if not cls.enabled:
+            yield
+            return
+        if artifact is None and len(cls.stack) > 0:
+            artifact = cls.stack[-1][0]
+        cls.update_peak_memory()
+        frame = [artifact, time.perf_counter(), 0]
+        cls.stack.append(frame)
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - frame[1]
+            cls.update_peak_memory()
+            cls.stack.pop()
+            record = cls.records.setdefault((name, artifact), [0, 0., 0])
+            record[0] += 1
+            record[1] += wall_time
+            record[2] = max(record[2], frame[2])
+            if len(cls.stack) == 0 or cls.stack[-1][0] != artifact:
+                cls.totals[artifact] = cls.totals.get(artifact, 0.) + wall_time
+
+    @classmethod
+    def update_peak_memory(cls):
+        """
+        Updates the peak memory of all active phases with the peak of the traced memory since the last update.
+        """
+        if not tracemalloc.is_tracing():
+            return
+        peak = tracemalloc.get_traced_memory()[1]
+        for frame in cls.stack:
+            frame[2] = max(frame[2], peak)
+        if hasattr(tracemalloc, 'reset_peak'):
+            # python < 3.9 only provides the peak since tracing has been started
+            tracemalloc.reset_peak()
+
+    @classmethod
+    def get_records(cls):
+        """
+        Returns all records, e.g., to hand them over from a worker process to the main process.
+        :return: the records and the overall wall times of the artifacts.
+        :rtype: (dict,dict)
+        """
+        return cls.records, cls.totals
+
+    @classmethod
+    def merge_records(cls, records):
+        """
+        Adds the handed over records, e.g., of a worker process, to the records of this process.
+        :param records: the records and the overall wall times of the artifacts as returned by get_records().
+        :type records: (dict,dict)
+        """
+        other_records, other_totals = records
+        for (key, (calls, wall_time, peak_memory)) in other_records.items():
+            record = cls.records.setdefault(key, [0, 0., 0])
+            record[0] += calls
+            record[1] += wall_time
+            record[2] = max(record[2], peak_memory)
+        for (artifact, wall_time) in other_totals.items():
+            cls.totals[artifact] = cls.totals.get(artifact, 0.) + wall_time
+
+    @classmethod
+    def get_report(cls):
+        """
+        Returns a machine-readable report of all records.
+        :return: a dict with the keys 'phases' (a list of dicts with the keys 'phase', 'artifact', 'calls', 'time' and
+                 'peak_memory') and 'artifacts' (a list of dicts with the keys 'artifact' and 'time'). Times are given
+                 in seconds, memory in bytes.
+        :rtype: dict
+        """
+        phases = [{'phase': name, 'artifact': artifact, 'calls': calls, 'time': wall_time, 'peak_memory': peak_memory}
+                  for ((name, artifact), (calls, wall_time, peak_memory)) in cls.records.items()]
+        artifacts = [{'artifact': artifact, 'time': wall_time} for (artifact, wall_time) in cls.totals.items()]
+        return {'phases': sorted(phases, key=lambda phase: -phase['time']),
+                'artifacts': sorted(artifacts, key=lambda artifact: -artifact['time'])}
+
+    @classmethod
+    def get_summary(cls):
+        """
+        Returns a human-readable summary of all records: the phases, summed up over all artifacts, and the overall
+        wall time of each artifact, both sorted by wall time.
+        :return: a table.
+        :rtype: str
+        """
+        phases = dict()
+        for ((name, artifact), (calls, wall_time, peak_memory)) in cls.records.items():
+            phase = phases.setdefault(name, [0, 0., 0])
+            phase[0] += calls
+            phase[1] += wall_time
+            phase[2] = max(phase[2], peak_memory)
+        lines = ['%-60s %8s %12s %18s' % ('Phase', 'Calls', 'Time [s]', 'Peak memory [MiB]')]
+        for (name, (calls, wall_time, peak_memory)) in sorted(phases.items(), key=lambda item: -item[1][1]):
+            lines.append('%-60s %8d %12.3f %18.1f' % (name, calls, wall_time, peak_memory / 2. ** 20))
+        lines.append('')
+        lines.append('%-60s %8s %12s' % ('Neuron/file', '', 'Time [s]'))
+        for (artifact, wall_time) in sorted(cls.totals.items(), key=lambda item: -item[1]):
+            lines.append('%-60s %8s %12.3f' % (artifact if artifact is not None else '(overall)', '', wall_time))
+        return '\n'.join(lines)
+
+    @classmethod
+    def store_report(cls, file_path):
+        """
+        Stores the report as returned by get_report() as JSON.
+        :param file_path: the path to the file.
+        :type file_path: str
+        """
+        with open(file_path, 'w+') as f:
+            json.dump(cls.get_report(), f, indent=2)
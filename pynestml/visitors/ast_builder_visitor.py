@@ -25,6 +25,7 @@ from pynestml.cocos.co_co_each_block_unique_and_defined import CoCoEachBlockUniq
 from pynestml.cocos.co_cos_manager import CoCosManager
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
 from pynestml.generated.PyNestMLParserVisitor import PyNestMLParserVisitor
+from pynestml.meta_model.ast_node import ASTNode
 from pynestml.meta_model.ast_node_factory import ASTNodeFactory
 from pynestml.utils.ast_source_location import ASTSourceLocation
 from pynestml.utils.logger import Logger
@@ -616,10 +617,11 @@ class ASTBuilderVisitor(PyNestMLParserVisitor):
 
 
 def update_node_comments(node, comments):
-    node.comment = comments[0]
-    node.pre_comments = comments[1]
+    # most nodes have no comments at all, thus they share the same empty container
+    node.comment = comments[0] if comments[0] else ASTNode.NO_COMMENTS
+    node.pre_comments = comments[1] if comments[1] else ASTNode.NO_COMMENTS
     node.in_comment = comments[2]
-    node.post_comments = comments[3]
+    node.post_comments = comments[3] if comments[3] else ASTNode.NO_COMMENTS
 
 
 def get_next(_elements=list()):
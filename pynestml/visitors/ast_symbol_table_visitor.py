@@ -585,7 +585,7 @@ def make_trivial_assignment(var, order, equations_block, is_shape=False):
         node = ASTNodeFactory.create_ast_ode_shape(lhs=lhs_variable, rhs=expression, source_position=source_loc)
     else:
         node = ASTNodeFactory.create_ast_ode_equation(lhs=lhs_variable, rhs=expression, source_position=source_loc)
-    equations_block.get_declarations().append(node)
+    equations_block.add_declaration(node)
     return node
 
 
@@ -59,12 +59,61 @@ from pynestml.meta_model.ast_variable import ASTVariable
 from pynestml.meta_model.ast_while_stmt import ASTWhileStmt
 
 
+# the suffix of the visit_, traverse_ and endvisit_ methods of ASTVisitor which handle each class of the meta_model
+NODE_METHOD_SUFFIXES = {
+    ASTArithmeticOperator: 'arithmetic_operator',
+    ASTAssignment: 'assignment',
+    ASTBitOperator: 'bit_operator',
+    ASTBlock: 'block',
+    ASTBlockWithVariables: 'block_with_variables',
+    ASTBody: 'body',
+    ASTComparisonOperator: 'comparison_operator',
+    ASTCompoundStmt: 'compound_stmt',
+    ASTDataType: 'data_type',
+    ASTDeclaration: 'declaration',
+    ASTElifClause: 'elif_clause',
+    ASTElseClause: 'else_clause',
+    ASTEquationsBlock: 'equations_block',
+    ASTExpression: 'expression',
+    ASTForStmt: 'for_stmt',
+    ASTFunction: 'function',
+    ASTFunctionCall: 'function_call',
+    ASTIfClause: 'if_clause',
+    ASTIfStmt: 'if_stmt',
+    ASTInputBlock: 'input_block',
+    ASTInputPort: 'input_port',
+    ASTInputQualifier: 'input_qualifier',
+    ASTLogicalOperator: 'logical_operator',
+    ASTNestMLCompilationUnit: 'compilation_unit',
+    ASTNeuron: 'neuron',
+    ASTOdeEquation: 'ode_equation',
+    ASTOdeFunction: 'ode_function',
+    ASTOdeShape: 'ode_shape',
+    ASTOutputBlock: 'output_block',
+    ASTParameter: 'parameter',
+    ASTReturnStmt: 'return_stmt',
+    ASTSimpleExpression: 'simple_expression',
+    ASTSmallStmt: 'small_stmt',
+    ASTUnaryOperator: 'unary_operator',
+    ASTUnitType: 'unit_type',
+    ASTUpdateBlock: 'update_block',
+    ASTVariable: 'variable',
+    ASTWhileStmt: 'while_stmt',
+    ASTStmt: 'stmt',
+}
+
+
 class ASTVisitor(object):
     """
     This class represents a standard implementation of a visitor as used to create concrete instances.
+    The dispatchers visit(), traverse() and endvisit() look up the methods which handle a node by the class of the
+    node in a table shared by all visitors, thus subclasses only override the visit_, traverse_ and endvisit_ methods.
     Attributes:
         real_self (ASTVisitor): The visitor which will be used during the visiting of a node.
+        dispatch_table (dict): Maps classes of nodes to the names of their visit_, traverse_ and endvisit_ methods.
     """
+    dispatch_table = {node_class: ('visit_' + suffix, 'traverse_' + suffix, 'endvisit_' + suffix)
+                      for (node_class, suffix) in NODE_METHOD_SUFFIXES.items()}
 
     def __init__(self):
         """
@@ -712,124 +761,9 @@ class ASTVisitor(object):
         :param node: The ASTElement to visit
         :type node:  ASTElement or inherited
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.visit_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.visit_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.visit_bit_operator(node)
-            return
-        if isinstance(node, ASTBlock):
-            self.visit_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.visit_block_with_variables(node)
-            return
-        if isinstance(node, ASTBody):
-            self.visit_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.visit_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.visit_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.visit_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.visit_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.visit_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.visit_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.visit_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.visit_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.visit_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.visit_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.visit_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.visit_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.visit_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.visit_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.visit_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.visit_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.visit_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.visit_compilation_unit(node)
-            return
-        if isinstance(node, ASTNeuron):
-            self.visit_neuron(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.visit_ode_equation(node)
-            return
-        if isinstance(node, ASTOdeFunction):
-            self.visit_ode_function(node)
-            return
-        if isinstance(node, ASTOdeShape):
-            self.visit_ode_shape(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.visit_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.visit_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.visit_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.visit_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.visit_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.visit_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.visit_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.visit_update_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.visit_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.visit_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.visit_stmt(node)
-            return
-        return
+        names = ASTVisitor.dispatch_table.get(type(node)) or ASTVisitor.get_dispatch_names(type(node))
+        if names[0] is not None:
+            getattr(self, names[0])(node)
 
     def traverse(self, node):
         """
@@ -837,124 +771,9 @@ class ASTVisitor(object):
         :param node: The ASTElement to visit
         :type node: Inherited from ASTElement
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.traverse_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.traverse_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.traverse_bit_operator(node)
-            return
-        if isinstance(node, ASTBlock):
-            self.traverse_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.traverse_block_with_variables(node)
-            return
-        if isinstance(node, ASTBody):
-            self.traverse_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.traverse_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.traverse_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.traverse_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.traverse_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.traverse_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.traverse_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.traverse_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.traverse_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.traverse_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.traverse_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.traverse_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.traverse_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.traverse_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.traverse_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.traverse_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.traverse_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.traverse_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.traverse_compilation_unit(node)
-            return
-        if isinstance(node, ASTNeuron):
-            self.traverse_neuron(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.traverse_ode_equation(node)
-            return
-        if isinstance(node, ASTOdeFunction):
-            self.traverse_ode_function(node)
-            return
-        if isinstance(node, ASTOdeShape):
-            self.traverse_ode_shape(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.traverse_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.traverse_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.traverse_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.traverse_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.traverse_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.traverse_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.traverse_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.traverse_update_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.traverse_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.traverse_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.traverse_stmt(node)
-            return
-        return
+        names = ASTVisitor.dispatch_table.get(type(node)) or ASTVisitor.get_dispatch_names(type(node))
+        if names[1] is not None:
+            getattr(self, names[1])(node)
 
     def endvisit(self, node):
         """
@@ -962,124 +781,29 @@ class ASTVisitor(object):
         :param node: The ASTElement to endvisit
         :type node:  ASTElement or inherited
         """
-        if isinstance(node, ASTArithmeticOperator):
-            self.endvisit_arithmetic_operator(node)
-            return
-        if isinstance(node, ASTAssignment):
-            self.endvisit_assignment(node)
-            return
-        if isinstance(node, ASTBitOperator):
-            self.endvisit_bit_operator(node)
-            return
-        if isinstance(node, ASTBlock):
-            self.endvisit_block(node)
-            return
-        if isinstance(node, ASTBlockWithVariables):
-            self.endvisit_block_with_variables(node)
-            return
-        if isinstance(node, ASTBody):
-            self.endvisit_body(node)
-            return
-        if isinstance(node, ASTComparisonOperator):
-            self.endvisit_comparison_operator(node)
-            return
-        if isinstance(node, ASTCompoundStmt):
-            self.endvisit_compound_stmt(node)
-            return
-        if isinstance(node, ASTDataType):
-            self.endvisit_data_type(node)
-            return
-        if isinstance(node, ASTDeclaration):
-            self.endvisit_declaration(node)
-            return
-        if isinstance(node, ASTElifClause):
-            self.endvisit_elif_clause(node)
-            return
-        if isinstance(node, ASTElseClause):
-            self.endvisit_else_clause(node)
-            return
-        if isinstance(node, ASTEquationsBlock):
-            self.endvisit_equations_block(node)
-            return
-        if isinstance(node, ASTExpression):
-            self.endvisit_expression(node)
-            return
-        if isinstance(node, ASTForStmt):
-            self.endvisit_for_stmt(node)
-            return
-        if isinstance(node, ASTFunction):
-            self.endvisit_function(node)
-            return
-        if isinstance(node, ASTFunctionCall):
-            self.endvisit_function_call(node)
-            return
-        if isinstance(node, ASTIfClause):
-            self.endvisit_if_clause(node)
-            return
-        if isinstance(node, ASTIfStmt):
-            self.endvisit_if_stmt(node)
-            return
-        if isinstance(node, ASTInputBlock):
-            self.endvisit_input_block(node)
-            return
-        if isinstance(node, ASTInputPort):
-            self.endvisit_input_port(node)
-            return
-        if isinstance(node, ASTInputQualifier):
-            self.endvisit_input_qualifier(node)
-            return
-        if isinstance(node, ASTLogicalOperator):
-            self.endvisit_logical_operator(node)
-            return
-        if isinstance(node, ASTNestMLCompilationUnit):
-            self.endvisit_compilation_unit(node)
-            return
-        if isinstance(node, ASTNeuron):
-            self.endvisit_neuron(node)
-            return
-        if isinstance(node, ASTOdeEquation):
-            self.endvisit_ode_equation(node)
-            return
-        if isinstance(node, ASTOdeFunction):
-            self.endvisit_ode_function(node)
-            return
-        if isinstance(node, ASTOdeShape):
-            self.endvisit_ode_shape(node)
-            return
-        if isinstance(node, ASTOutputBlock):
-            self.endvisit_output_block(node)
-            return
-        if isinstance(node, ASTParameter):
-            self.endvisit_parameter(node)
-            return
-        if isinstance(node, ASTReturnStmt):
-            self.endvisit_return_stmt(node)
-            return
-        if isinstance(node, ASTSimpleExpression):
-            self.endvisit_simple_expression(node)
-            return
-        if isinstance(node, ASTSmallStmt):
-            self.endvisit_small_stmt(node)
-            return
-        if isinstance(node, ASTUnaryOperator):
-            self.endvisit_unary_operator(node)
-            return
-        if isinstance(node, ASTUnitType):
-            self.endvisit_unit_type(node)
-            return
-        if isinstance(node, ASTUpdateBlock):
-            self.endvisit_update_block(node)
-            return
-        if isinstance(node, ASTVariable):
-            self.endvisit_variable(node)
-            return
-        if isinstance(node, ASTWhileStmt):
-            self.endvisit_while_stmt(node)
-            return
-        if isinstance(node, ASTStmt):
-            self.endvisit_stmt(node)
-            return
-        return
+        names = ASTVisitor.dispatch_table.get(type(node)) or ASTVisitor.get_dispatch_names(type(node))
+        if names[2] is not None:
+            getattr(self, names[2])(node)
+
+    @classmethod
+    def get_dispatch_names(cls, node_class):
+        """
+        Returns the names of the visit_, traverse_ and endvisit_ methods which handle nodes of the handed over class,
+        i.e., of the first class of the meta_model in its method resolution order, and stores them in the dispatch
+        table.
+        :param node_class: the class of a node.
+        :type node_class: type
+        :return: the names of the methods, or a tuple of None if the class is not part of the meta_model.
+        :rtype: (str,str,str)
+        """
+        names = (None, None, None)
+        for base in node_class.__mro__:
+            if base in NODE_METHOD_SUFFIXES:
+                suffix = NODE_METHOD_SUFFIXES[base]
+                names = ('visit_' + suffix, 'traverse_' + suffix, 'endvisit_' + suffix)
+                break
+        ASTVisitor.dispatch_table[node_class] = names
+        return names
 
     def traverse_arithmetic_operator(self, node):
         return
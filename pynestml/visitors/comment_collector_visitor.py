@@ -31,85 +31,82 @@ class CommentCollectorVisitor(PyNestMLParserVisitor):
     def __init__(self, tokens):
         self.__tokens = tokens
 
+    def __collect_comments(self, ctx):
+        """
+        Returns all comments of the handed over context, with each kind of comment collected only once.
+        :param ctx: a context
+        :type ctx: ctx
+        :return: all comments, the pre comments, the in comment and the post comments.
+        :rtype: (list(str),list(str),str,list(str))
+        """
+        pre_comments = get_pre_comment(ctx, self.__tokens)
+        in_comment = get_in_comments(ctx, self.__tokens)
+        post_comments = get_post_comments(ctx, self.__tokens)
+        comments = list(pre_comments)
+        if in_comment is not None:
+            comments.append(in_comment)
+        comments.extend(post_comments)
+        return comments, pre_comments, in_comment, post_comments
+
     def visitBlockWithVariables(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitNeuron(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitOdeEquation(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitOdeFunction(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitOdeShape(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitSmallStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitCompoundStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitInputPort(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitDeclaration(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitAssignment(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitUpdateBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitEquationsBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitInputBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitOutputBlock(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitFunctionCall(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitFunction(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitForStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitWhileStmt(self, ctx):
-        return (get_comments(ctx, self.__tokens), get_pre_comment(ctx, self.__tokens),
-                get_in_comments(ctx, self.__tokens), get_post_comments(ctx, self.__tokens))
+        return self.__collect_comments(ctx)
 
     def visitIfClause(self, ctx):
         temp = list()
@@ -139,6 +136,25 @@ class CommentCollectorVisitor(PyNestMLParserVisitor):
                 get_post_comments(ctx, self.__tokens))
 
 
+def get_token_index(token, tokens):
+    """
+    Returns the position of the handed over token in the stream. The token stream stores the position in each token,
+    thus the list of tokens does not have to be searched, which would make collecting the comments of all elements
+    quadratic in the length of the model.
+    :param token: a token
+    :type token: Token
+    :param tokens: list of token objects
+    :type tokens: list(Tokens)
+    :return: the index of the token in the list
+    :rtype: int
+    """
+    index = token.tokenIndex
+    if 0 <= index < len(tokens) and tokens[index] is token:
+        return index
+    # the token has not been created by the stream which provided the list
+    return tokens.index(token)
+
+
 def get_comments(ctx, tokens):
     """
     Returns all previously, in-line and pos comments.
@@ -177,7 +193,8 @@ def get_pre_comment(ctx, tokens):
     empty_before = __no_definitions_before(ctx, tokens)
     eol = False
     temp = None
-    for possibleCommentToken in reversed(tokens[0:tokens.index(ctx.start)]):
+    for i in range(get_token_index(ctx.start, tokens) - 1, -1, -1):
+        possibleCommentToken = tokens[i]
         # if we hit a normal token (i.e. not whitespace, not newline and not token) then stop, since we reached
         # the next previous element, thus the next comments belong to this element
         if possibleCommentToken.channel == 0:
@@ -220,8 +237,9 @@ def __no_definitions_before(ctx, tokens):
     :return: True if nothing defined before, otherwise False.
     :rtype: bool
     """
-    for token in tokens[0:tokens.index(ctx.start)]:
-        if token.channel == 0:
+    # walk backwards, such that only the tokens up to the previous element are inspected
+    for i in range(get_token_index(ctx.start, tokens) - 1, -1, -1):
+        if tokens[i].channel == 0:
             return False
     return True
 
@@ -236,7 +254,8 @@ def get_in_comments(ctx, tokens):
     :return: a comment
     :rtype: str
     """
-    for possibleComment in tokens[tokens.index(ctx.start):]:
+    for i in range(get_token_index(ctx.start, tokens), len(tokens)):
+        possibleComment = tokens[i]
         if possibleComment.channel == 2:
             return replace_delimiters(possibleComment.text)
         if possibleComment.channel == 3:  # channel 3 == new line, thus the one line comment ends here
@@ -255,15 +274,17 @@ def get_post_comments(ctx, tokens):
     :rtype: str
     """
     comments = list()
-    next_line_start_index = -1
+    # if there is no next line, only the last token is inspected
+    next_line_start_index = len(tokens) - 1
     # first find out where the next line start, since we want to avoid to see comments, which have
     # been stated in the same line, as comments which are stated after the element
-    for possibleToken in tokens[tokens.index(ctx.stop) + 1:]:
-        if possibleToken.channel == 3:
-            next_line_start_index = tokens.index(possibleToken)
+    for i in range(get_token_index(ctx.stop, tokens) + 1, len(tokens)):
+        if tokens[i].channel == 3:
+            next_line_start_index = i
             break
     first_line = False
-    for possibleCommentToken in tokens[next_line_start_index:]:
+    for i in range(next_line_start_index, len(tokens)):
+        possibleCommentToken = tokens[i]
         if possibleCommentToken.channel == 2:
             # if it is a comment on the comment channel -> get it
             comments.append(replace_delimiters(possibleCommentToken.text))
@@ -54,6 +54,7 @@ setup(
     entry_points = {
         "console_scripts": [
             "nestml = pynestml.frontend.pynestml_frontend:main",
+            "nestml-client = pynestml.frontend.compile_client:main",
         ],
     },
 
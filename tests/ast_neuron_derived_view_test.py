@@ -0,0 +1,98 @@
+#
+# ast_neuron_derived_view_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import pickle
+import unittest
+
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.symbols.variable_symbol import VariableSymbol
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import LoggingLevel, Logger
+from pynestml.utils.model_parser import ModelParser
+
+
+class ASTNeuronDerivedViewTest(unittest.TestCase):
+    """
+    Tests the caching of the queries of the symbols of a neuron and their invalidation.
+    """
+
+    def setUp(self):
+        PredefinedUnits.register_units()
+        PredefinedTypes.register_types()
+        PredefinedFunctions.register_functions()
+        PredefinedVariables.register_variables()
+        SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+        Logger.init_logger(LoggingLevel.NO)
+        model = ModelParser.parse_model(os.path.join(os.path.realpath(os.path.join(
+            os.path.dirname(__file__), 'resources', 'iaf_psc_exp_multisynapse.nestml'))))
+        self.neuron = model.get_neuron_list()[0]
+
+    def test_cached_queries_equal_filters(self):
+        symbols = [symbol for symbol in self.neuron.get_scope().get_symbols_in_this_scope()
+                   if isinstance(symbol, VariableSymbol)]
+        self.assertEqual(self.neuron.get_parameter_symbols(),
+                         [symbol for symbol in symbols if symbol.is_parameters() and not symbol.is_predefined])
+        self.assertEqual(self.neuron.get_spike_buffers(), [symbol for symbol in symbols if symbol.is_spike_buffer()])
+        self.assertFalse(self.neuron.is_multisynapse_spikes())
+        # the returned lists are copies
+        self.neuron.get_parameter_symbols().clear()
+        self.assertEqual(len(self.neuron.get_parameter_symbols()), len(self.neuron.derived_views['parameter_symbols']))
+
+    def test_queries_are_invalidated_by_modification(self):
+        internals = self.neuron.get_internal_symbols()
+        self.assertIn('internal_symbols', self.neuron.derived_views)
+        # modifications of the neuron discard all cached results
+        self.neuron.add_to_internal_block(ModelParser.parse_declaration('new_internal ms = 1 ms'))
+        self.assertEqual(self.neuron.get_internal_symbols(), internals)
+        self.assertEqual(list(self.neuron.derived_views.keys()), ['internal_symbols'])
+        # as do modifications of the scope
+        symbol = internals[0]
+        self.neuron.get_scope().delete_symbol(symbol)
+        self.assertNotIn(symbol, self.neuron.get_internal_symbols())
+
+    def test_queries_are_invalidated_by_symbol_setters(self):
+        symbol = self.neuron.get_parameter_symbols()[0]
+        for setter in [lambda: symbol.set_type_symbol(symbol.get_type_symbol()),
+                       lambda: symbol.set_variable_type(symbol.get_variable_type()),
+                       lambda: symbol.set_initial_value(symbol.get_initial_value()),
+                       lambda: symbol.set_ode_definition(symbol.get_ode_definition()),
+                       lambda: symbol.set_conductance_based(False)]:
+            self.neuron.get_parameter_symbols()
+            self.assertIn('parameter_symbols', self.neuron.derived_views)
+            setter()
+            self.neuron.get_state_symbols()
+            self.assertNotIn('parameter_symbols', self.neuron.derived_views)
+
+    def test_caches_are_not_pickled(self):
+        self.neuron.get_state_symbols()
+        self.assertIsNotNone(self.neuron.derived_views)
+        neuron = pickle.loads(pickle.dumps(self.neuron))
+        self.assertIsNone(neuron.derived_views)
+        self.assertIsNone(neuron.derived_views_key)
+        self.assertEqual([symbol.get_symbol_name() for symbol in neuron.get_state_symbols()],
+                         [symbol.get_symbol_name() for symbol in self.neuron.get_state_symbols()])
+
+
+if __name__ == '__main__':
+    unittest.main()
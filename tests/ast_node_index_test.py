@@ -0,0 +1,155 @@
+#
+# ast_node_index_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import pickle
+import unittest
+
+from pynestml.meta_model.ast_expression_node import ASTExpressionNode
+from pynestml.meta_model.ast_function_call import ASTFunctionCall
+from pynestml.meta_model.ast_node import ASTNode
+from pynestml.meta_model.ast_ode_shape import ASTOdeShape
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.utils.ast_node_index import ASTNodeIndex
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.ast_utils import ASTUtils
+from pynestml.utils.logger import LoggingLevel, Logger
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+
+
+class ASTNodeIndexTest(unittest.TestCase):
+    """
+    Tests the lookup of the nodes of a neuron by their type and the invalidation of the index.
+    """
+
+    def setUp(self):
+        PredefinedUnits.register_units()
+        PredefinedTypes.register_types()
+        PredefinedFunctions.register_functions()
+        PredefinedVariables.register_variables()
+        SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+        Logger.init_logger(LoggingLevel.NO)
+        model = ModelParser.parse_model(os.path.join(os.path.realpath(os.path.join(
+            os.path.dirname(__file__), 'resources', 'iaf_psc_exp_multisynapse.nestml'))))
+        self.neuron = model.get_neuron_list()[0]
+
+    def get_all_by_traversal(self, node_type):
+        nodes = list()
+        self.neuron.accept(ASTHigherOrderVisitor(visit_funcs=lambda node: nodes.append(node)
+                                                 if isinstance(node, node_type) else None))
+        return nodes
+
+    def assert_same_nodes(self, first, second):
+        self.assertEqual([id(node) for node in first], [id(node) for node in second])
+
+    def test_lookup_equals_traversal(self):
+        for node_type in [ASTVariable, ASTFunctionCall, ASTOdeShape, ASTExpressionNode]:
+            self.assert_same_nodes(ASTUtils.get_all(self.neuron, node_type), self.get_all_by_traversal(node_type))
+        self.assert_same_nodes(ASTUtils.get_function_call(self.neuron, PredefinedFunctions.CONVOLVE),
+                               [call for call in self.get_all_by_traversal(ASTFunctionCall)
+                                if call.get_name() == PredefinedFunctions.CONVOLVE])
+
+    def test_index_is_rebuilt_after_modification(self):
+        index = ASTNodeIndex.get_index(self.neuron)
+        self.assertIs(ASTNodeIndex.get_index(self.neuron), index)
+        # the returned lists are copies
+        ASTUtils.get_all(self.neuron, ASTVariable).clear()
+        self.assertEqual(len(ASTUtils.get_all(self.neuron, ASTVariable)), len(index.by_type[ASTVariable]))
+        # renaming a variable does not change the indexed nodes, but invalidates the index
+        variable = ASTUtils.get_all(self.neuron, ASTVariable)[0]
+        variable.set_name(variable.get_name())
+        self.assertFalse(index.is_valid())
+        # added statements are indexed
+        block = self.neuron.get_update_blocks().get_block()
+        block.add_stmt(ModelParser.parse_stmt('new_variable = 1\n'))
+        self.assertIn('new_variable', [var.get_name() for var in ASTUtils.get_all(self.neuron, ASTVariable)])
+        self.assert_same_nodes(ASTUtils.get_all(self.neuron, ASTVariable), self.get_all_by_traversal(ASTVariable))
+
+    def test_mutators_invalidate_index_and_hash(self):
+        neuron = self.neuron
+        update_block = neuron.get_update_blocks().get_block()
+        equations_block = neuron.get_equations_blocks()
+        declaration = neuron.get_parameter_blocks().get_declarations()[0]
+        simple_expression = ASTUtils.get_all(neuron, ASTSimpleExpression)[0]
+        function_call_expression = [expr for expr in ASTUtils.get_all(neuron, ASTSimpleExpression)
+                                    if expr.is_function_call()][0]
+        stmt = ModelParser.parse_stmt('new_variable = 1\n')
+        shape = ModelParser.parse_ode_shape('shape new_shape = exp(-t)\n')
+        parameter = ModelParser.parse_declaration('new_parameter ms = 1ms\n')
+        mutators = [
+            lambda: update_block.add_stmt(stmt),
+            lambda: update_block.replace_stmt(stmt, [ModelParser.parse_stmt('other_variable = 1\n'), stmt]),
+            lambda: update_block.delete_stmt(stmt),
+            lambda: neuron.get_parameter_blocks().add_declaration(parameter),
+            lambda: neuron.get_parameter_blocks().delete_declaration(parameter),
+            lambda: neuron.add_to_internal_block(ModelParser.parse_declaration('new_internal ms = 1ms\n')),
+            lambda: neuron.add_to_initial_values_block(ModelParser.parse_declaration('new_initial mV = 0mV\n')),
+            lambda: ASTUtils.add_to_state_block(neuron, ModelParser.parse_declaration('new_state integer\n')),
+            lambda: neuron.add_shape(shape),
+            lambda: equations_block.delete_declaration(shape),
+            lambda: equations_block.add_declaration(ModelParser.parse_ode_shape('shape other_shape = exp(-t)\n')),
+            lambda: equations_block.get_ode_equations()[0].set_rhs(ModelParser.parse_expression('0')),
+            lambda: equations_block.get_ode_functions()[0].set_expression(ModelParser.parse_expression('1')),
+            lambda: ASTUtils.get_all(neuron, ASTVariable)[0].set_name('renamed'),
+            lambda: ASTUtils.get_all(neuron, ASTVariable)[0].set_differential_order(2),
+            lambda: declaration.set_expression(ModelParser.parse_expression('2')),
+            lambda: declaration.set_size_parameter('new_size'),
+            lambda: simple_expression.set_variable(ModelParser.parse_variable('new_variable')),
+            lambda: function_call_expression.set_function_call(None),
+            lambda: neuron.get_body().add_body_element(ModelParser.parse_block_with_variables(
+                'internals:\n  other_internal ms = 1ms\nend\n')),
+            lambda: neuron.get_body().delete_body_element(neuron.get_body().get_body_elements()[-1]),
+            lambda: neuron.get_internals_blocks().clear(),
+            lambda: equations_block.clear(),
+            lambda: neuron.remove_initial_blocks(),
+            lambda: neuron.remove_equations_block(),
+        ]
+        for mutator in mutators:
+            index = ASTNodeIndex.get_index(neuron)
+            structural_hash = neuron.get_structural_hash()
+            mutator()
+            self.assertFalse(index.is_valid())
+            self.assertNotEqual(neuron.get_structural_hash(), structural_hash)
+            # the rebuilt index contains exactly the nodes of the modified neuron
+            self.assert_same_nodes(ASTUtils.get_all(neuron, ASTNode), self.get_all_by_traversal(ASTNode))
+        # removed nodes do not report modifications to the neuron anymore
+        index = ASTNodeIndex.get_index(neuron)
+        shape.get_variable().set_name('removed_shape')
+        self.assertTrue(index.is_valid())
+
+    def test_caches_are_not_pickled(self):
+        ASTNodeIndex.get_index(self.neuron)
+        self.neuron.get_structural_hash()
+        neuron = pickle.loads(pickle.dumps(self.neuron))
+        self.assertIsNone(neuron.node_index)
+        self.assertIsNone(neuron.owner)
+        self.assertIsNone(neuron.hash_version)
+        self.assertEqual(neuron.get_name(), self.neuron.get_name())
+        self.assertEqual(neuron.get_structural_hash(), self.neuron.get_structural_hash())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+#
+# ast_structural_hash_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import unittest
+
+try:
+    # python 3.4+ should use builtin unittest.mock not mock package
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+from pynestml.symbol_table.symbol_table import SymbolTable
+from pynestml.symbols.predefined_functions import PredefinedFunctions
+from pynestml.symbols.predefined_types import PredefinedTypes
+from pynestml.symbols.predefined_units import PredefinedUnits
+from pynestml.symbols.predefined_variables import PredefinedVariables
+from pynestml.meta_model import ast_node
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.ast_structural_key import ASTStructuralKey
+from pynestml.utils.logger import LoggingLevel, Logger
+from pynestml.utils.model_parser import ModelParser
+
+
+class ASTStructuralHashTest(unittest.TestCase):
+    """
+    Tests the structural hash of AST nodes and its invalidation.
+    """
+
+    def setUp(self):
+        PredefinedUnits.register_units()
+        PredefinedTypes.register_types()
+        PredefinedFunctions.register_functions()
+        PredefinedVariables.register_variables()
+        SymbolTable.initialize_symbol_table(ASTSourceLocation(start_line=0, start_column=0, end_line=0, end_column=0))
+        Logger.init_logger(LoggingLevel.NO)
+
+    def test_clones_have_equal_hashes(self):
+        model = ModelParser.parse_model(os.path.join(os.path.realpath(os.path.join(
+            os.path.dirname(__file__), 'resources', 'iaf_psc_exp_multisynapse.nestml'))))
+        neuron = model.get_neuron_list()[0]
+        clone = neuron.clone()
+        self.assertEqual(neuron.get_structural_hash(), clone.get_structural_hash())
+        self.assertTrue(neuron.get_equations_blocks().equals(clone.get_equations_blocks()))
+        # positions and comments are not part of the structure
+        clone.get_body().set_source_position(ASTSourceLocation.get_added_source_position())
+        clone.get_body().set_comment(['a comment'])
+        self.assertEqual(neuron.get_structural_hash(), clone.get_structural_hash())
+
+    def test_assignment_invalidates_hash(self):
+        expr = ModelParser.parse_expression('a + b * c')
+        other = ModelParser.parse_expression('a + b * c')
+        self.assertEqual(expr.get_structural_hash(), other.get_structural_hash())
+        self.assertTrue(expr.equals(other))
+        # modify a node deep within the hashed tree
+        other.get_rhs().get_lhs().get_variable().set_name('d')
+        self.assertNotEqual(expr.get_structural_hash(), other.get_structural_hash())
+        self.assertFalse(expr.equals(other))
+        other.get_rhs().get_lhs().get_variable().set_name('b')
+        self.assertEqual(expr.get_structural_hash(), other.get_structural_hash())
+        self.assertTrue(expr.equals(other))
+
+    def test_list_modification_invalidates_hash(self):
+        block = ModelParser.parse_block('x = 1\n')
+        other = block.clone()
+        self.assertEqual(block.get_structural_hash(), other.get_structural_hash())
+        stmt = ModelParser.parse_stmt('y = 2\n')
+        other.add_stmt(stmt)
+        self.assertNotEqual(block.get_structural_hash(), other.get_structural_hash())
+        self.assertFalse(block.equals(other))
+        other.delete_stmt(stmt)
+        self.assertTrue(block.equals(other))
+        other.replace_stmt(other.get_stmts()[0], [stmt])
+        self.assertFalse(block.equals(other))
+
+    def test_different_compound_statements_are_not_equal(self):
+        while_stmt = ModelParser.parse_stmt('while x > 1:\n  x = 1\nend\n')
+        if_stmt = ModelParser.parse_stmt('if x > 1:\n  x = 1\nend\n')
+        self.assertFalse(while_stmt.equals(if_stmt))
+        self.assertTrue(while_stmt.equals(while_stmt.clone()))
+
+    def test_hash_of_free_standing_expression_is_cached(self):
+        expr = ModelParser.parse_expression('a + b * c')
+        other = ModelParser.parse_expression('a + b * d')
+        self.assertFalse(expr.is_structure_tracked())
+        expr_hash = expr.get_structural_hash()
+        other.get_structural_hash()
+        with patch.object(ast_node, 'get_structural_value') as get_structural_value:
+            self.assertEqual(expr.get_structural_hash(), expr_hash)
+            # both hashes are cached, thus the nodes, and their children, are known to differ without comparing them
+            self.assertFalse(expr.equals(other))
+            self.assertFalse(expr.get_rhs().equals(other.get_rhs()))
+        self.assertEqual(get_structural_value.call_count, 0)
+        # any modification invalidates the cached hash
+        other.get_rhs().get_rhs().get_variable().set_name('c')
+        self.assertFalse(other.has_cached_structural_hash())
+        self.assertEqual(other.get_structural_hash(), expr_hash)
+        self.assertTrue(expr.equals(other))
+
+    def test_structural_key_as_dict_key(self):
+        expressions = [ModelParser.parse_expression(string) for string in ['a + b', 'exp(x) * 2', 'a + b', 'c',
+                                                                           'exp(x) * 2', 'a+b']]
+        first_by_key = dict()
+        for expression in expressions:
+            first_by_key.setdefault(ASTStructuralKey(expression), expression)
+        self.assertEqual(len(first_by_key), 3)
+        self.assertIs(first_by_key[ASTStructuralKey(expressions[5])], expressions[0])
+        self.assertIs(first_by_key[ASTStructuralKey(expressions[4])], expressions[1])
+        self.assertNotIn(ASTStructuralKey(ModelParser.parse_expression('a - b')), first_by_key)
+        self.assertIn(ASTStructuralKey(expressions[3].clone()), set(first_by_key.keys()))
+
+
+if __name__ == '__main__':
+    unittest.main()
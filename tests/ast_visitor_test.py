@@ -0,0 +1,72 @@
+#
+# ast_visitor_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import unittest
+
+from pynestml.meta_model.ast_simple_expression import ASTSimpleExpression
+from pynestml.meta_model.ast_variable import ASTVariable
+from pynestml.utils.model_parser import ModelParser
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
+from pynestml.visitors.ast_visitor import ASTVisitor
+
+
+class ASTVisitorTest(unittest.TestCase):
+    """
+    Tests the dispatch of nodes to the visit_, traverse_ and endvisit_ methods of visitors.
+    """
+
+    class VariableCollector(ASTVisitor):
+        def __init__(self):
+            super(ASTVisitorTest.VariableCollector, self).__init__()
+            self.events = list()
+
+        def visit_variable(self, node):
+            self.events.append(('visit', node.get_name()))
+
+        def endvisit_variable(self, node):
+            self.events.append(('endvisit', node.get_name()))
+
+    class ASTDerivedVariable(ASTVariable):
+        __slots__ = ()
+
+    def test_nodes_are_dispatched_by_class(self):
+        visitor = ASTVisitorTest.VariableCollector()
+        ModelParser.parse_expression('a + b * c').accept(visitor)
+        self.assertEqual(visitor.events, [('visit', 'a'), ('endvisit', 'a'), ('visit', 'b'), ('endvisit', 'b'),
+                                          ('visit', 'c'), ('endvisit', 'c')])
+
+    def test_subclasses_are_dispatched_by_method_resolution_order(self):
+        visitor = ASTVisitorTest.VariableCollector()
+        ASTSimpleExpression(variable=ASTVisitorTest.ASTDerivedVariable('x')).accept(visitor)
+        self.assertEqual(visitor.events, [('visit', 'x'), ('endvisit', 'x')])
+        self.assertEqual(ASTVisitor.dispatch_table[ASTVisitorTest.ASTDerivedVariable],
+                         ASTVisitor.dispatch_table[ASTVariable])
+        # objects which are not part of the meta_model are ignored
+        visitor.handle('x')
+        self.assertEqual(len(visitor.events), 2)
+
+    def test_higher_order_visitor(self):
+        nodes = list()
+        ModelParser.parse_expression('a + b * c').accept(ASTHigherOrderVisitor(visit_funcs=nodes.append))
+        self.assertEqual([node.get_name() for node in nodes if isinstance(node, ASTVariable)], ['a', 'b', 'c'])
+        self.assertEqual(len(nodes), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,10 +19,12 @@
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import tempfile
 import unittest
 
 from antlr4 import *
 
+from pynestml.meta_model.ast_node import ASTNode
 from pynestml.utils.ast_source_location import ASTSourceLocation
 from pynestml.generated.PyNestMLLexer import PyNestMLLexer
 from pynestml.generated.PyNestMLParser import PyNestMLParser
@@ -33,6 +35,7 @@ from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.utils.logger import LoggingLevel, Logger
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
+from pynestml.visitors.ast_higher_order_visitor import ASTHigherOrderVisitor
 
 # setups the infrastructure
 PredefinedUnits.register_units()
@@ -85,6 +88,37 @@ class CommentTest(unittest.TestCase):
         # check that update comment is detected
         self.assertEqual(neuron_body_elements[6].get_comment()[0], 'update comment ok')
 
+    def test_comments_of_many_declarations(self):
+        declarations = ''.join('    #pre comment %d\n    V_%d mV = 0 mV #in comment %d\n\n' % (i, i, i)
+                               for i in range(200))
+        model = 'neuron many_comments:\n  state:\n' + declarations + '  end\n  update:\n  end\n' \
+                '  input:\n    spikes mV <- spike\n  end\n  output: spike\nend\n'
+        input_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'many_comments.nestml')
+        with open(input_path, 'w') as f:
+            f.write(model)
+        stream = CommonTokenStream(PyNestMLLexer(FileStream(input_path)))
+        stream.fill()
+        parser = PyNestMLParser(stream)
+        ast = ASTBuilderVisitor(stream.tokens).visit(parser.nestMLCompilationUnit())
+        state_block = ast.get_neuron_list()[0].get_body().get_body_elements()[0]
+        for (i, declaration) in enumerate(state_block.get_declarations()):
+            self.assertEqual(declaration.get_comment(), ['pre comment %d' % i, 'in comment %d' % i])
+
+    def test_nodes_without_comments_share_empty_containers(self):
+        input_file = FileStream(os.path.join(os.path.realpath(os.path.join(os.path.dirname(__file__), 'resources')),
+                                             'CommentTest.nestml'))
+        stream = CommonTokenStream(PyNestMLLexer(input_file))
+        stream.fill()
+        parser = PyNestMLParser(stream)
+        ast = ASTBuilderVisitor(stream.tokens).visit(parser.nestMLCompilationUnit())
+        nodes = list()
+        ast.get_neuron_list()[0].accept(ASTHigherOrderVisitor(visit_funcs=nodes.append))
+        for node in nodes + [node.clone() for node in nodes]:
+            # the attributes are stored in slots
+            self.assertFalse(hasattr(node, '__dict__'), type(node).__name__)
+            for comments in (node.get_comment(), node.pre_comments, node.post_comments):
+                self.assertTrue(comments is None or len(comments) > 0 or comments is ASTNode.NO_COMMENTS)
+
 
 if __name__ == '__main__':
     unittest.main()
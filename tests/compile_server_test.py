@@ -0,0 +1,146 @@
+#
+# compile_server_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import io
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+try:
+    # python 3.4+ should use builtin unittest.mock not mock package
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+from pynestml.frontend import pynestml_frontend
+from pynestml.frontend.compile_client import request
+from pynestml.frontend.compile_server import CompileServer
+
+
+class CompileServerTest(unittest.TestCase):
+    """
+    Tests if the compile server processes requests as the command line interface does and keeps running on errors.
+    """
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp(prefix='nestml')
+        shutil.copy(os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, 'models', 'iaf_psc_exp.nestml')),
+                    self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def serve(self, requests):
+        output_stream = io.StringIO()
+        server = CompileServer()
+        server.serve_streams(io.StringIO(''.join(json.dumps(request) + '\n' for request in requests)), output_stream)
+        return server, [json.loads(line) for line in output_stream.getvalue().splitlines()]
+
+    def test_requests_are_processed_in_order(self):
+        args = ['--input_path', 'iaf_psc_exp.nestml', '--target_path', 'target', '--no_cache', '--logging_level',
+                'INFO']
+        server, responses = self.serve([{'jsonrpc': '2.0', 'id': 1, 'method': 'check',
+                                         'params': {'args': args, 'cwd': self.path}},
+                                        {'jsonrpc': '2.0', 'id': 2, 'method': 'compile',
+                                         'params': {'args': args, 'cwd': self.path}},
+                                        {'jsonrpc': '2.0', 'id': 3, 'method': 'shutdown'},
+                                        {'jsonrpc': '2.0', 'id': 4, 'method': 'compile',
+                                         'params': {'args': args, 'cwd': self.path}}])
+        self.assertTrue(server.stopped)
+        self.assertEqual([response['id'] for response in responses], [1, 2, 3])
+        for response in responses[:2]:
+            self.assertFalse(response['result']['errors_occurred'])
+            self.assertIn('iaf_psc_exp', [message['neuronName'] for message in response['result']['messages']])
+        self.assertEqual(responses[0]['result']['files'], [])
+        self.assertIn(os.path.join(self.path, 'target', 'iaf_psc_exp.cpp'), responses[1]['result']['files'])
+        for file_path in responses[1]['result']['files']:
+            self.assertTrue(os.path.isfile(file_path))
+
+    def test_only_files_of_request_are_reported(self):
+        shutil.copy(os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, 'models', 'izhikevich.nestml')),
+                    self.path)
+        with open(os.path.join(self.path, 'broken.nestml'), 'w') as f:
+            f.write('neuron broken:\n')
+        requests = list()
+        for input_path in [self.path, 'iaf_psc_exp.nestml', 'iaf_psc_exp.nestml', 'broken.nestml']:
+            args = ['--input_path', input_path, '--target_path', 'target', '--module_name', 'xyzzymodule',
+                    '--no_cache', '--logging_level', 'INFO']
+            requests.append({'jsonrpc': '2.0', 'id': len(requests), 'method': 'compile',
+                             'params': {'args': args, 'cwd': self.path}})
+        server = CompileServer()
+        server.warm_up()
+        with patch.object(pynestml_frontend, 'init_predefined', wraps=pynestml_frontend.init_predefined) \
+                as init_predefined:
+            server, responses = self.serve(requests)
+        # the predefined symbols of the warm-up are reused
+        self.assertEqual(init_predefined.call_count, 0)
+        files = [[os.path.relpath(path, os.path.join(self.path, 'target')) for path in response['result']['files']]
+                 for response in responses]
+        self.assertIn('izhikevich.cpp', files[0])
+        module_files = ['CMakeLists.txt', 'xyzzymodule.cpp', 'xyzzymodule.h',
+                        os.path.join('sli', 'xyzzymodule-init.sli')]
+        # the files found up to date are reported as well
+        for i in [1, 2]:
+            self.assertEqual(files[i], sorted(['iaf_psc_exp.cpp', 'iaf_psc_exp.h'] + module_files))
+        # the model cannot be parsed, thus no files are generated
+        self.assertEqual(files[3], [])
+        # the messages on the registration of derived types are the same as for a fresh run
+        registered = [[message['message'] for message in response['result']['messages']
+                       if message['code'] == 'TYPE_REGISTERED'] for response in responses[1:3]]
+        self.assertTrue(len(registered[0]) > 0)
+        self.assertEqual(registered[0], registered[1])
+
+    def test_invalid_requests_are_reported(self):
+        server = CompileServer()
+        self.assertEqual(json.loads(server.handle_line('{'))['error']['code'], CompileServer.PARSE_ERROR)
+        self.assertEqual(json.loads(server.handle_line('[]'))['error']['code'], CompileServer.INVALID_REQUEST)
+        response = json.loads(server.handle_line('{"jsonrpc": "2.0", "id": 1, "method": "build"}'))
+        self.assertEqual((response['id'], response['error']['code']), (1, CompileServer.METHOD_NOT_FOUND))
+        for args in [None, ['--input_path'], ['--input_path', os.path.join(self.path, 'missing.nestml')],
+                     ['--serve'], ['--input_path', self.path, '--watch']]:
+            response = server.handle_request('compile', {'args': args})
+            self.assertEqual(response['error']['code'], CompileServer.INVALID_PARAMS)
+        # notifications are not answered
+        self.assertIsNone(server.handle_line('{"jsonrpc": "2.0", "method": "build"}'))
+        self.assertFalse(server.stopped)
+
+    def test_socket(self):
+        socket_path = os.path.join(self.path, 'nestml.sock')
+        server = CompileServer()
+        thread = threading.Thread(target=server.serve_socket, args=(socket_path,))
+        thread.start()
+        try:
+            for i in range(100):
+                if os.path.exists(socket_path):
+                    break
+                thread.join(0.05)
+            response = request(socket_path, 'check', {'args': ['--input_path', 'iaf_psc_exp.nestml', '--no_cache'],
+                                                      'cwd': self.path})
+            self.assertFalse(response['result']['errors_occurred'])
+        finally:
+            request(socket_path, 'shutdown')
+            thread.join()
+        self.assertFalse(os.path.exists(socket_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#
+# disk_cache_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pynestml.utils.disk_cache import DiskCache
+
+
+class DiskCacheTest(unittest.TestCase):
+    """
+    Tests if the persistent cache stores, retrieves and evicts entries as intended.
+    """
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp(prefix='nestml')
+
+    def tearDown(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def test_keys_depend_on_all_parts(self):
+        self.assertEqual(DiskCache.compute_key('neuron', '1.0'), DiskCache.compute_key('neuron', '1.0'))
+        self.assertNotEqual(DiskCache.compute_key('neuron', '1.0'), DiskCache.compute_key('neuron', '1.1'))
+        self.assertNotEqual(DiskCache.compute_key('ab', 'c'), DiskCache.compute_key('a', 'bc'))
+
+    def test_store_and_load(self):
+        cache = DiskCache(self.path)
+        key = DiskCache.compute_key('neuron')
+        self.assertIsNone(cache.load(key))
+        cache.store(key, {'neuron': [1, 2, 3]})
+        self.assertEqual(cache.load(key), {'neuron': [1, 2, 3]})
+        self.assertEqual(DiskCache(self.path).load(key), {'neuron': [1, 2, 3]})
+
+    def test_broken_entries_are_discarded(self):
+        cache = DiskCache(self.path)
+        key = DiskCache.compute_key('neuron')
+        cache.store(key, 'neuron')
+        with open(cache.get_entry_path(key), 'wb') as f:
+            f.write(b'broken')
+        self.assertIsNone(cache.load(key))
+        self.assertFalse(os.path.exists(cache.get_entry_path(key)))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = DiskCache(self.path)
+        keys = [DiskCache.compute_key(i) for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.store(key, 'x' * 1000)
+            # ensure distinct access times, independent of the resolution of the file system
+            os.utime(cache.get_entry_path(key), (i, i))
+        entry_size = os.path.getsize(cache.get_entry_path(keys[0]))
+        cache.load(keys[0])
+        cache.max_size = 2 * entry_size
+        cache.evict()
+        self.assertIsNotNone(cache.load(keys[0]))
+        self.assertIsNone(cache.load(keys[1]))
+        self.assertIsNotNone(cache.load(keys[2]))
+        self.assertLessEqual(cache.get_size(), cache.max_size)
+
+    def test_cache_is_not_listed_on_every_store(self):
+        cache = DiskCache(self.path)
+        cache.store(DiskCache.compute_key(-1), 'x' * 1000)
+        entry_size = cache.get_size()
+        cache.max_size = 10 * entry_size
+        with patch.object(cache, 'get_entries', wraps=cache.get_entries) as get_entries:
+            for i in range(100):
+                cache.store(DiskCache.compute_key(i), 'x' * 1000)
+        # the cache is only listed on eviction, i.e., once every few stores
+        self.assertLess(get_entries.call_count, 50)
+        self.assertLessEqual(cache.get_size(), cache.max_size)
+        self.assertEqual(cache.size, cache.get_size())
+
+    def test_clear(self):
+        cache = DiskCache(self.path)
+        key = DiskCache.compute_key('neuron')
+        cache.store(key, 'neuron')
+        cache.clear()
+        self.assertIsNone(cache.load(key))
+        self.assertEqual(cache.get_size(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -34,6 +34,7 @@ from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.utils.logger import LoggingLevel, Logger
+from pynestml.utils.model_parser import ModelParser
 from pynestml.visitors.ast_builder_visitor import ASTBuilderVisitor
 
 # setups the infrastructure
@@ -68,6 +69,29 @@ class ExpressionParsingTest(unittest.TestCase):
         # print('done')
         self.assertTrue(isinstance(ast, ASTNestMLCompilationUnit))
 
+    def test_parse_string_returns_independent_clones(self):
+        first = ModelParser.parse_expression('V_m * exp(-t / tau_m) + I_e')
+        self.assertIn(('expression', 'V_m * exp(-t / tau_m) + I_e'), ModelParser.parsed_strings)
+        # modifying a parsed expression must not affect expressions parsed later from the same string
+        first.get_lhs().get_lhs().get_variable().set_name('U_m')
+        second = ModelParser.parse_expression('V_m * exp(-t / tau_m) + I_e')
+        self.assertIsNot(first, second)
+        self.assertEqual(str(first), 'U_m * exp(-t / tau_m) + I_e')
+        self.assertEqual(str(second), 'V_m * exp(-t / tau_m) + I_e')
+        self.assertEqual(str(ModelParser.parse_declaration('V_m mV = 0 mV')).strip(), 'V_m mV = 0mV')
+
+    def test_parse_string_cache_is_bounded(self):
+        max_size = ModelParser.parsed_strings_max_size
+        try:
+            ModelParser.parsed_strings_max_size = 10
+            for i in range(20):
+                ModelParser.parse_expression('x + %d' % i)
+            self.assertEqual(len(ModelParser.parsed_strings), 10)
+            self.assertIn(('expression', 'x + 19'), ModelParser.parsed_strings)
+            self.assertNotIn(('expression', 'x + 0'), ModelParser.parsed_strings)
+        finally:
+            ModelParser.parsed_strings_max_size = max_size
+
 
 if __name__ == '__main__':
     unittest.main()
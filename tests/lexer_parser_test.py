@@ -26,6 +26,8 @@ from antlr4 import *
 
 from pynestml.generated.PyNestMLLexer import PyNestMLLexer
 from pynestml.generated.PyNestMLParser import PyNestMLParser
+from pynestml.utils.error_listener import NestMLErrorListener
+from pynestml.utils.model_parser import parse_with_fallback
 
 
 class LexerParserTest(unittest.TestCase):
@@ -49,6 +51,33 @@ class LexerParserTest(unittest.TestCase):
                 self.assertTrue(tree is not None)
         return
 
+    def test_two_stage_parsing_matches_ll_parsing(self):
+        models_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models')))
+        for filename in sorted(os.listdir(models_path)):
+            if filename.endswith('.nestml'):
+                stream = CommonTokenStream(PyNestMLLexer(FileStream(os.path.join(models_path, filename))))
+                stream.fill()
+                parser = PyNestMLParser(stream)
+                expected = parser.nestMLCompilationUnit().toStringTree(recog=parser)
+                parser = PyNestMLParser(stream)
+                parser.reset()
+                actual = parse_with_fallback(parser, parser.nestMLCompilationUnit).toStringTree(recog=parser)
+                self.assertEqual(expected, actual, filename)
+
+    def test_two_stage_parsing_reports_syntax_errors_once(self):
+        model = 'neuron test:\n  state:\n    V_m mV = = 0 mV\n  end\nend\n'
+        stream = CommonTokenStream(PyNestMLLexer(InputStream(model)))
+        parser = PyNestMLParser(stream)
+        parser.removeErrorListeners()
+        errors = list()
+        error_listener = NestMLErrorListener()
+        error_listener.syntaxError = lambda recognizer, symbol, line, column, msg, e: errors.append((line, column, msg))
+        parser.addErrorListener(error_listener)
+        parse_with_fallback(parser, parser.nestMLCompilationUnit)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][:2], (3, 13))
+        self.assertIn("extraneous input '='", errors[0][2])
+
 
 if __name__ == '__main__':
     unittest.main()
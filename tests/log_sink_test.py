@@ -0,0 +1,100 @@
+#
+# log_sink_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from pynestml.meta_model.ast_body import ASTBody
+from pynestml.meta_model.ast_neuron import ASTNeuron
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.log_sink import LogSink
+from pynestml.utils.logger import Logger, LoggingLevel
+
+
+class LogSinkTest(unittest.TestCase):
+    """
+    Tests the streaming of log messages to a file in JSON Lines notation.
+    """
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, 'log.jsonl')
+
+    def tearDown(self):
+        Logger.set_sink(None)
+        Logger.init_logger(LoggingLevel.INFO)
+        shutil.rmtree(self.tmp_dir)
+
+    def read_ids(self):
+        return [message['id'] for message in LogSink.read_messages(self.path)]
+
+    def test_messages_are_buffered(self):
+        sink = LogSink(self.path, buffer_size=3)
+        sink.write({'id': 0, 'message': 'first'})
+        sink.write({'id': 1, 'message': 'second'})
+        self.assertEqual(self.read_ids(), [])
+        sink.write({'id': 2, 'message': 'third'})
+        self.assertEqual(self.read_ids(), [0, 1, 2])
+        sink.write({'id': 3, 'message': 'error'}, flush=True)
+        self.assertEqual(self.read_ids(), [0, 1, 2, 3])
+        sink.write({'id': 4, 'message': 'last'})
+        self.assertEqual([message['message'] for message in sink.iter_messages()],
+                         ['first', 'second', 'third', 'error', 'last'])
+        sink.close()
+        self.assertEqual(self.read_ids(), [0, 1, 2, 3, 4])
+
+    def test_discard_written_and_buffered_messages(self):
+        sink = LogSink(self.path, buffer_size=4)
+        for i in range(10):
+            sink.write({'id': i})
+        self.assertEqual(self.read_ids(), list(range(8)))
+        sink.discard(9)
+        sink.discard(6)
+        sink.write({'id': 6})
+        sink.close()
+        self.assertEqual(self.read_ids(), list(range(7)))
+        self.assertEqual(os.path.getsize(self.path), sum(len(json.dumps({'id': i})) + 1 for i in range(7)))
+
+    def test_logger_streams_messages_to_sink(self):
+        Logger.init_logger(LoggingLevel.NO)
+        Logger.set_current_neuron(None)
+        neuron = ASTNeuron('test', ASTBody([], source_position=ASTSourceLocation.get_predefined_source_position()),
+                           'test.nestml', source_position=ASTSourceLocation.get_predefined_source_position())
+        Logger.set_sink(LogSink(self.path))
+        Logger.log_message(neuron=neuron, message='info "quoted"', log_level=LoggingLevel.INFO)
+        # messages which do not belong to a neuron are not part of the log
+        Logger.log_message(message='global', log_level=LoggingLevel.INFO)
+        checkpoint = Logger.checkpoint()
+        Logger.log_message(neuron=neuron, message='discarded', log_level=LoggingLevel.WARNING)
+        Logger.rollback(checkpoint)
+        Logger.log_message(neuron=neuron, message='error', log_level=LoggingLevel.ERROR)
+        # errors are written immediately
+        messages = list(LogSink.read_messages(self.path))
+        self.assertEqual([message['message'] for message in messages], ['info "quoted"', 'error'])
+        self.assertEqual([message['severity'] for message in messages], ['INFO', 'ERROR'])
+        self.assertEqual([dict(message) for message in messages],
+                         [dict(message, id=message_nr) for (message_nr, message)
+                          in zip(sorted(Logger.get_log().keys()), json.loads(Logger.get_json_format()))])
+
+
+if __name__ == '__main__':
+    unittest.main()
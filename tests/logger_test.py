@@ -0,0 +1,124 @@
+#
+# logger_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import contextlib
+import io
+import unittest
+
+from pynestml.meta_model.ast_body import ASTBody
+from pynestml.meta_model.ast_neuron import ASTNeuron
+from pynestml.utils.ast_source_location import ASTSourceLocation
+from pynestml.utils.logger import Logger, LoggingLevel, OutputRecorder
+
+
+class LoggerTest(unittest.TestCase):
+    """
+    Tests the queries of the logger for the messages of neurons and levels.
+    """
+
+    def setUp(self):
+        Logger.init_logger(LoggingLevel.NO)
+        Logger.set_current_neuron(None)
+        self.neurons = list()
+        for name in ['first', 'second', 'third']:
+            neuron = ASTNeuron(name, ASTBody([], source_position=ASTSourceLocation.get_predefined_source_position()),
+                               name + '.nestml', source_position=ASTSourceLocation.get_predefined_source_position())
+            self.neurons.append(neuron)
+        levels = [LoggingLevel.INFO, LoggingLevel.WARNING, LoggingLevel.ERROR]
+        for i in range(30):
+            Logger.log_message(neuron=self.neurons[i % 2], message='message %d' % i, log_level=levels[i % 3])
+        # global messages are not stored in the log
+        Logger.log_message(message='global message', log_level=LoggingLevel.ERROR)
+
+    def tearDown(self):
+        Logger.init_logger(LoggingLevel.INFO)
+
+    def test_messages_of_level(self):
+        for level in [LoggingLevel.INFO, LoggingLevel.WARNING, LoggingLevel.ERROR]:
+            expected = [(neuron, log_level, message) for (artifact_name, neuron, log_level, code, position, message)
+                        in Logger.get_log().values() if log_level == level]
+            self.assertEqual(Logger.get_all_messages_of_level(level), expected)
+            self.assertEqual(len(expected), 10)
+
+    def test_messages_of_neuron(self):
+        for neuron in self.neurons:
+            messages = Logger.get_all_messages_of_neuron(neuron)
+            self.assertEqual([message for (neuron_i, level, message) in messages],
+                             [message for (artifact_name, neuron_i, level, code, position, message)
+                              in Logger.get_log().values() if neuron_i is neuron])
+            errors = Logger.get_all_messages_of_level_and_or_neuron(neuron, LoggingLevel.ERROR)
+            self.assertEqual([message for (neuron_i, level, message) in errors],
+                             [message for (neuron_i, level, message) in messages if level == LoggingLevel.ERROR])
+
+    def test_has_errors(self):
+        self.assertTrue(Logger.has_errors(self.neurons[0]))
+        self.assertTrue(Logger.has_errors(self.neurons[1]))
+        self.assertFalse(Logger.has_errors(self.neurons[2]))
+        self.assertEqual(Logger.error_counts, {'first.nestml': 5, 'second.nestml': 5})
+
+    def test_indexes_are_rebuilt_when_log_is_restored(self):
+        log = dict(Logger.get_log())
+        counter = Logger.curr_message
+        Logger.log_message(neuron=self.neurons[2], message='error', log_level=LoggingLevel.ERROR)
+        self.assertTrue(Logger.has_errors(self.neurons[2]))
+        Logger.set_log(log, counter)
+        self.assertFalse(Logger.has_errors(self.neurons[2]))
+        self.assertEqual(len(Logger.get_all_messages_of_level(LoggingLevel.ERROR)), 10)
+
+    def test_rollback_discards_messages_since_checkpoint(self):
+        Logger.start_recording()
+        Logger.log_message(neuron=self.neurons[0], message='kept', log_level=LoggingLevel.INFO)
+        checkpoint = Logger.checkpoint()
+        counter = Logger.curr_message
+        log = dict(Logger.get_log())
+        Logger.log_message(neuron=self.neurons[2], message='discarded', log_level=LoggingLevel.ERROR)
+        Logger.log_message(neuron=self.neurons[0], message='discarded', log_level=LoggingLevel.WARNING)
+        Logger.log_message(message='discarded', log_level=LoggingLevel.INFO)
+        Logger.rollback(checkpoint)
+        recorded = Logger.stop_recording()
+        self.assertEqual([message for (neuron, code, message, position, level) in recorded], ['kept'])
+        self.assertEqual(Logger.curr_message, counter)
+        self.assertEqual(Logger.get_log(), log)
+        self.assertFalse(Logger.has_errors(self.neurons[2]))
+        self.assertEqual(len(Logger.get_all_messages_of_level(LoggingLevel.WARNING)), 10)
+        self.assertEqual(len(Logger.get_all_messages_of_neuron(self.neurons[0])), 16)
+
+    def test_output_is_recorded_in_order_with_messages(self):
+        Logger.start_recording()
+        with contextlib.redirect_stdout(OutputRecorder()):
+            print('first output')
+            Logger.log_message(neuron=self.neurons[0], message='message', log_level=LoggingLevel.INFO)
+            checkpoint = Logger.checkpoint()
+            print('second output')
+            Logger.log_message(neuron=self.neurons[0], message='discarded', log_level=LoggingLevel.INFO)
+            # the output has been printed already, thus it is not discarded
+            Logger.rollback(checkpoint)
+        recorded = Logger.stop_recording()
+        self.assertEqual([entry if isinstance(entry, str) else entry[2] for entry in recorded],
+                         ['first output', '\n', 'message', 'second output', '\n'])
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            Logger.replay_messages(recorded)
+        self.assertEqual(output.getvalue(), 'first output\nsecond output\n')
+        self.assertEqual(Logger.get_all_messages_of_neuron(self.neurons[0])[-1][2], 'message')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+#
+# model_watcher_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import shutil
+import tempfile
+import unittest
+
+try:
+    # python 3.4+ should use builtin unittest.mock not mock package
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.frontend.model_watcher import ModelWatcher
+from pynestml.frontend.pynestml_frontend import init_predefined
+from pynestml.utils.logger import Logger
+from pynestml.utils.messages import MessageCode
+from pynestml.utils.model_parser import ModelParser
+
+
+class ModelWatcherTest(unittest.TestCase):
+    """
+    Tests if the watch mode processes exactly the added, modified and removed models again.
+    """
+
+    def setUp(self):
+        self.input_path = tempfile.mkdtemp(prefix='nestml')
+        self.target_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'target')
+        models_path = os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, 'models'))
+        for model_name in ['iaf_psc_exp', 'izhikevich']:
+            shutil.copy(os.path.join(models_path, model_name + '.nestml'), self.input_path)
+        FrontendConfiguration.parse_config(['--input_path', self.input_path, '--target_path', self.target_path,
+                                            '--module_name', 'xyzzymodule', '--no_cache', '--watch'])
+        init_predefined()
+
+    def tearDown(self):
+        shutil.rmtree(self.input_path, ignore_errors=True)
+        shutil.rmtree(os.path.dirname(self.target_path), ignore_errors=True)
+
+    def get_model_path(self, model_name):
+        return os.path.join(self.input_path, model_name + '.nestml')
+
+    def replace_in_model(self, model_name, old, new):
+        with open(self.get_model_path(model_name)) as f:
+            model = f.read()
+        with open(self.get_model_path(model_name), 'w') as f:
+            f.write(model.replace(old, new))
+        # the modification has to be detectable even if the file system stores the time of modification in seconds
+        stat = os.stat(self.get_model_path(model_name))
+        os.utime(self.get_model_path(model_name), ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+
+    def read_target_file(self, file_name):
+        with open(os.path.join(self.target_path, file_name)) as f:
+            return f.read()
+
+    def process_changes(self, watcher):
+        changed_paths, removed_paths = watcher.get_changes()
+        watcher.process_changes(changed_paths, removed_paths)
+        return sorted(os.path.basename(path) for path in changed_paths + removed_paths)
+
+    def test_only_changed_models_are_processed(self):
+        watcher = ModelWatcher()
+        self.assertEqual(self.process_changes(watcher), ['iaf_psc_exp.nestml', 'izhikevich.nestml'])
+        self.assertIn('izhikevich.h', self.read_target_file('xyzzymodule.cpp'))
+        self.assertEqual(watcher.get_changes(), ([], []))
+
+        # the untouched model is neither parsed nor generated again
+        iaf_psc_exp = watcher.neurons[self.get_model_path('iaf_psc_exp')]
+        self.replace_in_model('izhikevich', 'a real = 0.02 ', 'a real = 0.03 ')
+        self.assertEqual(self.process_changes(watcher), ['izhikevich.nestml'])
+        self.assertIs(watcher.neurons[self.get_model_path('iaf_psc_exp')], iaf_psc_exp)
+        self.assertIn('0.03', self.read_target_file('izhikevich.cpp'))
+        self.assertIn('iaf_psc_exp.h', self.read_target_file('xyzzymodule.cpp'))
+
+        # errors are reported until they are fixed
+        self.replace_in_model('izhikevich', 'a real = 0.03 ', 'a real = undefined_variable ')
+        self.process_changes(watcher)
+        self.assertTrue(watcher.errors[self.get_model_path('izhikevich')])
+        self.assertNotIn('izhikevich.h', self.read_target_file('xyzzymodule.cpp'))
+        self.replace_in_model('izhikevich', 'a real = undefined_variable ', 'a real = 0.04 ')
+        self.process_changes(watcher)
+        self.assertFalse(watcher.errors[self.get_model_path('izhikevich')])
+        self.assertIn('0.04', self.read_target_file('izhikevich.cpp'))
+
+        # removed models are removed from the module
+        os.remove(self.get_model_path('izhikevich'))
+        self.assertEqual(self.process_changes(watcher), ['izhikevich.nestml'])
+        self.assertNotIn('izhikevich.h', self.read_target_file('xyzzymodule.cpp'))
+        self.assertEqual(list(watcher.neurons.keys()), [self.get_model_path('iaf_psc_exp')])
+
+    def test_watch_until_interrupted(self):
+        watcher = ModelWatcher()
+        with patch('time.sleep', side_effect=KeyboardInterrupt):
+            self.assertEqual(watcher.watch(), 0)
+        self.assertEqual(len(watcher.states), 2)
+        self.assertTrue(os.path.isfile(os.path.join(self.target_path, 'iaf_psc_exp.cpp')))
+
+    def test_watch_continues_if_processing_fails(self):
+        parse_model = ModelParser.parse_model
+        failures = [self.get_model_path('iaf_psc_exp')]
+
+        def parse_model_failing_once(path):
+            if path in failures:
+                failures.remove(path)
+                raise RuntimeError('xyzzy')
+            return parse_model(path)
+
+        def sleep(interval):
+            if sleep.polls == 0:
+                # the failed model is not processed again before it is modified, whereas the models which have not
+                # been reached are processed on the next poll
+                self.assertTrue(watcher.errors[self.get_model_path('iaf_psc_exp')])
+                self.assertNotIn(self.get_model_path('izhikevich'), watcher.states)
+                self.replace_in_model('iaf_psc_exp', 'tau_m ms = 10 ms', 'tau_m ms = 11 ms')
+            else:
+                raise KeyboardInterrupt
+            sleep.polls += 1
+        sleep.polls = 0
+
+        watcher = ModelWatcher()
+        with patch.object(ModelParser, 'parse_model', side_effect=parse_model_failing_once), \
+                patch.object(Logger, 'log_message', wraps=Logger.log_message) as log_message, \
+                patch('time.sleep', side_effect=sleep):
+            self.assertEqual(watcher.watch(), 0)
+        self.assertEqual(sleep.polls, 1)
+        self.assertIn((None, MessageCode.PROCESSING_FAILED), [call[0][:2] for call in log_message.call_args_list])
+        self.assertFalse(any(watcher.errors.values()))
+        self.assertIn('tau_m = 11', self.read_target_file('iaf_psc_exp.cpp'))
+        self.assertIn('izhikevich.h', self.read_target_file('xyzzymodule.cpp'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#
+# predefined_units_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from pynestml.symbols.predefined_units import PredefinedUnits
+
+
+class PredefinedUnitsTest(unittest.TestCase):
+    """
+    Tests if the snapshot of the predefined units results in the same units as collecting them from astropy.
+    """
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp(prefix='nestml')
+        PredefinedUnits.snapshot_path = None
+        PredefinedUnits.register_units()
+        self.expected_units = PredefinedUnits.get_units()
+        PredefinedUnits.snapshot_path = os.path.join(self.path, 'predefined_units.json')
+
+    def tearDown(self):
+        PredefinedUnits.snapshot_path = None
+        PredefinedUnits.register_units()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def assert_expected_units(self):
+        units = PredefinedUnits.get_units()
+        self.assertEqual(list(units.keys()), list(self.expected_units.keys()))
+        for (name, unit) in units.items():
+            self.assertEqual(unit.get_name(), name)
+            self.assertIs(unit.get_unit(), self.expected_units[name].get_unit())
+
+    def test_snapshot_results_in_same_units(self):
+        PredefinedUnits.register_units()
+        self.assertTrue(os.path.isfile(PredefinedUnits.snapshot_path))
+        self.assert_expected_units()
+        # the second time, the units are loaded from the snapshot
+        PredefinedUnits.register_units()
+        self.assert_expected_units()
+
+    def test_outdated_snapshot_is_replaced(self):
+        with open(PredefinedUnits.snapshot_path, 'w') as f:
+            json.dump({'versions': {'astropy': '0.0', 'pynestml': '0.0'}, 'units': [['mV', 'ms']]}, f)
+        PredefinedUnits.register_units()
+        self.assert_expected_units()
+        with open(PredefinedUnits.snapshot_path) as f:
+            self.assertNotEqual(json.load(f)['versions']['astropy'], '0.0')
+
+    def test_broken_snapshot_is_ignored(self):
+        with open(PredefinedUnits.snapshot_path, 'w') as f:
+            f.write('broken')
+        PredefinedUnits.register_units()
+        self.assert_expected_units()
@@ -0,0 +1,73 @@
+#
+# profiler_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import unittest
+
+from pynestml.utils.profiler import Profiler
+
+
+class ProfilerTest(unittest.TestCase):
+    """
+    Tests if the profiler records the phases of the toolchain as intended.
+    """
+
+    def tearDown(self):
+        Profiler.disable()
+        Profiler.reset()
+
+    def test_phases_are_only_recorded_if_enabled(self):
+        Profiler.reset()
+        with Profiler.phase('parser', 'neuron.nestml'):
+            pass
+        self.assertEqual(Profiler.get_report(), {'phases': [], 'artifacts': []})
+
+    def test_nested_phases(self):
+        Profiler.enable()
+        for i in range(2):
+            with Profiler.phase('symbol_table', 'neuron'):
+                with Profiler.phase('cocos.check_expression_correct'):
+                    data = [0] * 100000
+        with Profiler.phase('render_module', 'module'):
+            pass
+        Profiler.disable()
+        phases = {(phase['phase'], phase['artifact']): phase for phase in Profiler.get_report()['phases']}
+        self.assertEqual(set(phases.keys()), {('symbol_table', 'neuron'), ('render_module', 'module'),
+                                              ('cocos.check_expression_correct', 'neuron')})
+        self.assertEqual(phases[('symbol_table', 'neuron')]['calls'], 2)
+        self.assertEqual(phases[('cocos.check_expression_correct', 'neuron')]['calls'], 2)
+        self.assertGreaterEqual(phases[('symbol_table', 'neuron')]['time'],
+                                phases[('cocos.check_expression_correct', 'neuron')]['time'])
+        self.assertGreater(phases[('cocos.check_expression_correct', 'neuron')]['peak_memory'], 800000)
+        # nested phases of the same neuron are not counted twice
+        artifacts = {artifact['artifact']: artifact['time'] for artifact in Profiler.get_report()['artifacts']}
+        self.assertAlmostEqual(artifacts['neuron'], phases[('symbol_table', 'neuron')]['time'])
+        self.assertIn('cocos.check_expression_correct', Profiler.get_summary())
+
+    def test_merge_records(self):
+        Profiler.enable()
+        with Profiler.phase('parser', 'neuron.nestml'):
+            pass
+        records = Profiler.get_records()
+        Profiler.enable()
+        with Profiler.phase('parser', 'neuron.nestml'):
+            pass
+        Profiler.merge_records(records)
+        phases = Profiler.get_report()['phases']
+        self.assertEqual(len(phases), 1)
+        self.assertEqual(phases[0]['calls'], 2)
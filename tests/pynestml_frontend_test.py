@@ -17,14 +17,20 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import json
 import os
 import pytest
+import re
+import shutil
+import subprocess
 import sys
 import tempfile
 import unittest
 
-from pynestml.frontend.pynestml_frontend import main
+from pynestml.codegeneration.build_manifest import BuildManifest
+from pynestml.frontend.pynestml_frontend import main, to_nest
 from pynestml.frontend.frontend_configuration import FrontendConfiguration
+from pynestml.utils.profiler import Profiler
 
 try:
     # python 3.4+ should use builtin unittest.mock not mock package
@@ -57,6 +63,113 @@ class PyNestMLFrontendTest(unittest.TestCase):
         self.assertTrue(exit_code == 0)
 
 
+    def test_codegeneration_in_parallel_matches_sequential(self):
+        models_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
+        input_path = tempfile.mkdtemp(prefix='nestml')
+        for model_name in ['iaf_psc_delta', 'iaf_psc_exp', 'izhikevich']:
+            shutil.copy(os.path.join(models_path, model_name + '.nestml'), input_path)
+        sequential_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'sequential')
+        parallel_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'parallel')
+        to_nest(input_path=input_path, target_path=sequential_path, module_name='xyzzymodule', store_log=True)
+        to_nest(input_path=input_path, target_path=parallel_path, module_name='xyzzymodule', store_log=True, jobs=2)
+
+        self.assert_same_code(sequential_path, parallel_path)
+        # the messages are logged in the same order
+        logs = list()
+        for target_path in [sequential_path, parallel_path]:
+            with open(os.path.join(target_path, '..', 'report', 'log.txt')) as f:
+                logs.append(json.loads(f.read().replace(target_path, '')))
+        self.assertEqual(logs[0], logs[1])
+
+    def test_codegeneration_with_cache_matches_without_cache(self):
+        models_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
+        input_path = tempfile.mkdtemp(prefix='nestml')
+        # iaf_cond_alpha is solved numerically, iaf_psc_exp analytically by ode-toolbox
+        for model_name in ['iaf_cond_alpha', 'iaf_cond_exp', 'iaf_psc_exp', 'izhikevich']:
+            shutil.copy(os.path.join(models_path, model_name + '.nestml'), input_path)
+        cache_path = tempfile.mkdtemp(prefix='nestml')
+        uncached_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'uncached')
+        cached_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'cached')
+        to_nest(input_path=input_path, target_path=uncached_path, module_name='xyzzymodule', no_cache=True)
+        # the first run fills the cache, the second one uses the cached models
+        for i in range(2):
+            to_nest(input_path=input_path, target_path=cached_path, module_name='xyzzymodule', cache_path=cache_path)
+            self.assertTrue(len(os.listdir(cache_path)) > 0)
+            self.assert_same_code(uncached_path, cached_path)
+        self.assertTrue(len(os.listdir(os.path.join(cache_path, 'ode_toolbox'))) > 0)
+        self.assertTrue(len(os.listdir(os.path.join(cache_path, 'templates'))) > 0)
+
+    def test_codegeneration_only_touches_changed_files(self):
+        models_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
+        input_path = tempfile.mkdtemp(prefix='nestml')
+        for model_name in ['iaf_psc_exp', 'izhikevich']:
+            shutil.copy(os.path.join(models_path, model_name + '.nestml'), input_path)
+        target_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'target')
+
+        def get_modification_times():
+            times = dict()
+            for dirpath, dirnames, filenames in os.walk(target_path):
+                for filename in filenames:
+                    times[os.path.relpath(os.path.join(dirpath, filename), target_path)] = \
+                        os.stat(os.path.join(dirpath, filename)).st_mtime_ns
+            return times
+
+        to_nest(input_path=input_path, target_path=target_path, module_name='xyzzymodule')
+        initial_times = get_modification_times()
+        self.assertIn('izhikevich.cpp', initial_times)
+        # nothing has changed, thus no file is written again
+        to_nest(input_path=input_path, target_path=target_path, module_name='xyzzymodule')
+        self.assertEqual(initial_times, get_modification_times())
+
+        # only the files of the changed neuron are written again
+        with open(os.path.join(input_path, 'izhikevich.nestml')) as f:
+            model = f.read()
+        with open(os.path.join(input_path, 'izhikevich.nestml'), 'w') as f:
+            f.write(model.replace('a real = 0.02', 'a real = 0.03'))
+        to_nest(input_path=input_path, target_path=target_path, module_name='xyzzymodule')
+        changed = [name for (name, time) in get_modification_times().items() if initial_times.get(name) != time]
+        self.assertEqual(sorted(changed), ['izhikevich.cpp', 'izhikevich.h', 'nestml_manifest.json'])
+        with open(os.path.join(target_path, 'izhikevich.cpp')) as f:
+            self.assertIn('0.03', f.read())
+
+    def test_profile_report(self):
+        models_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
+        target_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'target')
+        to_nest(input_path=os.path.join(models_path, 'iaf_psc_exp.nestml'), target_path=target_path,
+                module_name='xyzzymodule', no_cache=True, profile=True)
+        with open(os.path.join(target_path, '..', 'report', 'profile.json')) as f:
+            report = json.load(f)
+        phases = {(phase['phase'], phase['artifact']) for phase in report['phases']}
+        for phase in [('lexer', 'iaf_psc_exp.nestml'), ('parser', 'iaf_psc_exp.nestml'),
+                      ('symbol_table', 'iaf_psc_exp'), ('cocos.check_expression_correct', 'iaf_psc_exp'),
+                      ('analyse_neuron', 'iaf_psc_exp'), ('odetoolbox', 'iaf_psc_exp'),
+                      ('render_neuron', 'iaf_psc_exp'), ('render_module', 'xyzzymodule')]:
+            self.assertIn(phase, phases)
+        self.assertIn('iaf_psc_exp', [artifact['artifact'] for artifact in report['artifacts']])
+
+    def test_profiler_is_disabled_if_processing_fails(self):
+        models_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
+        target_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'target')
+        with patch('pynestml.utils.model_parser.ModelParser.parse_model', side_effect=RuntimeError('failure')):
+            with pytest.raises(RuntimeError):
+                to_nest(input_path=os.path.join(models_path, 'iaf_psc_exp.nestml'), target_path=target_path,
+                        module_name='xyzzymodule', no_cache=True, profile=True)
+        self.assertFalse(Profiler.enabled)
+        self.assertTrue(os.path.isfile(os.path.join(target_path, '..', 'report', 'profile.json')))
+
+    def assert_same_code(self, expected_path, actual_path):
+        # the generated files only differ in the time of generation, the manifest contains hashes of the files
+        timestamp = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d+')
+        for dirpath, dirnames, filenames in os.walk(expected_path):
+            for filename in filenames:
+                if filename == BuildManifest.FILE_NAME:
+                    continue
+                with open(os.path.join(dirpath, filename)) as f:
+                    expected_code = timestamp.sub('', f.read())
+                with open(os.path.join(actual_path, os.path.relpath(dirpath, expected_path), filename)) as f:
+                    actual_code = timestamp.sub('', f.read())
+                self.assertEqual(expected_code, actual_code)
+
     def test_module_name_parsing_right_module_name_specified(self):
         path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
 
@@ -124,5 +237,79 @@ class PyNestMLFrontendTest(unittest.TestCase):
         shutil.rmtree(FrontendConfiguration.target_path)
 
 
+class PyNestMLFrontendInterpreterTest(unittest.TestCase):
+    """
+    Tests of the frontend which run in fresh interpreters.
+    """
+
+    def test_reproducible_codegeneration_for_all_models(self):
+        path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
+        target_paths = [os.path.join(tempfile.mkdtemp(prefix='nestml'), 'target') for i in range(2)]
+        # run in fresh interpreters with different hash seeds, such that the iteration order of sets differs
+        code = 'import sys; from pynestml.frontend.pynestml_frontend import main; sys.exit(main())'
+        exit_codes = list()
+        for hash_seed, target_path in zip(['1', '2'], target_paths):
+            env = dict(os.environ)
+            env['PYTHONHASHSEED'] = hash_seed
+            env['PYTHONPATH'] = os.pathsep.join([os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))] +
+                                                [p for p in [env.get('PYTHONPATH')] if p])
+            params = ['--input_path', path, '--target_path', target_path, '--dev', '--reproducible', '--no_cache',
+                      '--jobs', str(os.cpu_count() or 1)]
+            exit_codes.append(subprocess.call([sys.executable, '-c', code] + params, env=env,
+                                              stdout=subprocess.DEVNULL))
+        self.assertEqual(exit_codes[0], exit_codes[1])
+
+        # both runs result in exactly the same files
+        generated_files = list()
+        for target_path in target_paths:
+            generated_files.append(sorted(os.path.relpath(os.path.join(dirpath, filename), target_path)
+                                          for (dirpath, dirnames, filenames) in os.walk(target_path)
+                                          for filename in filenames))
+        self.assertEqual(generated_files[0], generated_files[1])
+        self.assertIn('CMakeLists.txt', generated_files[0])
+        for filename in generated_files[0]:
+            with open(os.path.join(target_paths[0], filename), 'rb') as f:
+                first_code = f.read()
+            with open(os.path.join(target_paths[1], filename), 'rb') as f:
+                second_code = f.read()
+            self.assertEqual(first_code, second_code, filename)
+
+    def test_output_in_parallel_matches_sequential(self):
+        models_path = str(os.path.realpath(os.path.join(os.path.dirname(__file__), os.path.join('..', 'models'))))
+        input_path = tempfile.mkdtemp(prefix='nestml')
+        for model_name in ['iaf_psc_alpha', 'iaf_psc_exp', 'izhikevich']:
+            shutil.copy(os.path.join(models_path, model_name + '.nestml'), input_path)
+        # run in fresh interpreters, since ode-toolbox prints warnings when it is imported
+        code = 'import sys; from pynestml.frontend.pynestml_frontend import main; sys.exit(main())'
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))] +
+                                            [p for p in [env.get('PYTHONPATH')] if p])
+        outputs = list()
+        logs = list()
+        for jobs in ['1', '2']:
+            target_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'target')
+            params = ['--input_path', input_path, '--target_path', target_path, '--module_name', 'xyzzymodule',
+                      '--logging_level', 'INFO', '--store_log', '--no_cache', '--jobs', jobs]
+            output = subprocess.check_output([sys.executable, '-c', code] + params, env=env, universal_newlines=True)
+            outputs.append(output.replace(target_path, ''))
+            with open(os.path.join(target_path, '..', 'report', 'log.txt')) as f:
+                logs.append(f.read().replace(target_path, ''))
+        # the messages of the derived types and the output of ode-toolbox are printed once and in the same order
+        self.assertIn("New type registered 'mV / s'", outputs[0])
+        self.assertIn('I_shape_in is a linear homogeneous ODE', outputs[0])
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(logs[0], logs[1])
+
+    def test_frontend_import_does_not_load_heavy_dependencies(self):
+        # run in a fresh interpreter, since the modules have already been imported by the other tests
+        code = 'import sys; import pynestml.frontend.pynestml_frontend; ' \
+               'print(" ".join(m for m in ["astropy", "sympy", "odetoolbox"] if m in sys.modules))'
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))] +
+                                            [p for p in [env.get('PYTHONPATH')] if p])
+        output = subprocess.check_output([sys.executable, '-c', code], env=env, universal_newlines=True)
+        self.assertEqual(output.strip(), '')
+
+
 if __name__ == '__main__':
     unittest.main()
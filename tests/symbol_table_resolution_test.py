@@ -21,13 +21,14 @@ import os
 import unittest
 
 from pynestml.utils.ast_source_location import ASTSourceLocation
-from pynestml.symbol_table.scope import ScopeType
+from pynestml.symbol_table.scope import Scope, ScopeType
 from pynestml.symbol_table.symbol_table import SymbolTable
 from pynestml.symbols.predefined_functions import PredefinedFunctions
 from pynestml.symbols.predefined_types import PredefinedTypes
 from pynestml.symbols.predefined_units import PredefinedUnits
 from pynestml.symbols.predefined_variables import PredefinedVariables
 from pynestml.symbols.symbol import SymbolKind
+from pynestml.symbols.variable_symbol import VariableSymbol
 from pynestml.utils.logger import Logger, LoggingLevel
 from pynestml.utils.model_parser import ModelParser
 
@@ -65,6 +66,31 @@ class SymbolTableResolutionTest(unittest.TestCase):
         res7 = scope.resolve_to_all_scopes('test6', SymbolKind.VARIABLE)
         self.assertTrue(res7 is not None and res7.get_scope_type() == ScopeType.UPDATE)
 
+    def test_resolution_after_adding_and_deleting_symbols(self):
+        global_scope = Scope(ScopeType.GLOBAL)
+        update_scope = Scope(ScopeType.UPDATE, enclosing_scope=global_scope)
+        global_scope.add_scope(update_scope)
+        outer = VariableSymbol(name='V_m', scope=global_scope)
+        inner = VariableSymbol(name='V_m', scope=update_scope)
+        global_scope.add_symbol(outer)
+        update_scope.add_symbol(inner)
+        self.assertIs(update_scope.resolve_to_symbol('V_m', SymbolKind.VARIABLE), inner)
+        self.assertIs(update_scope.resolve_to_scope('V_m', SymbolKind.VARIABLE), update_scope)
+        self.assertIs(global_scope.resolve_to_symbol('V_m', SymbolKind.VARIABLE), outer)
+        self.assertIsNone(update_scope.resolve_to_symbol('V_m', SymbolKind.FUNCTION))
+        self.assertEqual(update_scope.resolve_to_all_symbols('V_m', SymbolKind.VARIABLE), [outer, inner])
+        self.assertEqual(update_scope.resolve_to_all_scopes('V_m', SymbolKind.VARIABLE), [global_scope, update_scope])
+        # resolution falls back to the enclosing scope once the symbol of the inner scope has been deleted
+        self.assertTrue(update_scope.delete_symbol(inner))
+        self.assertIs(update_scope.resolve_to_symbol('V_m', SymbolKind.VARIABLE), outer)
+        self.assertIs(update_scope.resolve_to_scope('V_m', SymbolKind.VARIABLE), global_scope)
+        updated = VariableSymbol(name='V_m', scope=global_scope)
+        global_scope.update_variable_symbol(updated)
+        self.assertIs(update_scope.resolve_to_symbol('V_m', SymbolKind.VARIABLE), updated)
+        self.assertEqual(global_scope.get_symbols_in_this_scope(), [updated])
+        self.assertTrue(global_scope.delete_scope(update_scope))
+        self.assertIs(global_scope.resolve_to_all_symbols('V_m', SymbolKind.VARIABLE), updated)
+
 
 if __name__ == '__main__':
     unittest.main()
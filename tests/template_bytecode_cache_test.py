@@ -0,0 +1,79 @@
+#
+# template_bytecode_cache_test.py
+#
+# This file is part of NEST.
+#
+# Copyright (C) 2004 The NEST Initiative
+#
+# NEST is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 2 of the License, or
+# (at your option) any later version.
+#
+# NEST is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with NEST.  If not, see <http://www.gnu.org/licenses/>.
+import os
+import shutil
+import tempfile
+import unittest
+
+from jinja2 import Environment, FileSystemLoader
+
+from pynestml.codegeneration.codegenerator import CodeGenerator
+from pynestml.codegeneration.nest_codegenerator import NESTCodeGenerator
+from pynestml.codegeneration.template_bytecode_cache import TemplateBytecodeCache
+
+
+class TemplateBytecodeCacheTest(unittest.TestCase):
+    """
+    Tests if compiled templates are stored across runs and template environments are shared by code generators.
+    """
+
+    def setUp(self):
+        self.templates_path = tempfile.mkdtemp(prefix='nestml')
+        self.cache_path = os.path.join(tempfile.mkdtemp(prefix='nestml'), 'templates')
+        with open(os.path.join(self.templates_path, 'neuron.jinja2'), 'w') as f:
+            f.write('{{ neuronName }}')
+
+    def tearDown(self):
+        CodeGenerator.template_bytecode_cache = None
+        shutil.rmtree(self.templates_path, ignore_errors=True)
+        shutil.rmtree(os.path.dirname(self.cache_path), ignore_errors=True)
+
+    def render(self, neuron_name='iaf_psc_exp'):
+        # a new environment does not hold any templates in memory, thus the template is loaded as in a new process
+        env = Environment(loader=FileSystemLoader(self.templates_path),
+                          bytecode_cache=TemplateBytecodeCache(self.cache_path))
+        return env.get_template('neuron.jinja2').render(neuronName=neuron_name)
+
+    def test_compiled_templates_are_reused(self):
+        self.assertEqual(self.render(), 'iaf_psc_exp')
+        cache_files = os.listdir(self.cache_path)
+        self.assertEqual(len(cache_files), 1)
+        # broken bytecode is ignored and replaced
+        with open(os.path.join(self.cache_path, cache_files[0]), 'wb') as f:
+            f.write(b'broken')
+        self.assertEqual(self.render(), 'iaf_psc_exp')
+        self.assertEqual(self.render('izhikevich'), 'izhikevich')
+
+    def test_modified_templates_are_compiled_again(self):
+        self.render()
+        with open(os.path.join(self.templates_path, 'neuron.jinja2'), 'w') as f:
+            f.write('{{ neuronName }}_nestml')
+        self.assertEqual(self.render(), 'iaf_psc_exp_nestml')
+
+    def test_environments_are_shared(self):
+        first = NESTCodeGenerator()
+        self.assertIs(NESTCodeGenerator()._template_neuron_h_file, first._template_neuron_h_file)
+        CodeGenerator.template_bytecode_cache = TemplateBytecodeCache(self.cache_path)
+        NESTCodeGenerator()
+        self.assertTrue(len(os.listdir(self.cache_path)) > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()